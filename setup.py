@@ -0,0 +1,32 @@
+"""
+Optional native build of the hot parser modules.
+
+Project metadata lives in pyproject.toml. This shim only exists so the
+markdown parsers can be compiled ahead-of-time with mypyc when requested:
+
+    OBSIDIAN_EXPORTER_MYPYC=1 pip install --no-build-isolation .
+
+mypy must be installed in the build environment (it is part of the ``dev``
+extra). Without the environment variable a regular pure-Python build is
+produced and the compiled and interpreted modules behave identically.
+"""
+
+import os
+
+from setuptools import setup
+
+# Parsers are small, string-heavy and called per note, which is where mypyc's
+# removal of bytecode dispatch pays off. Numba is not an option (no str support).
+MYPYC_MODULES = [
+    "src/infrastructure/parsers/block_reference_parser.py",
+    "src/infrastructure/parsers/callout_parser.py",
+    "src/infrastructure/parsers/wikilink_parser.py",
+]
+
+ext_modules = []
+if os.environ.get("OBSIDIAN_EXPORTER_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(MYPYC_MODULES, opt_level="3")
+
+setup(ext_modules=ext_modules)
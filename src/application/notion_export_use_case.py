@@ -8,17 +8,28 @@ CRITICAL: Must produce exact Notion ZIP format that AppFlowy web import accepts.
 """
 
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from multiprocessing.context import BaseContext
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..domain.content_transformer import ContentTransformer
-from ..domain.models import NotionPackage, VaultStructure
+from ..domain.models import (
+    NotionPackage,
+    TransformedContent,
+    VaultIndex,
+    VaultStructure,
+)
 from ..domain.notion_document_generator import NotionDocumentGenerator
 from ..domain.vault_analyzer import VaultAnalyzer
 from ..domain.vault_index_builder import VaultIndexBuilder
+from ..domain.wikilink_resolver import WikiLinkResolver
 from ..infrastructure.file_system import FileSystemAdapter
 from ..infrastructure.generators.notion_package_generator import NotionPackageGenerator
+from ..infrastructure.parsers.block_reference_parser import BlockReferenceParser
+from ..infrastructure.parsers.callout_parser import CalloutParser
+from ..infrastructure.parsers.wikilink_parser import WikiLinkParser
 
 
 @dataclass
@@ -30,6 +41,10 @@ class NotionExportConfig:
     package_name: str
     progress_callback: Optional[Callable[[str], None]] = None
     validate_only: bool = False
+    # Processes used to transform markdown files; 1 transforms in-process
+    workers: int = 1
+    # Start method context for the worker pool; None uses the platform default
+    mp_context: Optional[BaseContext] = None
 
 
 @dataclass
@@ -47,6 +62,57 @@ class NotionExportResult:
     vault_info: Optional[Dict[str, Any]] = None
 
 
+# Per-process state for parallel transforms, set by _init_transform_worker
+_worker_transformer: Optional[ContentTransformer] = None
+_worker_vault_index: Optional[VaultIndex] = None
+
+
+def build_content_transformer() -> ContentTransformer:
+    """
+    Build a content transformer wired with the default parsers.
+
+    Module-level so it can be handed to pool workers: under the spawn and
+    forkserver start methods initializer arguments are pickled, and the
+    parsers themselves are not picklable.
+    """
+    return ContentTransformer(
+        wikilink_parser=WikiLinkParser(),
+        wikilink_resolver=WikiLinkResolver(),
+        callout_parser=CalloutParser(),
+        block_reference_parser=BlockReferenceParser(),
+    )
+
+
+def _init_transform_worker(
+    transformer_factory: Callable[[], ContentTransformer], vault_index: VaultIndex
+) -> None:
+    """Build the transformer and install the vault index for a worker's tasks."""
+    global _worker_transformer, _worker_vault_index
+    _worker_transformer = transformer_factory()
+    _worker_vault_index = vault_index
+
+
+def _transform_in_worker(
+    item: Tuple[Path, str],
+) -> Tuple[Optional[TransformedContent], Optional[str]]:
+    """
+    Transform one file inside a pool worker.
+
+    Returns:
+        The transformed content, or None and the error message, so one bad
+        file does not abort the whole map
+    """
+    md_file, markdown_content = item
+    assert _worker_transformer is not None and _worker_vault_index is not None
+    try:
+        transformed = _worker_transformer.transform_content(
+            md_file, markdown_content, _worker_vault_index
+        )
+    except Exception as e:
+        return None, str(e)
+    return transformed, None
+
+
 class NotionExportUseCase:
     """
     Application service orchestrating complete vault-to-Notion export.
@@ -65,6 +131,9 @@ class NotionExportUseCase:
         notion_document_generator: NotionDocumentGenerator,
         notion_package_generator: NotionPackageGenerator,
         file_system: FileSystemAdapter,
+        transformer_factory: Callable[[], ContentTransformer] = (
+            build_content_transformer
+        ),
     ):
         """
         Initialize use case with injected dependencies.
@@ -76,6 +145,9 @@ class NotionExportUseCase:
             notion_document_generator: Domain service for Notion format generation
             notion_package_generator: Infrastructure service for ZIP creation
             file_system: Infrastructure adapter for file operations
+            transformer_factory: Picklable callable (e.g. a module-level
+                function) building the transformer used in worker processes
+                when config.workers > 1; it should match content_transformer
         """
         self._vault_analyzer = vault_analyzer
         self._vault_index_builder = vault_index_builder
@@ -83,6 +155,7 @@ class NotionExportUseCase:
         self._notion_document_generator = notion_document_generator
         self._notion_package_generator = notion_package_generator
         self._file_system = file_system
+        self._transformer_factory = transformer_factory
 
     def export(self, config: NotionExportConfig) -> NotionExportResult:
         """
@@ -109,24 +182,9 @@ class NotionExportUseCase:
 
             # Stage 3: Transform content for each file
             self._report_progress(config, "Transforming content...")
-            transformed_contents = []
-
-            for md_file in vault_structure.markdown_files:
-                try:
-                    # Read file content
-                    markdown_content = self._file_system.read_file_content(md_file)
-
-                    # Transform content
-                    transformed = self._content_transformer.transform_content(
-                        md_file, markdown_content, vault_index
-                    )
-                    transformed_contents.append(transformed)
-                    result.warnings.extend(transformed.warnings)
-
-                except Exception as e:
-                    error_msg = f"Failed to transform {md_file.name}: {str(e)}"
-                    result.errors.append(error_msg)
-                    continue
+            transformed_contents = self._transform_files(
+                config, vault_structure.markdown_files, vault_index, result
+            )
 
             result.files_processed = len(transformed_contents)
 
@@ -188,6 +246,75 @@ class NotionExportUseCase:
 
         return result
 
+    def _transform_files(
+        self,
+        config: NotionExportConfig,
+        markdown_files: List[Path],
+        vault_index: VaultIndex,
+        result: NotionExportResult,
+    ) -> List[TransformedContent]:
+        """
+        Read and transform every markdown file, in vault order.
+
+        With config.workers > 1 files are still read here, but transformed in
+        a process pool; each worker builds its transformer from the factory
+        and receives the vault index once rather than with every file.
+
+        Args:
+            config: Export configuration selecting the worker count
+            markdown_files: Markdown files to transform
+            vault_index: Vault index for wikilink resolution
+            result: Result collecting per-file warnings and errors
+
+        Returns:
+            Transformed contents of the files that succeeded
+        """
+        transformed_contents = []
+
+        if config.workers <= 1:
+            for md_file in markdown_files:
+                try:
+                    # Read file content
+                    markdown_content = self._file_system.read_file_content(md_file)
+
+                    # Transform content
+                    transformed = self._content_transformer.transform_content(
+                        md_file, markdown_content, vault_index
+                    )
+                    transformed_contents.append(transformed)
+                    result.warnings.extend(transformed.warnings)
+
+                except Exception as e:
+                    error_msg = f"Failed to transform {md_file.name}: {str(e)}"
+                    result.errors.append(error_msg)
+                    continue
+
+            return transformed_contents
+
+        inputs = []
+        for md_file in markdown_files:
+            try:
+                inputs.append((md_file, self._file_system.read_file_content(md_file)))
+            except Exception as e:
+                result.errors.append(f"Failed to transform {md_file.name}: {str(e)}")
+
+        chunksize = max(1, len(inputs) // config.workers // 4)
+        with ProcessPoolExecutor(
+            max_workers=config.workers,
+            mp_context=config.mp_context,
+            initializer=_init_transform_worker,
+            initargs=(self._transformer_factory, vault_index),
+        ) as executor:
+            outcomes = executor.map(_transform_in_worker, inputs, chunksize=chunksize)
+            for (md_file, _), (content, error) in zip(inputs, outcomes):
+                if content is None:
+                    result.errors.append(f"Failed to transform {md_file.name}: {error}")
+                    continue
+                transformed_contents.append(content)
+                result.warnings.extend(content.warnings)
+
+        return transformed_contents
+
     def validate(self, vault_path: Path) -> NotionExportResult:
         """
         Validate vault can be exported to Notion format without creating package.
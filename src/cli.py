@@ -5,44 +5,47 @@ This module provides the command-line interface for converting Obsidian vaults
 to AppFlowy-importable ZIP packages with progress reporting and validation.
 """
 
+import os
 from pathlib import Path
-from typing import Any, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
 import click
 
-from .application.export_use_case import ExportConfig, ExportUseCase
-from .application.notion_export_use_case import NotionExportConfig, NotionExportUseCase
-from .application.outline_export_use_case import (
-    OutlineExportConfig,
-    OutlineExportUseCase,
-)
-from .domain.appflowy_document_generator import AppFlowyDocumentGenerator
-from .domain.content_transformer import ContentTransformer
-from .domain.notion_document_generator import NotionDocumentGenerator
-from .domain.outline_document_generator import OutlineDocumentGenerator
-from .domain.vault_analyzer import VaultAnalyzer
-from .domain.vault_index_builder import VaultIndexBuilder
-from .domain.wikilink_resolver import WikiLinkResolver
-from .infrastructure.file_system import FileSystemAdapter
-from .infrastructure.generators.appflowy_package_generator import (
-    AppFlowyPackageGenerator,
-)
-from .infrastructure.generators.notion_package_generator import NotionPackageGenerator
-from .infrastructure.generators.outline_package_generator import OutlinePackageGenerator
-from .infrastructure.parsers.block_reference_parser import BlockReferenceParser
-from .infrastructure.parsers.callout_parser import CalloutParser
-from .infrastructure.parsers.wikilink_parser import WikiLinkParser
+# The use cases pull in the parsers, generators and their dependencies
+# (markdown, yaml, ...), which dominate start-up time. They are imported
+# when a command actually runs, so --help and argument errors stay fast.
+if TYPE_CHECKING:
+    from .application.export_use_case import ExportUseCase
+    from .application.notion_export_use_case import NotionExportUseCase
+    from .application.outline_export_use_case import OutlineExportUseCase
 
+# Threads walking a vault's top-level folders concurrently
+_SCAN_WORKERS = 4
 
-def create_export_use_case() -> ExportUseCase:
+
+def create_export_use_case() -> "ExportUseCase":
     """
     Create export use case with all dependencies wired.
 
     Returns:
         Configured ExportUseCase with dependency injection
     """
+    from .application.export_use_case import ExportUseCase
+    from .domain.appflowy_document_generator import AppFlowyDocumentGenerator
+    from .domain.content_transformer import ContentTransformer
+    from .domain.vault_analyzer import VaultAnalyzer
+    from .domain.vault_index_builder import VaultIndexBuilder
+    from .domain.wikilink_resolver import WikiLinkResolver
+    from .infrastructure.file_system import FileSystemAdapter
+    from .infrastructure.generators.appflowy_package_generator import (
+        AppFlowyPackageGenerator,
+    )
+    from .infrastructure.parsers.block_reference_parser import BlockReferenceParser
+    from .infrastructure.parsers.callout_parser import CalloutParser
+    from .infrastructure.parsers.wikilink_parser import WikiLinkParser
+
     # Infrastructure adapters
-    file_system = FileSystemAdapter()
+    file_system = FileSystemAdapter(prune_hidden_dirs=True, scan_workers=_SCAN_WORKERS)
     wikilink_parser = WikiLinkParser()
     callout_parser = CalloutParser()
     block_reference_parser = BlockReferenceParser()
@@ -72,15 +75,29 @@ def create_export_use_case() -> ExportUseCase:
     )
 
 
-def create_notion_export_use_case() -> NotionExportUseCase:
+def create_notion_export_use_case() -> "NotionExportUseCase":
     """
     Create Notion export use case with all dependencies wired.
 
     Returns:
         Configured NotionExportUseCase with dependency injection
     """
+    from .application.notion_export_use_case import NotionExportUseCase
+    from .domain.content_transformer import ContentTransformer
+    from .domain.notion_document_generator import NotionDocumentGenerator
+    from .domain.vault_analyzer import VaultAnalyzer
+    from .domain.vault_index_builder import VaultIndexBuilder
+    from .domain.wikilink_resolver import WikiLinkResolver
+    from .infrastructure.file_system import FileSystemAdapter
+    from .infrastructure.generators.notion_package_generator import (
+        NotionPackageGenerator,
+    )
+    from .infrastructure.parsers.block_reference_parser import BlockReferenceParser
+    from .infrastructure.parsers.callout_parser import CalloutParser
+    from .infrastructure.parsers.wikilink_parser import WikiLinkParser
+
     # Infrastructure adapters
-    file_system = FileSystemAdapter()
+    file_system = FileSystemAdapter(prune_hidden_dirs=True, scan_workers=_SCAN_WORKERS)
     wikilink_parser = WikiLinkParser()
     callout_parser = CalloutParser()
     block_reference_parser = BlockReferenceParser()
@@ -110,15 +127,29 @@ def create_notion_export_use_case() -> NotionExportUseCase:
     )
 
 
-def create_outline_export_use_case() -> OutlineExportUseCase:
+def create_outline_export_use_case() -> "OutlineExportUseCase":
     """
     Create outline export use case with all dependencies wired.
 
     Returns:
         Configured OutlineExportUseCase with dependency injection
     """
+    from .application.outline_export_use_case import OutlineExportUseCase
+    from .domain.content_transformer import ContentTransformer
+    from .domain.outline_document_generator import OutlineDocumentGenerator
+    from .domain.vault_analyzer import VaultAnalyzer
+    from .domain.vault_index_builder import VaultIndexBuilder
+    from .domain.wikilink_resolver import WikiLinkResolver
+    from .infrastructure.file_system import FileSystemAdapter
+    from .infrastructure.generators.outline_package_generator import (
+        OutlinePackageGenerator,
+    )
+    from .infrastructure.parsers.block_reference_parser import BlockReferenceParser
+    from .infrastructure.parsers.callout_parser import CalloutParser
+    from .infrastructure.parsers.wikilink_parser import WikiLinkParser
+
     # Infrastructure adapters
-    file_system = FileSystemAdapter()
+    file_system = FileSystemAdapter(prune_hidden_dirs=True, scan_workers=_SCAN_WORKERS)
     wikilink_parser = WikiLinkParser()
     callout_parser = CalloutParser()
     block_reference_parser = BlockReferenceParser()
@@ -171,7 +202,7 @@ def cli() -> None:
 @click.option(
     "--output",
     "-o",
-    type=click.Path(path_type=Path),
+    type=click.Path(dir_okay=False, path_type=Path),
     help="Output path for the generated ZIP package",
 )
 @click.option(
@@ -226,14 +257,54 @@ def convert_command(
         obsidian-to-appflowy convert /path/to/vault --validate-only --format outline
         obsidian-to-appflowy convert /path/to/vault --format outline --nested-documents
     """
+    exit_code = run_convert(
+        vault_path,
+        output=output,
+        name=name,
+        verbose=verbose,
+        validate_only=validate_only,
+        format=format,
+        nested_documents=nested_documents,
+    )
+    if exit_code != 0:
+        raise click.Abort()
+
+
+def run_convert(
+    vault_path: Path,
+    output: Optional[Path] = None,
+    name: Optional[str] = None,
+    verbose: bool = False,
+    validate_only: bool = False,
+    format: str = "appflowy",
+    nested_documents: bool = False,
+) -> int:
+    """
+    Run a conversion (or validation) in-process, without Click's argv parsing.
+
+    Takes the same values as the convert command's arguments and options and
+    echoes the same output.
+
+    Args:
+        vault_path: Path to the Obsidian vault directory
+        output: Output path for the package; derived from the vault if None
+        name: Package name; defaults to the vault directory name
+        verbose: Whether to echo progress messages
+        validate_only: Only validate the vault without creating a package
+        format: Export format: 'appflowy', 'notion', or 'outline'
+        nested_documents: For Outline exports, nest folders as documents
+
+    Returns:
+        Process exit code: 0 on success, 1 on failure
+    """
     # Validate inputs
     if not vault_path.exists():
         click.echo(f"Error: Vault path '{vault_path}' does not exist.", err=True)
-        raise click.Abort()
+        return 1
 
     if not vault_path.is_dir():
         click.echo(f"Error: Vault path '{vault_path}' is not a directory.", err=True)
-        raise click.Abort()
+        return 1
 
     # Set defaults
     if not name:
@@ -241,8 +312,8 @@ def convert_command(
 
     if not output:
         if validate_only:
-            # For validation, we don't need an actual output path
-            output = Path("/tmp/validation-only")
+            # Validation never writes a package; the config only needs a path
+            output = Path(os.devnull)
         else:
             if format.lower() == "notion":
                 format_suffix = "notion"
@@ -263,6 +334,16 @@ def convert_command(
         def progress_callback(message: str) -> None:
             click.echo(f"  {message}")
 
+    from .application.export_use_case import ExportConfig, ExportUseCase
+    from .application.notion_export_use_case import (
+        NotionExportConfig,
+        NotionExportUseCase,
+    )
+    from .application.outline_export_use_case import (
+        OutlineExportConfig,
+        OutlineExportUseCase,
+    )
+
     try:
         # Create use case based on format choice
         use_case: Union[ExportUseCase, NotionExportUseCase, OutlineExportUseCase]
@@ -324,13 +405,12 @@ def convert_command(
             _display_conversion_results(result)
 
         # Exit with appropriate code
-        if not result.success:
-            raise click.Abort()
+        return 0 if result.success else 1
 
     except Exception as e:
         mode = "validation" if validate_only else "conversion"
         click.echo(f"Error during {mode}: {str(e)}", err=True)
-        raise click.Abort() from e
+        return 1
 
 
 def _display_validation_results(result: Any) -> None:
@@ -427,7 +507,7 @@ def _display_conversion_results(result: Any) -> None:
 
 
 # Make convert_command available for testing
-__all__ = ["cli", "convert_command", "create_export_use_case"]
+__all__ = ["cli", "convert_command", "create_export_use_case", "run_convert"]
 
 
 if __name__ == "__main__":
@@ -6,8 +6,9 @@ hexagonal architecture principles with immutable data classes.
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 from ..infrastructure.parsers.wikilink_parser import WikiLink
 
@@ -80,7 +81,9 @@ class OutlinePackage:
 
     metadata: Dict[str, Any]  # Export metadata for metadata.json
     collections: List[Dict[str, Any]]  # Collection structures with document hierarchy
-    documents: Dict[str, Dict[str, Any]]  # Document data by ID
+    # Document data by ID; consumers only read it, so any mapping (e.g. a
+    # columnar or lazily-built store) can be supplied instead of a dict
+    documents: Mapping[str, Dict[str, Any]]
     attachments: Dict[str, Dict[str, Any]]  # Attachment data by ID
     warnings: List[str]
 
@@ -118,3 +121,8 @@ class VaultStructureWithFolders:
     folder_mapping: Dict[Path, FolderStructure]  # file -> folder mapping
     links: Dict[str, List[str]]
     metadata: Dict[str, Dict[str, Any]]
+
+    @cached_property
+    def path_to_folder(self) -> Dict[Path, FolderStructure]:
+        """Folder lookup by path, built once on first access."""
+        return {folder.path: folder for folder in self.all_folders}
@@ -6,10 +6,16 @@ following hexagonal architecture with dependency injection.
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Protocol
+from typing import Dict, List, Optional, Protocol, Tuple
 
 from .models import FolderStructure, VaultStructure, VaultStructureWithFolders
 
+# Directory whose presence marks a folder as an Obsidian vault
+_OBSIDIAN_DIR = ".obsidian"
+
+# Lower-cased suffixes of files that are never assets; everything else is
+_NON_ASSET_SUFFIXES = frozenset({".md", _OBSIDIAN_DIR})
+
 
 class WikiLinkParserPort(Protocol):
     """Port interface for wikilink parsing operations."""
@@ -57,7 +63,7 @@ class VaultAnalyzer:
         Returns:
             True if the path contains a valid Obsidian vault, False otherwise
         """
-        obsidian_dir = vault_path / ".obsidian"
+        obsidian_dir = vault_path / _OBSIDIAN_DIR
         return self._file_system.directory_exists(obsidian_dir)
 
     def scan_vault(self, vault_path: Path) -> VaultStructure:
@@ -79,17 +85,29 @@ class VaultAnalyzer:
         if not self.is_valid_vault(vault_path):
             raise ValueError(f"Path {vault_path} is not a valid Obsidian vault")
 
+        vault_structure, _ = self._scan(vault_path)
+        return vault_structure
+
+    def _scan(self, vault_path: Path) -> Tuple[VaultStructure, List[Path]]:
+        """
+        Scan an already validated vault.
+
+        Returns:
+            The VaultStructure and the full "**/*.*" listing it was built
+            from, so folder analysis can reuse it instead of listing again
+        """
         # Discover markdown files
         all_files = self._file_system.list_files(vault_path, "**/*.md")
         markdown_files = [f for f in all_files if f.suffix.lower() == ".md"]
 
         # Discover asset files
         all_vault_files = self._file_system.list_files(vault_path, "**/*.*")
+        obsidian_prefix = str(vault_path / _OBSIDIAN_DIR)
         asset_files = [
             f
             for f in all_vault_files
-            if f.suffix.lower() not in [".md", ".obsidian"]
-            and not str(f).startswith(str(vault_path / ".obsidian"))
+            if f.suffix.lower() not in _NON_ASSET_SUFFIXES
+            and not str(f).startswith(obsidian_prefix)
         ]
 
         # Extract wikilinks from each markdown file
@@ -100,13 +118,14 @@ class VaultAnalyzer:
             file_targets = [link.target for link in file_wikilinks]
             links[md_file.name] = file_targets
 
-        return VaultStructure(
+        vault_structure = VaultStructure(
             path=vault_path,
             markdown_files=markdown_files,
             asset_files=asset_files,
             links=links,
             metadata={},  # Will be populated in later phase
         )
+        return vault_structure, all_vault_files
 
     def scan_vault_with_folders(self, vault_path: Path) -> VaultStructureWithFolders:
         """
@@ -127,29 +146,36 @@ class VaultAnalyzer:
             raise ValueError(f"Path {vault_path} is not a valid Obsidian vault")
 
         # Get original vault structure
-        vault_structure = self.scan_vault(vault_path)
+        vault_structure, all_vault_files = self._scan(vault_path)
 
-        # Analyze folder structure
+        # Analyze folder structure from the listing the scan already made
         folder_analyzer = FolderAnalyzer(file_system=self._file_system)
-        root_folder = folder_analyzer.analyze_folder_structure(vault_path)
+        root_folder = folder_analyzer.analyze_folder_structure(
+            vault_path, all_files=all_vault_files
+        )
 
-        # Collect all folders in flat list
+        # Collect all folders in flat list, parents before their children.
+        # An explicit stack instead of recursion keeps deep folder trees
+        # clear of the recursion limit and per-call frame overhead
         all_folders = []
-
-        def collect_folders(folder: FolderStructure) -> None:
+        stack = [root_folder]
+        while stack:
+            folder = stack.pop()
             all_folders.append(folder)
-            for child in folder.child_folders:
-                collect_folders(child)
-
-        collect_folders(root_folder)
-
-        # Build file to folder mapping
-        folder_mapping = {}
-        for md_file in vault_structure.markdown_files:
-            # Find which folder contains this file
-            containing_folder = self._find_containing_folder(md_file, all_folders)
-            if containing_folder:
-                folder_mapping[md_file] = containing_folder
+            # Reversed so children are visited in their listed order
+            stack.extend(reversed(folder.child_folders))
+
+        # Build file to folder mapping by inverting the per-folder file lists
+        # the tree already holds; files in no listed folder go to the root
+        folder_of_file = {
+            md_file: folder
+            for folder in all_folders
+            for md_file in folder.markdown_files
+        }
+        folder_mapping = {
+            md_file: folder_of_file.get(md_file, root_folder)
+            for md_file in vault_structure.markdown_files
+        }
 
         return VaultStructureWithFolders(
             path=vault_path,
@@ -162,20 +188,6 @@ class VaultAnalyzer:
             metadata=vault_structure.metadata,
         )
 
-    def _find_containing_folder(
-        self, file_path: Path, all_folders: List[FolderStructure]
-    ) -> Optional[FolderStructure]:
-        """Find which folder contains the given file."""
-        file_parent = file_path.parent
-
-        # Find folder with exact path match
-        for folder in all_folders:
-            if folder.path == file_parent:
-                return folder
-
-        # If no exact match, return root folder as fallback
-        return all_folders[0] if all_folders else None
-
 
 class FolderAnalyzer:
     """Domain service for analyzing folder structure in Obsidian vaults."""
@@ -184,22 +196,28 @@ class FolderAnalyzer:
         """Initialize with injected file system dependency."""
         self._file_system = file_system
 
-    def analyze_folder_structure(self, vault_path: Path) -> FolderStructure:
+    def analyze_folder_structure(
+        self, vault_path: Path, all_files: Optional[List[Path]] = None
+    ) -> FolderStructure:
         """
         Analyze the folder structure of an Obsidian vault.
 
         Args:
             vault_path: Path to the vault to analyze
+            all_files: The vault's "**/*.*" listing, if the caller already
+                has it; listed from the file system otherwise
 
         Returns:
             FolderStructure representing the complete folder hierarchy
         """
         # Get all files to understand folder structure
-        all_files = self._file_system.list_files(vault_path, "**/*.*")
+        if all_files is None:
+            all_files = self._file_system.list_files(vault_path, "**/*.*")
 
         # Filter out .obsidian directory files
+        obsidian_prefix = str(vault_path / _OBSIDIAN_DIR)
         filtered_files = [
-            f for f in all_files if not str(f).startswith(str(vault_path / ".obsidian"))
+            f for f in all_files if not str(f).startswith(obsidian_prefix)
         ]
 
         # Build folder hierarchy
@@ -209,42 +227,45 @@ class FolderAnalyzer:
         self, vault_path: Path, all_files: List[Path]
     ) -> FolderStructure:
         """Build hierarchical folder structure from file paths."""
-        # Collect all unique folder paths
-        folder_paths = set()
-        folder_paths.add(vault_path)  # Add root
+        # Collect all unique folder paths. Each folder keeps a single Path
+        # instance, shared as its children's parent_path, so parent/child
+        # comparisons short-circuit on identity
+        folder_paths: Dict[Path, Path] = {vault_path: vault_path}  # Add root
+        parent_of: Dict[Path, Path] = {}
 
         for file_path in all_files:
-            # Add all parent directories
+            # Add all parent directories, stopping at the first one already
+            # known: its ancestors up to the root were added along with it
             current = file_path.parent
             while (
-                current >= vault_path
+                current not in folder_paths and current >= vault_path
             ):  # Include vault_path and all its subdirectories
-                folder_paths.add(current)
-                if current == vault_path:
-                    break
-                current = current.parent
+                folder_paths[current] = current
+                parent = current.parent
+                parent_of[current] = folder_paths.get(parent, parent)
+                current = parent
+
+        # Group markdown files by their folder in one pass over the files
+        md_files_by_folder: Dict[Path, List[Path]] = {}
+        for file_path in all_files:
+            if file_path.suffix.lower() == ".md":
+                md_files_by_folder.setdefault(file_path.parent, []).append(file_path)
 
         # Sort by path depth for building hierarchy
         sorted_folders = sorted(folder_paths, key=lambda p: len(p.parts))
 
         # Build folder objects
         folder_objects = {}
+        root_depth = len(vault_path.parts)
         for folder_path in sorted_folders:
-            level = len(folder_path.relative_to(vault_path).parts)
-            if folder_path == vault_path:
-                level = 0
+            # Depth below the root, without a relative_to() Path per folder
+            level = len(folder_path.parts) - root_depth
 
-            # Find parent path
-            parent_path = None
-            if folder_path != vault_path:
-                parent_path = folder_path.parent
+            # Find parent path (None for the root)
+            parent_path = parent_of.get(folder_path)
 
             # Find markdown files in this specific folder (not subfolders)
-            folder_md_files = [
-                f
-                for f in all_files
-                if f.parent == folder_path and f.suffix.lower() == ".md"
-            ]
+            folder_md_files = md_files_by_folder.get(folder_path, [])
 
             folder_objects[folder_path] = FolderStructure(
                 path=folder_path,
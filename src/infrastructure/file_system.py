@@ -5,8 +5,13 @@ This infrastructure layer provides file system abstractions
 following hexagonal architecture principles.
 """
 
+import fnmatch
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Protocol
+from typing import Iterator, List, Optional, Protocol, Tuple
+
+_GLOB_MAGIC = frozenset("*?[")
 
 
 class FileSystemPort(Protocol):
@@ -32,20 +37,166 @@ class FileSystemPort(Protocol):
 class FileSystemAdapter:
     """Concrete file system adapter using pathlib."""
 
+    def __init__(self, prune_hidden_dirs: bool = False, scan_workers: int = 1) -> None:
+        """
+        Initialize the adapter's directory listing options.
+
+        Args:
+            prune_hidden_dirs: Leave dot-directories such as .obsidian, .git
+                and .trash out of recursive "**/<name>" listings, without
+                descending into them. Obsidian itself ignores them too.
+            scan_workers: Threads walking the top-level subdirectories of a
+                recursive listing concurrently; 1 walks them one by one.
+                Results keep the sequential order either way.
+        """
+        self._prune_hidden_dirs = prune_hidden_dirs
+        self._scan_workers = scan_workers
+
     def directory_exists(self, path: Path) -> bool:
         """Check if a directory exists at the given path."""
-        return path.exists() and path.is_dir()
+        return os.path.isdir(path)
 
     def file_exists(self, path: Path) -> bool:
         """Check if a file exists at the given path."""
-        return path.exists() and path.is_file()
+        return os.path.isfile(path)
 
     def list_files(self, path: Path, pattern: str = "*") -> list[Path]:
         """List files in a directory matching the given pattern."""
         if not self.directory_exists(path):
             return []
-        return list(path.glob(pattern))
+
+        # "**/<name pattern>": walk the tree with scandir, whose cached
+        # DirEntry type checks avoid a stat() per entry
+        name_pattern = _recursive_name_pattern(pattern)
+        if name_pattern is not None:
+            return list(self._iter_matching(path, name_pattern))
+
+        # Other recursive patterns need pathlib's glob machinery
+        if "/" in pattern or "**" in pattern:
+            return list(path.glob(pattern))
+
+        # Single-directory patterns: scandir avoids a stat() per entry
+        suffix = pattern[1:]
+        if pattern.startswith("*") and not _GLOB_MAGIC.intersection(suffix):
+            # Fast path for trivial suffix patterns like "*.md"
+            suffix = os.path.normcase(suffix)
+            with os.scandir(path) as entries:
+                return [
+                    Path(entry.path)
+                    for entry in entries
+                    if os.path.normcase(entry.name).endswith(suffix)
+                ]
+
+        with os.scandir(path) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if fnmatch.fnmatch(entry.name, pattern)
+            ]
 
     def read_file_content(self, path: Path) -> str:
         """Read the content of a file as a string."""
         return path.read_text(encoding="utf-8")
+
+    def _iter_matching(self, root: Path, name_pattern: str) -> Iterator[Path]:
+        """
+        Recursively yield entries under root whose name matches name_pattern.
+
+        Equivalent to root.glob("**/" + name_pattern): directories are visited
+        depth-first in scandir order, symlinked directories are matched but
+        not descended into, and unreadable directories are skipped.
+        """
+        # Only matching entries are turned into Path objects
+        if self._scan_workers > 1:
+            walk = _scandir_threaded(
+                os.fspath(root), self._prune_hidden_dirs, self._scan_workers
+            )
+        else:
+            walk = _scandir_recursive(os.fspath(root), self._prune_hidden_dirs)
+        for entry in walk:
+            if fnmatch.fnmatch(entry.name, name_pattern):
+                yield Path(entry.path)
+
+
+def _recursive_name_pattern(pattern: str) -> Optional[str]:
+    """Return <name> for a "**/<name>" pattern, or None for other patterns."""
+    name_pattern = pattern[3:]
+    if pattern.startswith("**/") and not ("/" in name_pattern or "**" in name_pattern):
+        return name_pattern
+    return None
+
+
+def _scandir_recursive(root: str, prune_hidden: bool = False) -> Iterator[os.DirEntry]:
+    """
+    Yield every entry below root, parents' entries before their subtrees.
+
+    Each directory is read with a single scandir call and closed before its
+    entries are yielded; see _read_directory for how entries are classified.
+    """
+    stack = [root]
+    while stack:
+        entries, subdirs = _read_directory(stack.pop(), prune_hidden)
+        yield from entries
+
+        # Reversed so the first subdirectory is visited next
+        stack.extend(reversed(subdirs))
+
+
+def _scandir_threaded(
+    root: str, prune_hidden: bool, workers: int
+) -> Iterator[os.DirEntry]:
+    """
+    Yield the same entries as _scandir_recursive, walking subtrees in threads.
+
+    Each top-level subdirectory is walked in a thread of its own: scandir
+    releases the GIL while it blocks on the file system, so the walks
+    overlap. Subtrees are yielded whole, in the sequential walk's order.
+    """
+    entries, subdirs = _read_directory(root, prune_hidden)
+    yield from entries
+    if not subdirs:
+        return
+
+    def walk_subtree(subdir: str) -> List[os.DirEntry]:
+        return list(_scandir_recursive(subdir, prune_hidden))
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(subdirs))) as executor:
+        for subtree in executor.map(walk_subtree, subdirs):
+            yield from subtree
+
+
+def _read_directory(
+    path: str, prune_hidden: bool
+) -> Tuple[List[os.DirEntry], List[str]]:
+    """
+    Read one directory, returning its listed entries and subdirectories.
+
+    Whether an entry is a subdirectory is decided by
+    entry.is_dir(follow_symlinks=False): on Linux and macOS scandir's
+    underlying getdents64/readdir already reports each entry's type (d_type),
+    so no stat() is made per entry. Only filesystems reporting DT_UNKNOWN
+    fall back to an lstat(). Symlinks are listed but never followed.
+    A directory that vanishes or cannot be read yields nothing, and with
+    prune_hidden directories whose name starts with "." are left out.
+    """
+    try:
+        with os.scandir(path) as it:
+            entry_list = list(it)
+    except OSError:
+        return [], []
+
+    entries = []
+    subdirs = []
+    for entry in entry_list:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            is_dir = False
+
+        if is_dir and prune_hidden and entry.name.startswith("."):
+            continue
+        entries.append(entry)
+        if is_dir:
+            subdirs.append(entry.path)
+
+    return entries, subdirs
@@ -8,9 +8,10 @@ CRITICAL: Must generate precise file structure without config.json or documents/
 directory - just markdown files directly in ZIP root with exact naming format.
 """
 
+import io
 import zipfile
 from pathlib import Path
-from typing import Set
+from typing import BinaryIO, Set, Union
 
 from ...domain.models import NotionPackage
 
@@ -40,7 +41,21 @@ class NotionPackageGenerator:
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        with open(output_path, "wb") as fp:
+            self.write_package(package, fp)
+
+        return output_path
+
+    def write_package(self, package: NotionPackage, fp: BinaryIO) -> None:
+        """
+        Write the Notion ZIP archive for a package into a binary file object.
+
+        Args:
+            package: NotionPackage with documents, assets, and warnings
+            fp: Writable binary file object (on-disk file or in-memory buffer);
+                it is left open
+        """
+        with zipfile.ZipFile(fp, "w", zipfile.ZIP_DEFLATED) as zf:
             # Add markdown documents directly to ZIP (no documents/ directory)
             used_paths: Set[str] = set()
 
@@ -57,31 +72,35 @@ class NotionPackageGenerator:
                 used_paths.add(unique_path)
 
             # Add assets in their correct directory structure
-            for asset_path in package.assets:
-                if asset_path.exists():
+            for asset in package.assets:
+                if asset.exists():
                     # Determine where asset should be placed in ZIP
                     asset_zip_path = self._determine_asset_zip_path(
-                        asset_path, package.documents
+                        asset, package.documents
                     )
-                    zf.write(asset_path, asset_zip_path)
+                    zf.write(asset, asset_zip_path)
 
             # Add warnings if present
             if package.warnings:
                 warnings_content = "\n".join(package.warnings)
                 zf.writestr("warnings.txt", warnings_content)
 
-        return output_path
-
-    def validate_package(self, package_path: Path) -> bool:
+    def validate_package(
+        self, package_path: Union[Path, BinaryIO, bytes, bytearray]
+    ) -> bool:
         """
         Validate that generated package has correct Notion structure.
 
         Args:
-            package_path: Path to ZIP package file
+            package_path: Path to ZIP package file, a seekable binary file
+                object, or the raw archive bytes
 
         Returns:
             True if package structure is valid for Notion import
         """
+        if isinstance(package_path, (bytes, bytearray)):
+            package_path = io.BytesIO(package_path)
+
         if not zipfile.is_zipfile(package_path):
             return False
 
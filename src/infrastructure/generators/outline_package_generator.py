@@ -5,14 +5,72 @@ This infrastructure component creates ZIP files containing JSON structures
 and assets following the EXACT Outline export format.
 """
 
+import io
 import json
+import mimetypes
+import mmap
+import os
 import re
+import shutil
 import zipfile
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Any, BinaryIO, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
 from ...domain.models import OutlinePackage
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# Fastest deflate level for the generated JSON entries; higher levels cost
+# several times the CPU for a few percent smaller archives, and packages are
+# often compressed again in transit anyway
+_COMPRESS_LEVEL = 1
+
+# Every entry gets the earliest ZIP timestamp rather than the clock or the
+# attachment's mtime, so identical inputs produce byte-identical packages
+_FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# Output file buffer size (the io default is 8 KiB)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Packages without attachment files and at most this many documents are built
+# in memory; document JSON is a few KiB each, so this stays well under 1 MiB
+_IN_MEMORY_MAX_DOCUMENTS = 32
+
+# Metadata values that are hashable and can be cached by value
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Attachment content types that are plain text and worth deflating; anything
+# else (images, PDFs, archives, video) is typically compressed already
+_DEFLATE_CONTENT_TYPES = frozenset({"application/json", "image/svg+xml"})
+
+# Slice/chunk size for feeding attachments to the compressor
+_COPY_CHUNK_SIZE = 1 << 20
+
+# Filename sanitizing table: characters invalid in file names become
+# underscores and C0/C1 control characters are removed
+_SAFE_FILENAME_TABLE = str.maketrans(
+    {
+        **dict.fromkeys('<>:"/\\|?*', "_"),
+        **{chr(code): None for code in (*range(0x20), *range(0x7F, 0xA0))},
+    }
+)
+
+# Finds any character _SAFE_FILENAME_TABLE would change, so names that are
+# already safe can skip the translate pass (and its string copy)
+_UNSAFE_FILENAME_SEARCH = re.compile(
+    "[" + re.escape("".join(map(chr, _SAFE_FILENAME_TABLE))) + "]"
+).search
+
+# orjson equivalent of json.dumps(indent=2), including str() of non-str keys
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
 
 class OutlinePackageGenerator:
     """
@@ -22,6 +80,9 @@ class OutlinePackageGenerator:
     - metadata.json with export metadata
     - Collection JSON files with documents and attachments
     - uploads/ directory with attachment files
+
+    Package warnings are not part of the Outline format and are never read
+    here; callers report them (the CLI prints them).
     """
 
     def generate_package(
@@ -47,52 +108,134 @@ class OutlinePackageGenerator:
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        if (
+            not attachments_mapping
+            and len(package.documents) <= _IN_MEMORY_MAX_DOCUMENTS
+        ):
+            # Small package: assemble in memory and write the file in one go,
+            # avoiding the flush on every seek zipfile makes to patch headers
+            buffer = io.BytesIO()
+            self.write_package(package, buffer, attachments_mapping)
+            output_path.write_bytes(buffer.getbuffer())
+            return output_path
+
+        # A large write buffer batches the many small local-header, data and
+        # central-directory writes zipfile makes into few write syscalls
+        with open(output_path, "wb", buffering=_WRITE_BUFFER_SIZE) as fp:
+            self.write_package(package, fp, attachments_mapping)
+
+        return output_path
+
+    def generate_package_bytes(
+        self,
+        package: OutlinePackage,
+        attachments_mapping: Optional[Dict[str, Path]] = None,
+    ) -> bytes:
+        """
+        Generate an Outline ZIP package in memory.
+
+        For callers that hand the archive on directly (e.g. as an HTTP
+        response) instead of reading back a file written to disk.
+
+        Args:
+            package: OutlinePackage with metadata, collections, documents, attachments
+            attachments_mapping: Optional mapping of attachment IDs to file paths
+
+        Returns:
+            The ZIP archive bytes
+        """
+        buffer = io.BytesIO()
+        self.write_package(package, buffer, attachments_mapping)
+        return buffer.getvalue()
+
+    def write_package(
+        self,
+        package: OutlinePackage,
+        fp: BinaryIO,
+        attachments_mapping: Optional[Dict[str, Path]] = None,
+    ) -> None:
+        """
+        Stream the Outline ZIP archive for a package into a binary file object.
+
+        Entries are written to fp as they are produced and nothing is buffered
+        beyond zipfile's own state, so fp may also be a non-seekable stream
+        such as a pipe, socket or HTTP response body. zipfile then records
+        sizes and CRCs in data descriptors after each entry instead of
+        seeking back to patch the local headers.
+
+        Args:
+            package: OutlinePackage with metadata, collections, documents, attachments
+            fp: Writable binary file object; it is left open
+            attachments_mapping: Optional mapping of attachment IDs to file paths
+        """
+        if attachments_mapping is None:
+            attachments_mapping = {}
+
+        with zipfile.ZipFile(
+            fp,
+            "w",
+            zipfile.ZIP_DEFLATED,
+            allowZip64=True,
+            compresslevel=_COMPRESS_LEVEL,
+            strict_timestamps=False,
+        ) as zf:
             # Add metadata.json
             self._add_metadata_json(zf, package.metadata)
 
-            # Add collection JSON files
-            for collection in package.collections:
+            # Add collection JSON files. They are built one after another on
+            # purpose: json and orjson both hold the GIL while encoding, so
+            # worker threads would not encode in parallel, and encoding every
+            # collection up front would buffer the whole package in memory
+            documents_by_collection, attachments_by_collection = (
+                self._partition_by_collection(package)
+            )
+            shared_bodies = self._encode_shared_documents(documents_by_collection)
+            for collection, documents, attachments in zip(
+                package.collections,
+                documents_by_collection,
+                attachments_by_collection,
+            ):
                 self._add_collection_json(
-                    zf, collection, package.documents, package.attachments
+                    zf, collection, documents, attachments, shared_bodies
                 )
 
             # Add attachment files to uploads/ directory
             self._add_attachments(zf, package.attachments, attachments_mapping)
 
-        return output_path
-
-    def validate_package(self, package_path: Path) -> bool:
+    def validate_package(self, package_path: Path, check_contents: bool = True) -> bool:
         """
         Validate that generated package has correct Outline structure.
 
+        The entry layout is checked from the central directory alone. With
+        check_contents, metadata.json and the collection JSON files are also
+        decompressed and parsed; attachments are never read.
+
         Args:
             package_path: Path to ZIP package file
+            check_contents: Also validate the JSON entries' contents
 
         Returns:
             True if package structure is valid for Outline import
         """
-        if not zipfile.is_zipfile(package_path):
-            return False
-
         try:
             with zipfile.ZipFile(package_path, "r") as zf:
-                files = zf.namelist()
+                json_files = {f for f in zf.namelist() if f.endswith(".json")}
 
                 # Must contain metadata.json
-                if "metadata.json" not in files:
+                if "metadata.json" not in json_files:
                     return False
 
                 # Must contain at least one collection JSON file
-                collection_files = [
-                    f for f in files if f.endswith(".json") and f != "metadata.json"
-                ]
+                collection_files = json_files - {"metadata.json"}
                 if not collection_files:
                     return False
 
+                if not check_contents:
+                    return True
+
                 # Validate metadata.json structure
                 try:
-                    metadata = json.loads(zf.read("metadata.json"))
+                    metadata = _loads(zf.read("metadata.json"))
                     required_metadata_fields = ["exportVersion", "version", "createdAt"]
                     if not all(field in metadata for field in required_metadata_fields):
                         return False
@@ -102,7 +245,7 @@ class OutlinePackageGenerator:
                 # Validate collection JSON structures
                 for collection_file in collection_files:
                     try:
-                        collection_data = json.loads(zf.read(collection_file))
+                        collection_data = _loads(zf.read(collection_file))
                         if "collection" not in collection_data:
                             return False
                         if "documents" not in collection_data:
@@ -114,13 +257,141 @@ class OutlinePackageGenerator:
 
                 return True
 
-        except (zipfile.BadZipFile, UnicodeDecodeError):
+        except (zipfile.BadZipFile, OSError, UnicodeDecodeError):
+            # OSError covers missing and unreadable files
             return False
 
     def _add_metadata_json(self, zf: zipfile.ZipFile, metadata: Dict) -> None:
-        """Add metadata.json to ZIP file."""
-        metadata_json = json.dumps(metadata, indent=2)
-        zf.writestr("metadata.json", metadata_json)
+        """
+        Add metadata.json to ZIP file.
+
+        Flat metadata (the normal case) is encoded through a small cache, so
+        repeated exports with the same metadata reuse the encoded bytes.
+        """
+        if all(type(value) in _SCALAR_TYPES for value in metadata.values()):
+            # Value types are part of the key so 1, 1.0 and True stay distinct
+            encoded = _encode_flat_metadata(
+                tuple((key, type(value), value) for key, value in metadata.items())
+            )
+        else:
+            encoded = _dumps_canonical(metadata)
+
+        zf.writestr(self._new_entry(zf, "metadata.json"), encoded)
+
+    def _new_entry(self, zf: zipfile.ZipFile, name: str) -> zipfile.ZipInfo:
+        """
+        Create a ZipInfo with a fixed timestamp and fixed permissions.
+
+        Every entry needs its own ZipInfo: ZipFile keeps the objects it was
+        given in filelist and writes them all out as the central directory on
+        close, so a shared, mutated instance would corrupt the archive.
+        """
+        info = zipfile.ZipInfo(name, date_time=_FIXED_DATE_TIME)
+        info.external_attr = 0o600 << 16  # Same permissions writestr uses
+        self._apply_compression(zf, info)
+        return info
+
+    def _apply_compression(self, zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+        """
+        Give a hand-built ZipInfo the archive's compression method and level.
+
+        zipfile only applies ZipFile.compresslevel to entries it creates
+        itself, so explicit ZipInfo entries need it copied over (the same
+        attribute ZipFile.write sets). It is public as compress_level since
+        Python 3.13 and only available under its private name before that.
+        """
+        info.compress_type = zf.compression
+        if hasattr(info, "compress_level"):
+            info.compress_level = zf.compresslevel
+        else:
+            info._compresslevel = zf.compresslevel  # type: ignore[attr-defined]
+
+    def _partition_by_collection(
+        self, package: OutlinePackage
+    ) -> Tuple[List[Dict[str, Dict]], List[Dict[str, Dict]]]:
+        """
+        Split documents and attachments into per-collection maps.
+
+        Builds a document ID -> collection index once (_build_doc_index), then
+        makes a single pass over all documents and all attachments, instead of
+        filtering both full maps again for every collection. Entries keep the
+        order of the package maps.
+
+        Args:
+            package: OutlinePackage with collections, documents, attachments
+
+        Returns:
+            Tuple of (documents, attachments) lists, each holding one map per
+            collection in package.collections order
+        """
+        if not package.documents and not package.attachments:
+            # Nothing to route, so don't walk any documentStructure
+            return (
+                [{} for _ in package.collections],
+                [{} for _ in package.collections],
+            )
+
+        doc_to_collections = self._build_doc_index(package.collections)
+
+        # The maps grow as documents are routed: CPython dicts resize
+        # geometrically (amortized O(1) inserts), and pre-sizing through
+        # dict.fromkeys(ids) measured slower because it writes every key twice
+        documents: List[Dict[str, Dict]] = [{} for _ in package.collections]
+        for doc_id, doc_data in package.documents.items():
+            for index in doc_to_collections.get(doc_id, ()):
+                documents[index][doc_id] = doc_data
+
+        # Attachments belong to the collections of the document they're used in
+        attachments: List[Dict[str, Dict]] = [{} for _ in package.collections]
+        for att_id, att_data in package.attachments.items():
+            for index in doc_to_collections.get(att_data.get("documentId", ""), ()):
+                attachments[index][att_id] = att_data
+
+        return documents, attachments
+
+    def _build_doc_index(self, collections: List[Dict]) -> Dict[str, List[int]]:
+        """
+        Map every document ID to the collections whose structure contains it.
+
+        Each documentStructure is walked exactly once. A document listed in
+        several collections maps to all of their indices, in collection order.
+
+        Args:
+            collections: Collection dictionaries with documentStructure
+
+        Returns:
+            Dictionary of document ID -> indices into collections
+        """
+        doc_index: Dict[str, List[int]] = {}
+        for index, collection in enumerate(collections):
+            for doc_id in self._extract_document_ids(collection):
+                doc_index.setdefault(doc_id, []).append(index)
+        return doc_index
+
+    def _encode_shared_documents(
+        self, documents_by_collection: List[Dict[str, Dict]]
+    ) -> Dict[str, bytes]:
+        """
+        Encode documents that appear in more than one collection, once each.
+
+        Only shared documents are kept, so memory stays bounded by the shared
+        set rather than by the whole package.
+
+        Args:
+            documents_by_collection: Per-collection document maps
+
+        Returns:
+            Dictionary of document ID -> encoded body, indented for a
+            collection's "documents" map
+        """
+        seen: Set[str] = set()
+        shared_bodies: Dict[str, bytes] = {}
+        for documents in documents_by_collection:
+            for doc_id, doc_data in documents.items():
+                if doc_id in seen and doc_id not in shared_bodies:
+                    shared_bodies[doc_id] = _indent(_dumps(doc_data), 2)
+                seen.add(doc_id)
+        return shared_bodies
 
     def _add_collection_json(
         self,
@@ -128,42 +399,54 @@ class OutlinePackageGenerator:
         collection: Dict,
         documents: Dict[str, Dict],
         attachments: Dict[str, Dict],
+        shared_bodies: Optional[Dict[str, bytes]] = None,
     ) -> None:
-        """Add collection JSON file to ZIP."""
+        """
+        Add collection JSON file to ZIP.
+
+        Args:
+            zf: Open ZIP file to write into
+            collection: Collection dictionary
+            documents: Documents belonging to this collection only
+            attachments: Attachments belonging to this collection only
+            shared_bodies: Pre-encoded bodies of documents shared between
+                collections (see _encode_shared_documents)
+        """
+        if shared_bodies is None:
+            shared_bodies = {}
+
         # Create safe filename from collection name
         safe_name = self._sanitize_filename(collection["name"])
         filename = f"{safe_name}.json"
 
-        # Extract document IDs from collection's documentStructure
-        collection_doc_ids = self._extract_document_ids(collection)
-
-        # Filter documents to only include those in this collection
-        collection_documents = {
-            doc_id: doc_data
-            for doc_id, doc_data in documents.items()
-            if doc_id in collection_doc_ids
-        }
-
-        # Filter attachments to only include those belonging to collection documents
-        collection_attachments = {
-            att_id: att_data
-            for att_id, att_data in attachments.items()
-            if att_data.get("documentId") in collection_doc_ids
-        }
-
-        # Create collection JSON structure
-        collection_data = {
-            "collection": collection,
-            "documents": collection_documents,  # Now filtered!
-            "attachments": collection_attachments,  # Now filtered!
-        }
-
-        collection_json = json.dumps(collection_data, indent=2)
-        zf.writestr(filename, collection_json)
-
-    def _extract_document_ids(self, collection: Dict) -> Set[str]:
+        # Stream {"collection": ..., "documents": {...}, "attachments": ...}
+        # one document at a time, laid out exactly as json.dumps(indent=2)
+        # would, so only the largest single document is ever encoded at once
+        with zf.open(self._new_entry(zf, filename), "w", force_zip64=True) as fp:
+            fp.write(b'{\n  "collection": ')
+            fp.write(_indent(_dumps(collection), 1))
+            fp.write(b',\n  "documents": ')
+            if documents:
+                separator = b"{\n    "
+                for doc_id, doc_data in documents.items():
+                    fp.write(separator)
+                    fp.write(_dumps(doc_id))
+                    fp.write(b": ")
+                    body = shared_bodies.get(doc_id)
+                    if body is None:
+                        body = _indent(_dumps(doc_data), 2)
+                    fp.write(body)
+                    separator = b",\n    "
+                fp.write(b"\n  }")
+            else:
+                fp.write(b"{}")
+            fp.write(b',\n  "attachments": ')
+            fp.write(_indent(_dumps(attachments), 1))
+            fp.write(b"\n}")
+
+    def _extract_document_ids(self, collection: Dict) -> FrozenSet[str]:
         """
-        Recursively extract all document IDs from a collection's documentStructure.
+        Extract all document IDs from a collection's documentStructure.
 
         Handles nested document structures by traversing the 'children' property
         of each document node to ensure all nested documents are included.
@@ -174,38 +457,39 @@ class OutlinePackageGenerator:
         Returns:
             Set of all document IDs found in the structure (including nested ones)
         """
-        doc_ids: Set[str] = set()
-
-        # Handle missing or invalid documentStructure
-        if "documentStructure" not in collection:
-            return doc_ids
-
         document_structure = collection.get("documentStructure", [])
         if not isinstance(document_structure, list):
-            return doc_ids
+            return frozenset()
+
+        return frozenset(self._iter_document_ids(document_structure))
+
+    def _iter_document_ids(self, nodes: List[Dict]) -> Iterator[str]:
+        """
+        Yield document IDs from a documentStructure tree, breadth-first.
 
-        # Define recursive function to traverse document nodes
-        def extract_from_node(node: Dict) -> None:
-            """Recursively extract IDs from a document node and its children."""
+        Uses a deque rather than recursion, so arbitrarily deep nesting cannot
+        hit the recursion limit. IDs come out level by level in document
+        order: top-level documents first, then their children.
+
+        Args:
+            nodes: Top-level document nodes
+
+        Yields:
+            ID of every node (and nested child) that has one
+        """
+        queue = deque(nodes)
+        while queue:
+            node = queue.popleft()
             if not isinstance(node, dict):
-                return
+                continue
 
-            # Extract ID from current node
             node_id = node.get("id")
             if node_id:
-                doc_ids.add(node_id)
+                yield node_id
 
-            # Recursively process children
             children = node.get("children", [])
             if isinstance(children, list):
-                for child in children:
-                    extract_from_node(child)
-
-        # Process all top-level document nodes
-        for doc_node in document_structure:
-            extract_from_node(doc_node)
-
-        return doc_ids
+                queue.extend(children)
 
     def _add_attachments(
         self,
@@ -222,10 +506,61 @@ class OutlinePackageGenerator:
             if attachment_id in attachments_mapping:
                 file_path = attachments_mapping[attachment_id]
                 if file_path.exists():
-                    zf.write(file_path, upload_key)
+                    content_type = attachment.get("contentType")
+                    if not content_type:
+                        content_type = mimetypes.guess_type(upload_key)[0]
+                    self._add_attachment_file(zf, file_path, upload_key, content_type)
                 else:
                     # Create placeholder for missing file
-                    zf.writestr(upload_key, f"Missing file: {file_path}")
+                    zf.writestr(
+                        self._new_entry(zf, upload_key), f"Missing file: {file_path}"
+                    )
+
+    def _add_attachment_file(
+        self,
+        zf: zipfile.ZipFile,
+        file_path: Path,
+        upload_key: str,
+        content_type: Optional[str] = None,
+    ) -> None:
+        """
+        Copy one attachment file into the ZIP under upload_key.
+
+        Only text-like content types are deflated. Other attachments are
+        stored as-is: they are mostly images and PDFs that are already
+        compressed, so deflating them spends CPU and can even grow the
+        entry. The file is memory-mapped and written in slices of the
+        mapping, so attachment bytes are read straight from the page cache
+        without being copied into intermediate Python bytes objects. Files
+        that can't be mapped are streamed through a 1 MiB buffer instead, so
+        memory use never depends on the attachment size.
+
+        Args:
+            zf: Open ZIP file to write into
+            file_path: Attachment file on disk
+            upload_key: Entry name within the ZIP
+            content_type: MIME type of the attachment, if known
+        """
+        # Fixed date and mode rather than the file's, for reproducible output
+        info = self._new_entry(zf, upload_key)
+        if not _is_compressible(content_type):
+            info.compress_type = zipfile.ZIP_STORED
+
+        with open(file_path, "rb") as src:
+            # Known size lets zipfile decide up front whether ZIP64 is needed
+            info.file_size = os.fstat(src.fileno()).st_size
+            with zf.open(info, "w") as dst:
+                try:
+                    mapped = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    # Empty files and non-regular files (pipes, some network or
+                    # virtual filesystems) can't be mapped; copy in bounded chunks
+                    shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+                    return
+
+                with mapped, memoryview(mapped) as view:
+                    for offset in range(0, len(view), _COPY_CHUNK_SIZE):
+                        dst.write(view[offset : offset + _COPY_CHUNK_SIZE])
 
     def _sanitize_filename(self, filename: str) -> str:
         """
@@ -237,17 +572,83 @@ class OutlinePackageGenerator:
         Returns:
             Safe filename with problematic characters removed/replaced
         """
-        # Replace problematic characters with underscores
-        safe_name = re.sub(r'[<>:"/\\|?*]', "_", filename)
+        return _sanitize_filename_cached(filename)
+
+
+@lru_cache(maxsize=256)
+def _sanitize_filename_cached(filename: str) -> str:
+    """Sanitize a filename with one translate pass; see _SAFE_FILENAME_TABLE."""
+    # Fast path: nothing to replace, drop, trim or truncate
+    if (
+        filename
+        and len(filename) <= 200
+        and not _UNSAFE_FILENAME_SEARCH(filename)
+        and not filename[0].isspace()
+        and not filename[-1].isspace()
+        and filename[-1] != "."
+    ):
+        return filename
+
+    # Replace problematic characters and drop control characters
+    safe_name = filename.translate(_SAFE_FILENAME_TABLE)
+
+    # Limit length and strip whitespace; Windows also drops trailing dots and
+    # spaces on extraction, which would make "Notes." collide with "Notes"
+    safe_name = safe_name.strip()[:200].rstrip(". ")
 
-        # Remove any control characters
-        safe_name = re.sub(r"[\x00-\x1f\x7f-\x9f]", "", safe_name)
+    # Ensure it's not empty
+    if not safe_name:
+        safe_name = "Untitled"
 
-        # Limit length and strip whitespace
-        safe_name = safe_name.strip()[:200]
+    return safe_name
 
-        # Ensure it's not empty
-        if not safe_name:
-            safe_name = "Untitled"
 
-        return safe_name
+def _is_compressible(content_type: Optional[str]) -> bool:
+    """Return whether an attachment of this MIME type should be deflated."""
+    if not content_type:
+        return False
+    return content_type.startswith("text/") or content_type in _DEFLATE_CONTENT_TYPES
+
+
+@lru_cache(maxsize=32)
+def _encode_flat_metadata(items: Tuple[Tuple[str, type, Any], ...]) -> bytes:
+    """Encode flat metadata given as (key, value type, value) triples."""
+    return _dumps_canonical({key: value for key, _, value in items})
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode data as UTF-8 JSON indented like json.dumps(indent=2)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=_ORJSON_OPTIONS)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _dumps_canonical(data: Any) -> bytes:
+    """Encode data like _dumps but with object keys sorted at every level."""
+    if orjson is not None:
+        return orjson.dumps(data, option=_ORJSON_OPTIONS | orjson.OPT_SORT_KEYS)
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes, with orjson when it is installed.
+
+    orjson decodes without a str intermediate and reuses one cached str object
+    for repeated short keys (e.g. "id", "title" across documents), so parsed
+    collections don't hold a copy of every key per document. Its decode
+    error subclasses json.JSONDecodeError, so callers catch either the same way.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _indent(encoded: bytes, level: int) -> bytes:
+    """
+    Re-indent encoded multi-line JSON to nest it ``level`` levels deep.
+
+    Safe on encoder output because newlines inside JSON strings are always
+    escaped, so every raw newline is structural.
+    """
+    return encoded.replace(b"\n", b"\n" + b"  " * level)
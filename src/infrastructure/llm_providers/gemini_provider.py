@@ -26,6 +26,25 @@ class GeminiProvider:
     using Google's Gemini API for complex parsing scenarios.
     """
 
+    # Maximum number of candidate files listed in a wikilink prompt
+    _MAX_PROMPT_FILES = 50
+
+    _WIKILINK_PROMPT_TEMPLATE = """\
+Help resolve this Obsidian wikilink to the best matching filename.
+
+Wikilink: {wikilink}
+
+Available files:
+{files_list}
+
+Find the best match based on:
+1. Exact filename similarity
+2. Common abbreviations (e.g., "ML" for "Machine Learning")
+3. Semantic similarity
+4. Path components
+
+Return only the most likely filename. If uncertain, return your best guess."""
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -247,25 +266,11 @@ class GeminiProvider:
             Formatted prompt string
         """
         # Limit files list to prevent context overflow
-        max_files = 50
+        max_files = self._MAX_PROMPT_FILES
+        files_list = "\n".join(f"- {f}" for f in available_files[:max_files])
         if len(available_files) > max_files:
-            files_sample = available_files[:max_files]
-            files_list = "\n".join(f"- {f}" for f in files_sample)
             files_list += f"\n... and {len(available_files) - max_files} more files"
-        else:
-            files_list = "\n".join(f"- {f}" for f in available_files)
-
-        return f"""Help resolve this Obsidian wikilink to the best matching filename.
-
-Wikilink: {wikilink}
 
-Available files:
-{files_list}
-
-Find the best match based on:
-1. Exact filename similarity
-2. Common abbreviations (e.g., "ML" for "Machine Learning")
-3. Semantic similarity
-4. Path components
-
-Return only the most likely filename. If uncertain, return your best guess."""
+        return self._WIKILINK_PROMPT_TEMPLATE.format(
+            wikilink=wikilink, files_list=files_list
+        )
@@ -7,24 +7,28 @@ hexagonal architecture principles.
 """
 
 import re
+from functools import lru_cache
+
+from .parse_cache import PARSE_CACHE_MAX_CONTENT_LENGTH, PARSE_CACHE_SIZE
 
 
 class BlockReferenceParser:
     """Parser for transforming Obsidian block references to AppFlowy format."""
 
-    def __init__(self) -> None:
-        """Initialize the block reference parser."""
-        # Regex pattern to match block references at line endings
-        # Captures: (content before ^)(block-id)(optional whitespace)
-        # Handles both content+blockref and standalone blockref cases
-        self._block_reference_pattern = re.compile(
-            r"^(.*?)\s*\^([a-zA-Z0-9\-_]+)\s*$", re.MULTILINE
-        )
+    # Stateless: patterns live on the class so instances carry no __dict__
+    __slots__ = ()
 
-        # Pattern to detect code blocks (both fenced and indented)
-        self._code_block_pattern = re.compile(
-            r"```[\s\S]*?```|`[^`\n]*`|^    .*$", re.MULTILINE
-        )
+    # Regex pattern to match block references at line endings
+    # Captures: (content before ^)(block-id)(optional whitespace)
+    # Handles both content+blockref and standalone blockref cases
+    _BLOCK_REFERENCE_PATTERN = re.compile(
+        r"^(.*?)\s*\^([a-zA-Z0-9\-_]+)\s*$", re.MULTILINE
+    )
+
+    # Patterns to detect code blocks: fenced, inline and indented
+    _FENCED_CODE_PATTERN = re.compile(r"```[\s\S]*?```", re.MULTILINE)
+    _INLINE_CODE_PATTERN = re.compile(r"`[^`\n]*`")
+    _INDENTED_CODE_PATTERN = re.compile(r"^(    |\t).*$", re.MULTILINE)
 
     def transform_block_references(self, content: str) -> str:
         """
@@ -45,6 +49,17 @@ class BlockReferenceParser:
         if not content or not content.strip():
             return content
 
+        # The cache holds base-class results, so subclasses (which may change
+        # the patterns or code block detection) always transform directly
+        if (
+            type(self) is BlockReferenceParser
+            and len(content) < PARSE_CACHE_MAX_CONTENT_LENGTH
+        ):
+            return _transform_block_references_cached(content)
+        return self._transform_block_references(content)
+
+    def _transform_block_references(self, content: str) -> str:
+        """Transform block references without consulting the parse cache."""
         # Find all code block regions to avoid transforming within them
         code_blocks = self._find_code_block_regions(content)
 
@@ -69,7 +84,7 @@ class BlockReferenceParser:
             return f"{line_content.rstrip()} <!-- block: {block_id} -->"
 
         # Transform all block references
-        transformed = self._block_reference_pattern.sub(
+        transformed = self._BLOCK_REFERENCE_PATTERN.sub(
             replace_block_reference, content
         )
 
@@ -91,18 +106,21 @@ class BlockReferenceParser:
         code_regions = []
 
         # Find fenced code blocks (```...```)
-        fenced_pattern = re.compile(r"```[\s\S]*?```", re.MULTILINE)
-        for match in fenced_pattern.finditer(content):
+        for match in self._FENCED_CODE_PATTERN.finditer(content):
             code_regions.append((match.start(), match.end()))
 
         # Find inline code (`...`)
-        inline_pattern = re.compile(r"`[^`\n]*`")
-        for match in inline_pattern.finditer(content):
+        for match in self._INLINE_CODE_PATTERN.finditer(content):
             code_regions.append((match.start(), match.end()))
 
         # Find indented code blocks (4+ spaces at line start)
-        indented_pattern = re.compile(r"^(    |\t).*$", re.MULTILINE)
-        for match in indented_pattern.finditer(content):
+        for match in self._INDENTED_CODE_PATTERN.finditer(content):
             code_regions.append((match.start(), match.end()))
 
         return code_regions
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _transform_block_references_cached(content: str) -> str:
+    """Content-addressed cache around the stateless block reference transform."""
+    return BlockReferenceParser()._transform_block_references(content)
@@ -7,12 +7,18 @@ and formatting following hexagonal architecture principles.
 """
 
 import re
+from functools import lru_cache
 from typing import Dict
 
+from .parse_cache import PARSE_CACHE_MAX_CONTENT_LENGTH, PARSE_CACHE_SIZE
+
 
 class CalloutParser:
     """Parser for transforming Obsidian callouts to AppFlowy format."""
 
+    # Stateless: patterns live on the class so instances carry no __dict__
+    __slots__ = ()
+
     # Comprehensive mapping of all Obsidian callout types to AppFlowy format
     CALLOUT_MAPPINGS: Dict[str, str] = {
         # Note family
@@ -57,13 +63,11 @@ class CalloutParser:
         "cite": "💬 **Cite:**",
     }
 
-    def __init__(self) -> None:
-        """Initialize the callout parser."""
-        # Regex pattern to match callout headers
-        # Matches: > [!type]optionalCollapsible optional custom title
-        self._callout_header_pattern = re.compile(
-            r"^(> )\[!(\w+)\]([+-]?)(.*)$", re.MULTILINE | re.IGNORECASE
-        )
+    # Regex pattern to match callout headers
+    # Matches: > [!type]optionalCollapsible optional custom title
+    _CALLOUT_HEADER_PATTERN = re.compile(
+        r"^(> )\[!(\w+)\]([+-]?)(.*)$", re.MULTILINE | re.IGNORECASE
+    )
 
     def transform_callouts(self, content: str) -> str:
         """
@@ -81,6 +85,17 @@ class CalloutParser:
         Returns:
             Content with callouts transformed to AppFlowy format
         """
+        # The cache holds base-class results, so subclasses (which may change
+        # the mappings or prefixes) always transform directly
+        if (
+            type(self) is CalloutParser
+            and len(content) < PARSE_CACHE_MAX_CONTENT_LENGTH
+        ):
+            return _transform_callouts_cached(content)
+        return self._transform_callouts(content)
+
+    def _transform_callouts(self, content: str) -> str:
+        """Transform callouts without consulting the parse cache."""
 
         def replace_callout_header(match: re.Match[str]) -> str:
             """Replace a single callout header with AppFlowy format."""
@@ -96,7 +111,7 @@ class CalloutParser:
             return f"{blockquote_prefix}{appflowy_prefix}"
 
         # Transform all callout headers
-        transformed = self._callout_header_pattern.sub(replace_callout_header, content)
+        transformed = self._CALLOUT_HEADER_PATTERN.sub(replace_callout_header, content)
 
         return transformed
 
@@ -129,3 +144,9 @@ class CalloutParser:
 
         # Unknown callout type - use generic format
         return f"**{callout_type.title()}:**"
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _transform_callouts_cached(content: str) -> str:
+    """Content-addressed cache around the stateless callout transform."""
+    return CalloutParser()._transform_callouts(content)
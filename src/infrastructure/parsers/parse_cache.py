@@ -0,0 +1,13 @@
+"""
+Shared limits for the markdown parsers' content-addressed caches.
+
+Notes are often re-parsed unchanged, so each parser keeps a module-level
+lru_cache of results keyed by note content for the life of the process.
+"""
+
+# Entries kept per parser cache
+PARSE_CACHE_SIZE = 512
+
+# Notes this many characters or longer bypass the caches. With the entry cap
+# this limits each cache to about 8 MB of ASCII keys plus its results.
+PARSE_CACHE_MAX_CONTENT_LENGTH = 16_000
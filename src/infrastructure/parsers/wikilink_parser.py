@@ -6,26 +6,64 @@ Python-Markdown with a custom extension, avoiding the pitfalls of regex.
 """
 
 import re
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Union, cast
+from typing import List, Optional, Tuple, Union, cast
 from xml.etree import ElementTree as etree
 
 import markdown
 from markdown.extensions import Extension
 from markdown.inlinepatterns import InlineProcessor
 
+from .parse_cache import PARSE_CACHE_MAX_CONTENT_LENGTH, PARSE_CACHE_SIZE
+
 
 @dataclass(frozen=True)
 class WikiLink:
     """Immutable representation of a parsed Obsidian wikilink."""
 
-    original: str  # Full original text: [[Note|Alias#Header]]
     target: str  # Target note name: Note
     alias: Optional[str] = None  # Display alias: Alias
     header: Optional[str] = None  # Section reference: Header
     block_id: Optional[str] = None  # Block reference: block-id
     is_embed: bool = False  # True for ![[Note]]
+    source: Optional[str] = None  # Verbatim text, only kept if not canonical
+
+    @property
+    def original(self) -> str:
+        """
+        Full original text of the wikilink, e.g. [[Note#Header|Alias]].
+
+        Rebuilt from the parsed components on access so that parsed links do
+        not hold on to a copy of the source text. Links whose source differs
+        from the canonical form (e.g. extra whitespace) keep it in ``source``.
+        """
+        if self.source is not None:
+            return self.source
+        return _format_wikilink(
+            self.target, self.alias, self.header, self.block_id, self.is_embed
+        )
+
+
+def _format_wikilink(
+    target: str,
+    alias: Optional[str],
+    header: Optional[str],
+    block_id: Optional[str],
+    is_embed: bool,
+) -> str:
+    """Build the canonical wikilink text from its components."""
+    parts = ["![[" if is_embed else "[[", target]
+    if header is not None:
+        parts.append(f"#{header}")
+    if block_id is not None:
+        parts.append(f"^{block_id}")
+    if alias is not None:
+        parts.append(f"|{alias}")
+    parts.append("]]")
+    return "".join(parts)
 
 
 class WikiLinkInlineProcessor(InlineProcessor):
@@ -97,13 +135,21 @@ class WikiLinkInlineProcessor(InlineProcessor):
         if "#" in target:
             target, header = target.split("#", 1)
 
+        target = target.strip()
+        alias = alias.strip() if alias else None
+        header = header.strip() if header else None
+        block_id = block_id.strip() if block_id else None
+
+        # Only retain the source text when it cannot be rebuilt from components
+        canonical = _format_wikilink(target, alias, header, block_id, is_embed)
+
         return WikiLink(
-            original=original,
-            target=target.strip(),
-            alias=alias.strip() if alias else None,
-            header=header.strip() if header else None,
-            block_id=block_id.strip() if block_id else None,
+            target=target,
+            alias=alias,
+            header=header,
+            block_id=block_id,
             is_embed=is_embed,
+            source=None if canonical == original else original,
         )
 
 
@@ -129,6 +175,8 @@ class WikiLinkParser:
     Uses Python-Markdown with custom extension for reliable, context-aware parsing.
     """
 
+    __slots__ = ("md",)
+
     def __init__(self) -> None:
         self.md = markdown.Markdown(extensions=[WikiLinkExtension()])
 
@@ -142,6 +190,17 @@ class WikiLinkParser:
         Returns:
             List of WikiLink objects found in the content
         """
+        # The cache holds base-class results, so subclasses (which may change
+        # the markdown extensions or extraction) always parse directly
+        if (
+            type(self) is WikiLinkParser
+            and len(content) < PARSE_CACHE_MAX_CONTENT_LENGTH
+        ):
+            return list(_extract_wikilinks_cached(content))
+        return list(self._extract_wikilinks(content))
+
+    def _extract_wikilinks(self, content: str) -> Tuple[WikiLink, ...]:
+        """Parse content for wikilinks without consulting the parse cache."""
         # Reset wikilinks for this parse
         self.md.wikilinks = []  # type: ignore[attr-defined]
 
@@ -150,7 +209,7 @@ class WikiLinkParser:
 
         # Return found wikilinks
         wikilinks_list = cast(List[WikiLink], getattr(self.md, "wikilinks", []))
-        return list(wikilinks_list)
+        return tuple(wikilinks_list)
 
     def extract_from_file(self, file_path: Path) -> List[WikiLink]:
         """
@@ -164,3 +223,26 @@ class WikiLinkParser:
         """
         content = file_path.read_text(encoding="utf-8")
         return self.extract_wikilinks(content)
+
+
+# Every WikiLinkParser shares the parser below for cached parses. A parse
+# resets and then reads its md.wikilinks, so parses must not interleave.
+_CACHE_PARSER_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _cache_parser() -> WikiLinkParser:
+    """Parser instance backing the module-level parse cache."""
+    return WikiLinkParser()
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _extract_wikilinks_cached(content: str) -> Tuple[WikiLink, ...]:
+    """
+    Content-addressed cache around wikilink extraction.
+
+    The base parser has no per-instance configuration, so results depend on
+    the content alone. They are tuples so cached entries cannot be mutated.
+    """
+    with _CACHE_PARSER_LOCK:
+        return _cache_parser()._extract_wikilinks(content)
@@ -6,7 +6,6 @@ for the complete vault export pipeline orchestration.
 """
 
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from unittest.mock import Mock
 
 from src.application.export_use_case import ExportConfig, ExportResult, ExportUseCase
@@ -50,7 +49,7 @@ class TestExportUseCase:
         assert use_case.vault_index_builder == vault_index_builder
         assert use_case.file_system == file_system
 
-    def test_export_vault_success(self):
+    def test_export_vault_success(self, tmp_path):
         """
         Test successful vault export with complete pipeline.
 
@@ -120,53 +119,52 @@ class TestExportUseCase:
         ]
 
         # Mock package generation
-        with TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "export.zip"
-            package_generator.generate_package.return_value = output_path
-
-            use_case = ExportUseCase(
-                vault_analyzer=vault_analyzer,
-                content_transformer=content_transformer,
-                document_generator=document_generator,
-                package_generator=package_generator,
-                vault_index_builder=vault_index_builder,
-                file_system=file_system,
-            )
-
-            config = ExportConfig(
-                vault_path=Path("/test/vault"),
-                output_path=output_path,
-                package_name="Test Export",
-            )
-
-            result = use_case.export_vault(config)
-
-            # Verify result
-            assert isinstance(result, ExportResult)
-            assert result.success is True
-            assert result.output_path == output_path
-            assert result.files_processed == 2
-            assert result.warnings == ["Sample warning"]
-            assert len(result.errors) == 0
-
-            # Verify component calls
-            vault_analyzer.scan_vault.assert_called_once_with(Path("/test/vault"))
-            vault_index_builder.build_index.assert_called_once_with(Path("/test/vault"))
-            assert file_system.read_file_content.call_count == 2
-            file_system.read_file_content.assert_any_call(Path("/test/vault/note1.md"))
-            file_system.read_file_content.assert_any_call(Path("/test/vault/note2.md"))
-            assert content_transformer.transform_content.call_count == 2
-            # Verify content_transformer was called with new interface
-            content_transformer.transform_content.assert_any_call(
-                Path("/test/vault/note1.md"), "# Note 1\nContent", vault_index
-            )
-            content_transformer.transform_content.assert_any_call(
-                Path("/test/vault/note2.md"), "# Note 2\nMore content", vault_index
-            )
-            assert document_generator.generate_document.call_count == 2
-            package_generator.generate_package.assert_called_once()
-
-    def test_export_vault_with_progress_callback(self):
+        output_path = tmp_path / "export.zip"
+        package_generator.generate_package.return_value = output_path
+
+        use_case = ExportUseCase(
+            vault_analyzer=vault_analyzer,
+            content_transformer=content_transformer,
+            document_generator=document_generator,
+            package_generator=package_generator,
+            vault_index_builder=vault_index_builder,
+            file_system=file_system,
+        )
+
+        config = ExportConfig(
+            vault_path=Path("/test/vault"),
+            output_path=output_path,
+            package_name="Test Export",
+        )
+
+        result = use_case.export_vault(config)
+
+        # Verify result
+        assert isinstance(result, ExportResult)
+        assert result.success is True
+        assert result.output_path == output_path
+        assert result.files_processed == 2
+        assert result.warnings == ["Sample warning"]
+        assert len(result.errors) == 0
+
+        # Verify component calls
+        vault_analyzer.scan_vault.assert_called_once_with(Path("/test/vault"))
+        vault_index_builder.build_index.assert_called_once_with(Path("/test/vault"))
+        assert file_system.read_file_content.call_count == 2
+        file_system.read_file_content.assert_any_call(Path("/test/vault/note1.md"))
+        file_system.read_file_content.assert_any_call(Path("/test/vault/note2.md"))
+        assert content_transformer.transform_content.call_count == 2
+        # Verify content_transformer was called with new interface
+        content_transformer.transform_content.assert_any_call(
+            Path("/test/vault/note1.md"), "# Note 1\nContent", vault_index
+        )
+        content_transformer.transform_content.assert_any_call(
+            Path("/test/vault/note2.md"), "# Note 2\nMore content", vault_index
+        )
+        assert document_generator.generate_document.call_count == 2
+        package_generator.generate_package.assert_called_once()
+
+    def test_export_vault_with_progress_callback(self, tmp_path):
         """
         Test export with progress reporting callback.
 
@@ -215,38 +213,37 @@ class TestExportUseCase:
             "document": {"type": "page", "children": []},
         }
 
-        with TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "export.zip"
-            package_generator.generate_package.return_value = output_path
-
-            use_case = ExportUseCase(
-                vault_analyzer=vault_analyzer,
-                content_transformer=content_transformer,
-                document_generator=document_generator,
-                package_generator=package_generator,
-                vault_index_builder=vault_index_builder,
-                file_system=file_system,
-            )
-
-            progress_callback = Mock()
-            config = ExportConfig(
-                vault_path=Path("/test/vault"),
-                output_path=output_path,
-                package_name="Test Export",
-                progress_callback=progress_callback,
-            )
-
-            use_case.export_vault(config)
-
-            # Verify progress callbacks were made
-            # At least: scan, transform, generate
-            assert progress_callback.call_count >= 3
-            progress_calls = [call.args[0] for call in progress_callback.call_args_list]
-            assert any("Scanning vault" in msg for msg in progress_calls)
-            assert any("Transforming content" in msg for msg in progress_calls)
-            assert any("Generating package" in msg for msg in progress_calls)
-
-    def test_export_vault_with_transformation_errors(self):
+        output_path = tmp_path / "export.zip"
+        package_generator.generate_package.return_value = output_path
+
+        use_case = ExportUseCase(
+            vault_analyzer=vault_analyzer,
+            content_transformer=content_transformer,
+            document_generator=document_generator,
+            package_generator=package_generator,
+            vault_index_builder=vault_index_builder,
+            file_system=file_system,
+        )
+
+        progress_callback = Mock()
+        config = ExportConfig(
+            vault_path=Path("/test/vault"),
+            output_path=output_path,
+            package_name="Test Export",
+            progress_callback=progress_callback,
+        )
+
+        use_case.export_vault(config)
+
+        # Verify progress callbacks were made
+        # At least: scan, transform, generate
+        assert progress_callback.call_count >= 3
+        progress_calls = [call.args[0] for call in progress_callback.call_args_list]
+        assert any("Scanning vault" in msg for msg in progress_calls)
+        assert any("Transforming content" in msg for msg in progress_calls)
+        assert any("Generating package" in msg for msg in progress_calls)
+
+    def test_export_vault_with_transformation_errors(self, tmp_path):
         """
         Test export handling content transformation errors.
 
@@ -309,32 +306,31 @@ class TestExportUseCase:
             "document": {"type": "page", "children": []},
         }
 
-        with TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "export.zip"
-            package_generator.generate_package.return_value = output_path
-
-            use_case = ExportUseCase(
-                vault_analyzer=vault_analyzer,
-                content_transformer=content_transformer,
-                document_generator=document_generator,
-                package_generator=package_generator,
-                vault_index_builder=vault_index_builder,
-                file_system=file_system,
-            )
-
-            config = ExportConfig(
-                vault_path=Path("/test/vault"),
-                output_path=output_path,
-                package_name="Test Export",
-            )
-
-            result = use_case.export_vault(config)
-
-            # Should still succeed but with errors recorded
-            assert result.success is True  # Package was created
-            assert result.files_processed == 1  # Only successful file
-            assert len(result.errors) == 1
-            assert "Transformation failed for bad.md" in result.errors[0]
+        output_path = tmp_path / "export.zip"
+        package_generator.generate_package.return_value = output_path
+
+        use_case = ExportUseCase(
+            vault_analyzer=vault_analyzer,
+            content_transformer=content_transformer,
+            document_generator=document_generator,
+            package_generator=package_generator,
+            vault_index_builder=vault_index_builder,
+            file_system=file_system,
+        )
+
+        config = ExportConfig(
+            vault_path=Path("/test/vault"),
+            output_path=output_path,
+            package_name="Test Export",
+        )
+
+        result = use_case.export_vault(config)
+
+        # Should still succeed but with errors recorded
+        assert result.success is True  # Package was created
+        assert result.files_processed == 1  # Only successful file
+        assert len(result.errors) == 1
+        assert "Transformation failed for bad.md" in result.errors[0]
 
     def test_export_vault_with_missing_vault(self):
         """
@@ -388,7 +384,7 @@ class TestExportUseCase:
         assert config.progress_callback is None
         assert config.validate_only is False
 
-    def test_export_result_aggregation(self):
+    def test_export_result_aggregation(self, tmp_path):
         """
         Test export result data aggregation.
 
@@ -471,35 +467,34 @@ class TestExportUseCase:
             {"name": "note3.json", "document": {"type": "page"}},
         ]
 
-        with TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "export.zip"
-            package_generator.generate_package.return_value = output_path
-
-            use_case = ExportUseCase(
-                vault_analyzer=vault_analyzer,
-                content_transformer=content_transformer,
-                document_generator=document_generator,
-                package_generator=package_generator,
-                vault_index_builder=vault_index_builder,
-                file_system=file_system,
-            )
-
-            config = ExportConfig(
-                vault_path=Path("/test/vault"),
-                output_path=output_path,
-                package_name="Test Export",
-            )
-
-            result = use_case.export_vault(config)
-
-            # Verify aggregated results
-            assert result.success is True
-            assert result.files_processed == 3
-            assert len(result.warnings) == 3  # All warnings collected
-            assert "Warning 1" in result.warnings
-            assert "Warning 2" in result.warnings
-            assert "Warning 3" in result.warnings
-            assert result.assets_processed == 1
+        output_path = tmp_path / "export.zip"
+        package_generator.generate_package.return_value = output_path
+
+        use_case = ExportUseCase(
+            vault_analyzer=vault_analyzer,
+            content_transformer=content_transformer,
+            document_generator=document_generator,
+            package_generator=package_generator,
+            vault_index_builder=vault_index_builder,
+            file_system=file_system,
+        )
+
+        config = ExportConfig(
+            vault_path=Path("/test/vault"),
+            output_path=output_path,
+            package_name="Test Export",
+        )
+
+        result = use_case.export_vault(config)
+
+        # Verify aggregated results
+        assert result.success is True
+        assert result.files_processed == 3
+        assert len(result.warnings) == 3  # All warnings collected
+        assert "Warning 1" in result.warnings
+        assert "Warning 2" in result.warnings
+        assert "Warning 3" in result.warnings
+        assert result.assets_processed == 1
 
     def test_validate_only_mode(self):
         """
@@ -8,7 +8,6 @@ CRITICAL: All tests verify the end-to-end workflow produces valid
 Notion-compatible ZIP packages that AppFlowy can import.
 """
 
-import tempfile
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -51,7 +50,7 @@ class TestNotionExportUseCase:
         # Then: Should initialize successfully
         assert use_case is not None
 
-    def test_export_simple_vault_to_notion_zip(self):
+    def test_export_simple_vault_to_notion_zip(self, tmp_path):
         """
         Test complete export pipeline for simple vault.
 
@@ -107,23 +106,22 @@ class TestNotionExportUseCase:
         )
 
         # When: Export vault
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = NotionExportConfig(
-                vault_path=Path("/test/vault"),
-                output_path=Path(temp_dir) / "export.zip",
-                package_name="test_export",
-            )
-
-            result = use_case.export(config)
-
-            # Then: Should succeed with proper orchestration
-            assert result.success
-            assert vault_analyzer.scan_vault.called
-            assert content_transformer.transform_content.called
-            assert notion_document_generator.convert_to_notion_format.called
-            assert notion_package_generator.generate_package.called
-
-    def test_export_with_progress_callback(self):
+        config = NotionExportConfig(
+            vault_path=Path("/test/vault"),
+            output_path=tmp_path / "export.zip",
+            package_name="test_export",
+        )
+
+        result = use_case.export(config)
+
+        # Then: Should succeed with proper orchestration
+        assert result.success
+        assert vault_analyzer.scan_vault.called
+        assert content_transformer.transform_content.called
+        assert notion_document_generator.convert_to_notion_format.called
+        assert notion_package_generator.generate_package.called
+
+    def test_export_with_progress_callback(self, tmp_path):
         """
         Test export with progress reporting callback.
 
@@ -158,22 +156,21 @@ class TestNotionExportUseCase:
         )
 
         # When: Export with progress callback
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = NotionExportConfig(
-                vault_path=Path("/test/vault"),
-                output_path=Path(temp_dir) / "export.zip",
-                package_name="test_export",
-                progress_callback=progress_callback,
-            )
-
-            use_case.export(config)
-
-            # Then: Progress callback should be called
-            assert progress_callback.called
-            # Should be called multiple times for different stages
-            assert progress_callback.call_count >= 3
-
-    def test_export_handles_transformer_errors_gracefully(self):
+        config = NotionExportConfig(
+            vault_path=Path("/test/vault"),
+            output_path=tmp_path / "export.zip",
+            package_name="test_export",
+            progress_callback=progress_callback,
+        )
+
+        use_case.export(config)
+
+        # Then: Progress callback should be called
+        assert progress_callback.called
+        # Should be called multiple times for different stages
+        assert progress_callback.call_count >= 3
+
+    def test_export_handles_transformer_errors_gracefully(self, tmp_path):
         """
         Test export error handling when content transformation fails.
 
@@ -212,21 +209,20 @@ class TestNotionExportUseCase:
         )
 
         # When: Export with error condition
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = NotionExportConfig(
-                vault_path=Path("/test/vault"),
-                output_path=Path(temp_dir) / "export.zip",
-                package_name="test_export",
-            )
+        config = NotionExportConfig(
+            vault_path=Path("/test/vault"),
+            output_path=tmp_path / "export.zip",
+            package_name="test_export",
+        )
 
-            result = use_case.export(config)
+        result = use_case.export(config)
 
-            # Then: Should handle error gracefully
-            assert not result.success
-            assert len(result.errors) > 0
-            assert "Transform failed" in str(result.errors[0])
+        # Then: Should handle error gracefully
+        assert not result.success
+        assert len(result.errors) > 0
+        assert "Transform failed" in str(result.errors[0])
 
-    def test_export_aggregates_warnings_from_all_stages(self):
+    def test_export_aggregates_warnings_from_all_stages(self, tmp_path):
         """
         Test that warnings from all pipeline stages are aggregated.
 
@@ -270,19 +266,18 @@ class TestNotionExportUseCase:
         )
 
         # When: Export with warning-producing content
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = NotionExportConfig(
-                vault_path=Path("/test/vault"),
-                output_path=Path(temp_dir) / "export.zip",
-                package_name="test_export",
-            )
+        config = NotionExportConfig(
+            vault_path=Path("/test/vault"),
+            output_path=tmp_path / "export.zip",
+            package_name="test_export",
+        )
 
-            result = use_case.export(config)
+        result = use_case.export(config)
 
-            # Then: Should aggregate warnings
-            assert "Transformer warning" in result.warnings
+        # Then: Should aggregate warnings
+        assert "Transformer warning" in result.warnings
 
-    def test_validate_only_mode_skips_package_generation(self):
+    def test_validate_only_mode_skips_package_generation(self, tmp_path):
         """
         Test validate-only mode that checks content without generating ZIP.
 
@@ -320,23 +315,22 @@ class TestNotionExportUseCase:
         )
 
         # When: Export in validate-only mode
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = NotionExportConfig(
-                vault_path=Path("/test/vault"),
-                output_path=Path(temp_dir) / "export.zip",
-                package_name="test_export",
-                validate_only=True,
-            )
-
-            result = use_case.export(config)
-
-            # Then: Should validate but not generate package
-            assert result.success
-            assert vault_analyzer.scan_vault.called
-            assert content_transformer.transform_content.called
-            assert not notion_package_generator.generate_package.called
-
-    def test_export_records_processing_metrics(self):
+        config = NotionExportConfig(
+            vault_path=Path("/test/vault"),
+            output_path=tmp_path / "export.zip",
+            package_name="test_export",
+            validate_only=True,
+        )
+
+        result = use_case.export(config)
+
+        # Then: Should validate but not generate package
+        assert result.success
+        assert vault_analyzer.scan_vault.called
+        assert content_transformer.transform_content.called
+        assert not notion_package_generator.generate_package.called
+
+    def test_export_records_processing_metrics(self, tmp_path):
         """
         Test that export records comprehensive processing metrics.
 
@@ -391,17 +385,16 @@ class TestNotionExportUseCase:
         )
 
         # When: Export vault
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = NotionExportConfig(
-                vault_path=Path("/test/vault"),
-                output_path=Path(temp_dir) / "export.zip",
-                package_name="test_export",
-            )
-
-            result = use_case.export(config)
-
-            # Then: Should record processing metrics
-            assert result.files_processed == 2
-            assert result.assets_processed == 1
-            assert result.processing_time > 0
-            assert result.vault_info is not None
+        config = NotionExportConfig(
+            vault_path=Path("/test/vault"),
+            output_path=tmp_path / "export.zip",
+            package_name="test_export",
+        )
+
+        result = use_case.export(config)
+
+        # Then: Should record processing metrics
+        assert result.files_processed == 2
+        assert result.assets_processed == 1
+        assert result.processing_time > 0
+        assert result.vault_info is not None
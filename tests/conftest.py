@@ -0,0 +1,79 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli import cli
+
+# Set to 1 to keep tempfile scratch files in /dev/shm (see ram_backed_tempdir)
+_RAM_TMP_ENV = "OBSIDIAN_EXPORTER_RAM_TMP"
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """
+    Click test runner shared by the CLI tests.
+
+    CliRunner keeps no state between invoke() calls (each one sets up its own
+    isolated streams and environment), so a single instance can be reused.
+    """
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def cli_help(runner):
+    """Result of `cli --help`, rendered once for the help-text tests."""
+    return runner.invoke(cli, ["--help"])
+
+
+@pytest.fixture(scope="session")
+def convert_help(runner):
+    """Result of `cli convert --help`, rendered once for the help-text tests."""
+    return runner.invoke(cli, ["convert", "--help"])
+
+
+@pytest.fixture(scope="session", autouse=True)
+def ram_backed_tempdir(tmp_path_factory):
+    """
+    Opt-in: route tempfile usage to /dev/shm when OBSIDIAN_EXPORTER_RAM_TMP=1.
+
+    Keeping scratch files in RAM avoids disk syncs and journaling, but
+    /dev/shm is small in containers (64 MB by default in Docker), so it is
+    never used unless asked for. pytest's own basetemp is resolved first and
+    left alone: tmp_path directories and the retention of failed tests'
+    directories are unaffected (pass --basetemp to move those).
+    """
+    if not (
+        os.environ.get(_RAM_TMP_ENV) == "1"
+        and sys.platform == "linux"
+        and os.access("/dev/shm", os.W_OK)
+    ):
+        yield None
+        return
+
+    # Pin pytest's basetemp before tempfile is redirected
+    tmp_path_factory.getbasetemp()
+
+    shm_dir = tempfile.mkdtemp(prefix=f"pytest-{os.getuid()}-", dir="/dev/shm")
+    previous_tempdir = tempfile.tempdir
+    previous_env = os.environ.get("TMPDIR")
+
+    tempfile.tempdir = shm_dir
+    os.environ["TMPDIR"] = shm_dir  # Inherited by subprocesses
+    try:
+        yield shm_dir
+    finally:
+        tempfile.tempdir = previous_tempdir
+        if previous_env is None:
+            os.environ.pop("TMPDIR", None)
+        else:
+            os.environ["TMPDIR"] = previous_env
+        # Only the tempfile scratch directory; pytest's basetemp lives elsewhere
+        shutil.rmtree(shm_dir, ignore_errors=True)
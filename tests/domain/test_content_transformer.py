@@ -32,7 +32,6 @@ class TestContentTransformer:
 
         # Mock wikilink parsing
         test_wikilink = WikiLink(
-            original="[[test-note]]",
             target="test-note",
             alias=None,
             header=None,
@@ -103,7 +102,6 @@ class TestContentTransformer:
         mock_vault_index = Mock()
 
         broken_wikilink = WikiLink(
-            original="[[nonexistent]]",
             target="nonexistent",
             alias=None,
             header=None,
@@ -234,7 +232,6 @@ This is the actual content of the note.
 
         # Mock embed wikilink
         embed_wikilink = WikiLink(
-            original="![[diagram.png]]",
             target="diagram.png",
             alias=None,
             header=None,
@@ -351,10 +348,10 @@ And a standard markdown image: ![alt text](./images/photo.jpg)
 
         # Multiple wikilinks
         wikilinks = [
-            WikiLink("[[note1]]", "note1", None, None, None, False),
-            WikiLink("[[note2|Alias]]", "note2", "Alias", None, None, False),
-            WikiLink("[[note3#Header]]", "note3", None, "Header", None, False),
-            WikiLink("![[image.png]]", "image.png", None, None, None, True),
+            WikiLink("note1", None, None, None, False),
+            WikiLink("note2", "Alias", None, None, False),
+            WikiLink("note3", None, "Header", None, False),
+            WikiLink("image.png", None, None, None, True),
         ]
         mock_wikilink_parser.extract_wikilinks.return_value = wikilinks
 
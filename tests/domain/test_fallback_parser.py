@@ -62,7 +62,6 @@ class TestFallbackParser:
 
         # Wikilink that failed standard resolution
         failed_wikilink = WikiLink(
-            original="[[Project Planning Note]]",
             target="Project Planning Note",
             alias=None,
             header=None,
@@ -101,7 +100,6 @@ class TestFallbackParser:
         parser = FallbackParser(llm_assistant=mock_llm)
 
         failed_wikilink = WikiLink(
-            original="[[Unknown Note]]",
             target="Unknown Note",
             alias=None,
             header=None,
@@ -223,7 +221,6 @@ class TestFallbackParser:
         parser = FallbackParser(llm_assistant=mock_llm, enable_cache=True)
 
         wikilink = WikiLink(
-            original="[[Cached Link]]",
             target="Cached Link",
             alias=None,
             header=None,
@@ -264,7 +261,6 @@ class TestFallbackParser:
         parser = FallbackParser(llm_assistant=mock_llm)
 
         wikilink = WikiLink(
-            original="[[ML Notes]]",
             target="ML Notes",
             alias=None,
             header=None,
@@ -307,9 +303,9 @@ class TestFallbackParser:
 
         # Multiple wikilinks that need fallback
         wikilinks = [
-            WikiLink("[[Note One]]", "Note One", None, None, None, False),
-            WikiLink("[[Note Two]]", "Note Two", None, None, None, False),
-            WikiLink("[[Note Three]]", "Note Three", None, None, None, False),
+            WikiLink(target="Note One"),
+            WikiLink(target="Note Two"),
+            WikiLink(target="Note Three"),
         ]
 
         # Mock individual processing responses
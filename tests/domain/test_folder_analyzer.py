@@ -125,6 +125,10 @@ class TestFolderAnalyzer:
         assert active_folder.parent_path == projects_folder.path
         assert len(active_folder.child_folders) == 0
 
+        # And: Each folder's Path is shared as its children's parent_path
+        assert active_folder.parent_path is projects_folder.path
+        assert projects_folder.parent_path is result.path
+
         # Verify file distribution
         assert result.markdown_files == [Path("/test/vault/index.md")]
         assert projects_folder.markdown_files == [
@@ -228,12 +232,6 @@ class TestVaultAnalyzerWithFolders:
                 Path("/test/vault/docs/readme.md"),
                 Path("/test/vault/image.png"),
             ],
-            # Third call: FolderAnalyzer calls for all files
-            [
-                Path("/test/vault/index.md"),
-                Path("/test/vault/docs/readme.md"),
-                Path("/test/vault/image.png"),
-            ],
         ]
 
         mock_wikilink_parser = Mock()
@@ -263,6 +261,9 @@ class TestVaultAnalyzerWithFolders:
         assert len(result.markdown_files) == 2
         assert len(result.asset_files) == 1
 
+        # And: Folder analysis reuses the scan's listing instead of its own
+        assert mock_file_system.list_files.call_count == 2
+
     def test_scan_vault_with_folders_builds_correct_folder_mapping(self):
         """Test that folder mapping correctly maps files to folders."""
         # Given: Vault with files in different folders
@@ -280,11 +281,6 @@ class TestVaultAnalyzerWithFolders:
                 Path("/test/vault/root.md"),
                 Path("/test/vault/folder/nested.md"),
             ],
-            # Third call: FolderAnalyzer all files
-            [
-                Path("/test/vault/root.md"),
-                Path("/test/vault/folder/nested.md"),
-            ],
         ]
 
         mock_wikilink_parser = Mock()
@@ -314,6 +310,73 @@ class TestVaultAnalyzerWithFolders:
         assert nested_folder.name == "folder"
         assert nested_folder.parent_path == vault_path
 
+    def test_scan_vault_with_folders_maps_unfoldered_files_to_root(self):
+        """Test markdown files outside the folder tree fall back to the root."""
+        # Given: A markdown file inside .obsidian, which the tree leaves out
+        vault_path = Path("/test/vault")
+        settings_note = Path("/test/vault/.obsidian/plugin.md")
+        files = [Path("/test/vault/a/note.md"), settings_note]
+        mock_file_system = Mock()
+        mock_file_system.directory_exists.return_value = True
+        mock_file_system.list_files.return_value = files
+
+        mock_wikilink_parser = Mock()
+        mock_wikilink_parser.extract_from_file.return_value = []
+
+        from src.domain.vault_analyzer import VaultAnalyzer
+
+        analyzer = VaultAnalyzer(
+            file_system=mock_file_system, wikilink_parser=mock_wikilink_parser
+        )
+
+        # When: We scan with folder support
+        result = analyzer.scan_vault_with_folders(vault_path)
+
+        # Then: Every markdown file is mapped, in markdown_files order
+        assert list(result.folder_mapping) == files
+        assert result.folder_mapping[files[0]].name == "a"
+        assert result.folder_mapping[settings_note] is result.root_folder
+
+    def test_scan_vault_with_folders_lists_folders_depth_first(self):
+        """Test all_folders lists every folder in pre-order from the root."""
+        # Given: Vault with folders nested three levels deep
+        vault_path = Path("/test/vault")
+        files = [
+            Path("/test/vault/a/x/deep/1.md"),
+            Path("/test/vault/a/2.md"),
+            Path("/test/vault/b/3.md"),
+        ]
+        mock_file_system = Mock()
+        mock_file_system.directory_exists.return_value = True
+        mock_file_system.list_files.return_value = files
+
+        mock_wikilink_parser = Mock()
+        mock_wikilink_parser.extract_from_file.return_value = []
+
+        from src.domain.vault_analyzer import VaultAnalyzer
+
+        analyzer = VaultAnalyzer(
+            file_system=mock_file_system, wikilink_parser=mock_wikilink_parser
+        )
+
+        # When: We scan with folder support
+        result = analyzer.scan_vault_with_folders(vault_path)
+
+        # Then: Folders appear root first, each followed by its subtree
+        def preorder(folder):
+            yield folder
+            for child in folder.child_folders:
+                yield from preorder(child)
+
+        assert result.all_folders == list(preorder(result.root_folder))
+        assert {folder.name for folder in result.all_folders} == {
+            "vault",
+            "a",
+            "x",
+            "deep",
+            "b",
+        }
+
     def test_scan_vault_with_folders_preserves_original_behavior(self):
         """Test that enhanced scanning preserves all original VaultStructure data."""
         # Given: Vault setup similar to original tests
@@ -325,8 +388,6 @@ class TestVaultAnalyzerWithFolders:
             [Path("/test/vault/note.md")],
             # Second call: scan_vault() all files
             [Path("/test/vault/note.md"), Path("/test/vault/image.png")],
-            # Third call: FolderAnalyzer all files
-            [Path("/test/vault/note.md"), Path("/test/vault/image.png")],
         ]
 
         mock_wikilink_parser = Mock()
@@ -328,3 +328,7 @@ class TestVaultStructureWithFolders:
         assert vault.folder_mapping[Path("/vault/root.md")] == root
         assert vault.folder_mapping[Path("/vault/folder/file1.md")] == folder
         assert vault.folder_mapping[Path("/vault/folder/file2.md")] == folder
+
+        # And: Folders can be looked up by path, from a map built once
+        assert vault.path_to_folder == {Path("/vault"): root, folder.path: folder}
+        assert vault.path_to_folder is vault.path_to_folder
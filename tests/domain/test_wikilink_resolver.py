@@ -37,7 +37,6 @@ class TestWikiLinkResolver:
         )
 
         wikilink = WikiLink(
-            original="[[folder/note]]",
             target="folder/note",
             alias=None,
             header=None,
@@ -78,7 +77,6 @@ class TestWikiLinkResolver:
         )
 
         wikilink = WikiLink(
-            original="[[note]]",
             target="note",
             alias=None,
             header=None,
@@ -113,7 +111,6 @@ class TestWikiLinkResolver:
         )
 
         wikilink = WikiLink(
-            original="[[note]]",
             target="note",
             alias=None,
             header=None,
@@ -150,7 +147,6 @@ class TestWikiLinkResolver:
         )
 
         wikilink = WikiLink(
-            original="[[nonexistent]]",
             target="nonexistent",
             alias=None,
             header=None,
@@ -188,7 +184,6 @@ class TestWikiLinkResolver:
 
         # Test header reference
         header_wikilink = WikiLink(
-            original="[[note#Introduction]]",
             target="note",
             alias=None,
             header="Introduction",
@@ -198,7 +193,6 @@ class TestWikiLinkResolver:
 
         # Test block reference
         block_wikilink = WikiLink(
-            original="[[note^block123]]",
             target="note",
             alias=None,
             header=None,
@@ -241,7 +235,6 @@ class TestWikiLinkResolver:
         )
 
         embed_wikilink = WikiLink(
-            original="![[image]]",
             target="image",
             alias=None,
             header=None,
@@ -279,7 +272,6 @@ class TestWikiLinkResolver:
         )
 
         wikilink = WikiLink(
-            original="[[folder/note]]",
             target="folder/note",
             alias=None,
             header=None,
@@ -328,7 +320,6 @@ class TestWikiLinkResolver:
 
         # Wikilink that fails exact and filename matching
         wikilink = WikiLink(
-            original="[[Project Plan]]",  # Similar to "project-planning" but not exact
             target="Project Plan",
             alias=None,
             header=None,
@@ -368,7 +359,6 @@ class TestWikiLinkResolver:
         )
 
         wikilink = WikiLink(
-            original="[[Nonexistent Note]]",
             target="Nonexistent Note",
             alias=None,
             header=None,
@@ -406,7 +396,6 @@ class TestWikiLinkResolver:
         mock_fallback_parser.resolve_wikilink_fallback.return_value = None
 
         wikilink = WikiLink(
-            original="[[Truly Nonexistent]]",
             target="Truly Nonexistent",
             alias=None,
             header=None,
@@ -8,7 +8,6 @@ for creating ZIP packages compatible with AppFlowy template import.
 import json
 import zipfile
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 from src.domain.models import AppFlowyPackage
 from src.infrastructure.generators.appflowy_package_generator import (
@@ -28,7 +27,7 @@ class TestAppFlowyPackageGenerator:
         generator = AppFlowyPackageGenerator()
         assert generator is not None
 
-    def test_generate_empty_package(self):
+    def test_generate_empty_package(self, tmp_path):
         """
         Test generating empty AppFlowy package.
 
@@ -43,20 +42,19 @@ class TestAppFlowyPackageGenerator:
             warnings=[],
         )
 
-        with TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "empty-package.zip"
-            result_path = generator.generate_package(package, output_path)
+        output_path = tmp_path / "empty-package.zip"
+        result_path = generator.generate_package(package, output_path)
 
-            assert result_path == output_path
-            assert output_path.exists()
-            assert zipfile.is_zipfile(output_path)
+        assert result_path == output_path
+        assert output_path.exists()
+        assert zipfile.is_zipfile(output_path)
 
-            # Check ZIP contents
-            with zipfile.ZipFile(output_path, "r") as zf:
-                files = zf.namelist()
-                assert "config.json" in files
+        # Check ZIP contents
+        with zipfile.ZipFile(output_path, "r") as zf:
+            files = zf.namelist()
+            assert "config.json" in files
 
-    def test_generate_package_with_documents(self):
+    def test_generate_package_with_documents(self, tmp_path):
         """
         Test generating package with AppFlowy documents.
 
@@ -98,23 +96,22 @@ class TestAppFlowyPackageGenerator:
             warnings=[],
         )
 
-        with TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "multi-doc.zip"
-            generator.generate_package(package, output_path)
+        output_path = tmp_path / "multi-doc.zip"
+        generator.generate_package(package, output_path)
 
-            # Verify ZIP structure
-            with zipfile.ZipFile(output_path, "r") as zf:
-                files = zf.namelist()
-                assert "config.json" in files
-                assert "documents/note1.json" in files
-                assert "documents/note2.json" in files
+        # Verify ZIP structure
+        with zipfile.ZipFile(output_path, "r") as zf:
+            files = zf.namelist()
+            assert "config.json" in files
+            assert "documents/note1.json" in files
+            assert "documents/note2.json" in files
 
-                # Verify document content
-                note1_content = json.loads(zf.read("documents/note1.json"))
-                assert note1_content["document"]["type"] == "page"
-                assert len(note1_content["document"]["children"]) == 1
+            # Verify document content
+            note1_content = json.loads(zf.read("documents/note1.json"))
+            assert note1_content["document"]["type"] == "page"
+            assert len(note1_content["document"]["children"]) == 1
 
-    def test_generate_package_with_assets(self):
+    def test_generate_package_with_assets(self, tmp_path):
         """
         Test generating package with asset files.
 
@@ -123,38 +120,36 @@ class TestAppFlowyPackageGenerator:
         generator = AppFlowyPackageGenerator()
 
         # Create temporary asset files
-        with TemporaryDirectory() as asset_dir:
-            asset_path = Path(asset_dir)
-
-            # Create test assets
-            image_file = asset_path / "test-image.png"
-            image_file.write_bytes(b"fake-png-data")
-
-            doc_file = asset_path / "document.pdf"
-            doc_file.write_bytes(b"fake-pdf-data")
-
-            package = AppFlowyPackage(
-                documents=[],
-                assets=[image_file, doc_file],
-                config={"name": "Asset Package"},
-                warnings=[],
-            )
-
-            with TemporaryDirectory() as temp_dir:
-                output_path = Path(temp_dir) / "assets.zip"
-                generator.generate_package(package, output_path)
-
-                # Verify assets in ZIP
-                with zipfile.ZipFile(output_path, "r") as zf:
-                    files = zf.namelist()
-                    assert "assets/test-image.png" in files
-                    assert "assets/document.pdf" in files
-
-                    # Verify asset content
-                    image_data = zf.read("assets/test-image.png")
-                    assert image_data == b"fake-png-data"
-
-    def test_generate_package_with_nested_assets(self):
+        asset_path = tmp_path
+
+        # Create test assets
+        image_file = asset_path / "test-image.png"
+        image_file.write_bytes(b"fake-png-data")
+
+        doc_file = asset_path / "document.pdf"
+        doc_file.write_bytes(b"fake-pdf-data")
+
+        package = AppFlowyPackage(
+            documents=[],
+            assets=[image_file, doc_file],
+            config={"name": "Asset Package"},
+            warnings=[],
+        )
+
+        output_path = tmp_path / "assets.zip"
+        generator.generate_package(package, output_path)
+
+        # Verify assets in ZIP
+        with zipfile.ZipFile(output_path, "r") as zf:
+            files = zf.namelist()
+            assert "assets/test-image.png" in files
+            assert "assets/document.pdf" in files
+
+            # Verify asset content
+            image_data = zf.read("assets/test-image.png")
+            assert image_data == b"fake-png-data"
+
+    def test_generate_package_with_nested_assets(self, tmp_path):
         """
         Test generating package with nested asset directory structure.
 
@@ -162,35 +157,33 @@ class TestAppFlowyPackageGenerator:
         """
         generator = AppFlowyPackageGenerator()
 
-        with TemporaryDirectory() as asset_dir:
-            asset_path = Path(asset_dir)
+        asset_path = tmp_path
 
-            # Create nested asset structure
-            (asset_path / "images").mkdir()
-            (asset_path / "docs").mkdir()
+        # Create nested asset structure
+        (asset_path / "images").mkdir()
+        (asset_path / "docs").mkdir()
 
-            img_file = asset_path / "images" / "nested.jpg"
-            img_file.write_bytes(b"nested-image")
+        img_file = asset_path / "images" / "nested.jpg"
+        img_file.write_bytes(b"nested-image")
 
-            pdf_file = asset_path / "docs" / "manual.pdf"
-            pdf_file.write_bytes(b"nested-pdf")
+        pdf_file = asset_path / "docs" / "manual.pdf"
+        pdf_file.write_bytes(b"nested-pdf")
 
-            package = AppFlowyPackage(
-                documents=[],
-                assets=[img_file, pdf_file],
-                config={"name": "Nested Assets"},
-                warnings=[],
-            )
+        package = AppFlowyPackage(
+            documents=[],
+            assets=[img_file, pdf_file],
+            config={"name": "Nested Assets"},
+            warnings=[],
+        )
 
-            with TemporaryDirectory() as temp_dir:
-                output_path = Path(temp_dir) / "nested.zip"
-                generator.generate_package(package, output_path)
+        output_path = tmp_path / "nested.zip"
+        generator.generate_package(package, output_path)
 
-                with zipfile.ZipFile(output_path, "r") as zf:
-                    files = zf.namelist()
-                    # Should preserve relative paths
-                    assert any("nested.jpg" in f for f in files)
-                    assert any("manual.pdf" in f for f in files)
+        with zipfile.ZipFile(output_path, "r") as zf:
+            files = zf.namelist()
+            # Should preserve relative paths
+            assert any("nested.jpg" in f for f in files)
+            assert any("manual.pdf" in f for f in files)
 
     def test_generate_config_json(self):
         """
@@ -242,7 +235,7 @@ class TestAppFlowyPackageGenerator:
         assert "photo.jpg" in asset_path
         assert asset_path.startswith("assets/")
 
-    def test_handle_file_conflicts(self):
+    def test_handle_file_conflicts(self, tmp_path):
         """
         Test handling of filename conflicts in package.
 
@@ -265,17 +258,16 @@ class TestAppFlowyPackageGenerator:
             warnings=[],
         )
 
-        with TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "conflicts.zip"
-            generator.generate_package(package, output_path)
+        output_path = tmp_path / "conflicts.zip"
+        generator.generate_package(package, output_path)
 
-            with zipfile.ZipFile(output_path, "r") as zf:
-                files = zf.namelist()
-                doc_files = [f for f in files if f.startswith("documents/")]
-                assert len(doc_files) == 2  # Both files should be present
-                assert len(set(doc_files)) == 2  # With different names
+        with zipfile.ZipFile(output_path, "r") as zf:
+            files = zf.namelist()
+            doc_files = [f for f in files if f.startswith("documents/")]
+            assert len(doc_files) == 2  # Both files should be present
+            assert len(set(doc_files)) == 2  # With different names
 
-    def test_validate_package_structure(self):
+    def test_validate_package_structure(self, tmp_path):
         """
         Test validation of generated package structure.
 
@@ -292,15 +284,14 @@ class TestAppFlowyPackageGenerator:
             warnings=[],
         )
 
-        with TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "validate.zip"
-            generator.generate_package(package, output_path)
+        output_path = tmp_path / "validate.zip"
+        generator.generate_package(package, output_path)
 
-            # Validate package structure
-            is_valid = generator.validate_package(output_path)
-            assert is_valid is True
+        # Validate package structure
+        is_valid = generator.validate_package(output_path)
+        assert is_valid is True
 
-    def test_package_size_limits(self):
+    def test_package_size_limits(self, tmp_path):
         """
         Test handling of large packages near size limits.
 
@@ -325,14 +316,13 @@ class TestAppFlowyPackageGenerator:
             warnings=[],
         )
 
-        with TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "large.zip"
-            generator.generate_package(package, output_path)
+        output_path = tmp_path / "large.zip"
+        generator.generate_package(package, output_path)
 
-            assert output_path.exists()
-            # Should handle large content without errors
+        assert output_path.exists()
+        # Should handle large content without errors
 
-    def test_preserve_warnings_in_package(self):
+    def test_preserve_warnings_in_package(self, tmp_path):
         """
         Test preserving conversion warnings in package metadata.
 
@@ -353,23 +343,22 @@ class TestAppFlowyPackageGenerator:
             warnings=warnings,
         )
 
-        with TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "warnings.zip"
-            generator.generate_package(package, output_path)
+        output_path = tmp_path / "warnings.zip"
+        generator.generate_package(package, output_path)
 
-            with zipfile.ZipFile(output_path, "r") as zf:
-                files = zf.namelist()
+        with zipfile.ZipFile(output_path, "r") as zf:
+            files = zf.namelist()
 
-                # Warnings should be preserved somewhere
-                if "warnings.txt" in files:
-                    warning_content = zf.read("warnings.txt").decode()
-                    assert "Broken link detected" in warning_content
-                else:
-                    # Or in config.json
-                    config_content = json.loads(zf.read("config.json"))
-                    assert "warnings" in config_content
+            # Warnings should be preserved somewhere
+            if "warnings.txt" in files:
+                warning_content = zf.read("warnings.txt").decode()
+                assert "Broken link detected" in warning_content
+            else:
+                # Or in config.json
+                config_content = json.loads(zf.read("config.json"))
+                assert "warnings" in config_content
 
-    def test_generate_package_with_custom_output_name(self):
+    def test_generate_package_with_custom_output_name(self, tmp_path):
         """
         Test generating package with custom output filename.
 
@@ -381,15 +370,14 @@ class TestAppFlowyPackageGenerator:
             documents=[], assets=[], config={"name": "Custom Name"}, warnings=[]
         )
 
-        with TemporaryDirectory() as temp_dir:
-            custom_path = Path(temp_dir) / "my-custom-export.zip"
-            result_path = generator.generate_package(package, custom_path)
+        custom_path = tmp_path / "my-custom-export.zip"
+        result_path = generator.generate_package(package, custom_path)
 
-            assert result_path == custom_path
-            assert custom_path.exists()
-            assert custom_path.name == "my-custom-export.zip"
+        assert result_path == custom_path
+        assert custom_path.exists()
+        assert custom_path.name == "my-custom-export.zip"
 
-    def test_error_handling_invalid_package(self):
+    def test_error_handling_invalid_package(self, tmp_path):
         """
         Test error handling for invalid package data.
 
@@ -405,17 +393,16 @@ class TestAppFlowyPackageGenerator:
             warnings=[],
         )
 
-        with TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "invalid.zip"
-
-            # Should handle gracefully or raise appropriate exception
-            try:
-                generator.generate_package(invalid_package, output_path)
-                # If it doesn't raise, should still create some output
-                assert output_path.exists()
-            except (ValueError, KeyError) as e:
-                # Expected for malformed input
-                assert "invalid" in str(e).lower() or "missing" in str(e).lower()
+        output_path = tmp_path / "invalid.zip"
+
+        # Should handle gracefully or raise appropriate exception
+        try:
+            generator.generate_package(invalid_package, output_path)
+            # If it doesn't raise, should still create some output
+            assert output_path.exists()
+        except (ValueError, KeyError) as e:
+            # Expected for malformed input
+            assert "invalid" in str(e).lower() or "missing" in str(e).lower()
 
     def test_zip_compression_settings(self):
         """
@@ -5,7 +5,10 @@ Following TDD approach - these tests define the expected behavior
 for parsing and transforming Obsidian block references to AppFlowy format.
 """
 
-from src.infrastructure.parsers.block_reference_parser import BlockReferenceParser
+from src.infrastructure.parsers.block_reference_parser import (
+    BlockReferenceParser,
+    _transform_block_references_cached,
+)
 
 
 class TestBlockReferenceParser:
@@ -197,6 +200,24 @@ Content with mixed. <!-- block: mixed-ref_789 -->"""
             result = parser.transform_block_references(input_content)
             assert result == expected_output
 
+    def test_block_reference_on_its_own_line_joins_previous_line(self):
+        """
+        Test that whitespace before ^ may span line breaks and indentation.
+
+        A block reference on the line after its content is attached to that
+        content, and an indented standalone reference drops its indentation.
+        """
+        parser = BlockReferenceParser()
+        test_cases = [
+            ("Content\n^abc", "Content <!-- block: abc -->"),
+            ("Content\n  ^abc", "Content <!-- block: abc -->"),
+            ("  ^abc", "<!-- block: abc -->"),
+        ]
+
+        for input_content, expected_output in test_cases:
+            result = parser.transform_block_references(input_content)
+            assert result == expected_output
+
     def test_no_transformation_without_block_references(self):
         """
         Test that content without block references remains unchanged.
@@ -268,3 +289,42 @@ Final paragraph."""
 
         result = parser.transform_block_references(content)
         assert result == expected
+
+    def test_large_content_bypasses_parse_cache(self):
+        """
+        Test that oversized notes are transformed without being cached.
+
+        Small notes are cached by content; large ones must not pin memory.
+        """
+        parser = BlockReferenceParser()
+        line = "Some repeated paragraph text for a very large note.\n"
+        content = line * 2000 + "Final line ^end"
+        cached_before = _transform_block_references_cached.cache_info().currsize
+
+        result = parser.transform_block_references(content)
+
+        assert result.endswith("Final line <!-- block: end -->")
+        assert _transform_block_references_cached.cache_info().currsize == cached_before
+
+    def test_subclass_customisations_apply_to_short_notes(self):
+        """
+        Test that subclass overrides are honoured for notes of any size.
+
+        Short notes are normally served from a cache of base-class results,
+        which must not hide a subclass's code block detection.
+        """
+
+        class NoCodeBlocksParser(BlockReferenceParser):
+            def _find_code_block_regions(self, content):
+                return []
+
+        content = "```\ncode ^ref\n```"
+        # Given: The base parser's result for this content is already cached
+        assert BlockReferenceParser().transform_block_references(content) == content
+
+        # Then: The subclass still applies its own code block detection
+        result = NoCodeBlocksParser().transform_block_references(content)
+        assert result == "```\ncode <!-- block: ref -->\n```"
+
+        # And: Subclass results do not leak into the shared cache
+        assert _transform_block_references_cached(content) == content
@@ -5,7 +5,10 @@ Following TDD approach - these tests define the expected behavior
 for parsing and transforming Obsidian callouts to AppFlowy format.
 """
 
-from src.infrastructure.parsers.callout_parser import CalloutParser
+from src.infrastructure.parsers.callout_parser import (
+    CalloutParser,
+    _transform_callouts_cached,
+)
 
 
 class TestCalloutParser:
@@ -300,3 +303,31 @@ Final paragraph."""
         # Callouts should be transformed
         assert "> 💡 **Pro Tip:**" in result
         assert "> ⚠️ **Warning:**" in result
+
+    def test_subclass_customisations_apply_to_short_notes(self):
+        """
+        Test that subclass overrides are honoured for notes of any size.
+
+        Short notes are normally served from a cache of base-class results,
+        which must not hide a subclass's mappings or prefixes.
+        """
+
+        class CustomMappingParser(CalloutParser):
+            CALLOUT_MAPPINGS = {"note": "🗒️ **Memo:**"}
+
+        class CustomPrefixParser(CalloutParser):
+            def _get_callout_prefix(self, callout_type, custom_title=""):
+                return f"[{callout_type}]"
+
+        content = "> [!note]\n> Short note."
+        # Given: The base parser's result for this content is already cached
+        assert CalloutParser().transform_callouts(content).startswith("> 📝")
+
+        # Then: Subclasses still apply their own customisations
+        result = CustomMappingParser().transform_callouts(content)
+        assert result == "> 🗒️ **Memo:**\n> Short note."
+        result = CustomPrefixParser().transform_callouts(content)
+        assert result == "> [note]\n> Short note."
+
+        # And: Subclass results do not leak into the shared cache
+        assert _transform_callouts_cached(content).startswith("> 📝")
@@ -6,9 +6,13 @@ for AST-based wikilink extraction from Obsidian markdown.
 """
 
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from src.infrastructure.parsers.wikilink_parser import WikiLinkParser
+from src.infrastructure.parsers.wikilink_parser import (
+    WikiLinkParser,
+    _extract_wikilinks_cached,
+)
 
 
 class TestWikiLinkParser:
@@ -115,6 +119,32 @@ class TestWikiLinkParser:
         assert link.block_id is None
         assert link.is_embed is False
 
+    def test_original_rebuilt_from_components(self):
+        """Test canonical wikilinks don't retain their source text."""
+        parser = WikiLinkParser()
+        content = "Read [[Topics#Intro|intro]] and ![[diagram.png]]."
+
+        result = parser.extract_wikilinks(content)
+
+        assert [link.original for link in result] == [
+            "[[Topics#Intro|intro]]",
+            "![[diagram.png]]",
+        ]
+        assert all(link.source is None for link in result)
+
+    def test_original_preserves_non_canonical_source(self):
+        """Test wikilinks with extra whitespace keep their exact source text."""
+        parser = WikiLinkParser()
+        content = "See [[ Spaced Note | alias ]] here."
+
+        result = parser.extract_wikilinks(content)
+
+        assert len(result) == 1
+        link = result[0]
+        assert link.target == "Spaced Note"
+        assert link.alias == "alias"
+        assert link.original == "[[ Spaced Note | alias ]]"
+
     def test_extract_multiple_wikilinks(self):
         """Test extraction of multiple wikilinks in same content."""
         parser = WikiLinkParser()
@@ -221,3 +251,53 @@ class TestWikiLinkParser:
         targets = [link.target for link in result]
         assert "Good Link" in targets
         assert "Another Good Link" in targets
+
+    def test_repeated_extraction_uses_parse_cache(self):
+        """Test unchanged content is served from the parse cache."""
+        parser = WikiLinkParser()
+        content = "Links to [[First]] and [[Second|alias]]."
+        _extract_wikilinks_cached.cache_clear()
+
+        first = parser.extract_wikilinks(content)
+        first.clear()  # Mutating a result must not poison the cache
+        second = parser.extract_wikilinks(content)
+
+        assert [link.target for link in second] == ["First", "Second"]
+        assert _extract_wikilinks_cached.cache_info().hits == 1
+
+        # And: The cache is shared, so a fresh parser hits it as well
+        third = WikiLinkParser().extract_wikilinks(content)
+        assert [link.target for link in third] == ["First", "Second"]
+        assert _extract_wikilinks_cached.cache_info().hits == 2
+
+    def test_cached_extraction_is_thread_safe(self):
+        """Test parsers in different threads never see each other's links."""
+        _extract_wikilinks_cached.cache_clear()
+        contents = [f"Note {i} links to [[Target {i}]]." for i in range(200)]
+
+        def extract_targets(content):
+            return [link.target for link in WikiLinkParser().extract_wikilinks(content)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(extract_targets, contents))
+
+        assert results == [[f"Target {i}"] for i in range(200)]
+
+    def test_subclass_customisations_apply_to_short_notes(self):
+        """Test that a subclass's extraction is not replaced by cached results."""
+
+        class EmbedsOnlyParser(WikiLinkParser):
+            def _extract_wikilinks(self, content):
+                links = super()._extract_wikilinks(content)
+                return tuple(link for link in links if link.is_embed)
+
+        content = "See [[Note]] and ![[image.png]]."
+        # Given: The base parser's result for this content is already cached
+        assert len(WikiLinkParser().extract_wikilinks(content)) == 2
+
+        # Then: The subclass still applies its own extraction
+        result = EmbedsOnlyParser().extract_wikilinks(content)
+        assert [link.target for link in result] == ["image.png"]
+
+        # And: Subclass results do not leak into the shared cache
+        assert len(_extract_wikilinks_cached(content)) == 2
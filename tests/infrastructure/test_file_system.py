@@ -5,93 +5,153 @@ These integration tests validate the file system adapter
 using real filesystem operations.
 """
 
-import tempfile
+import os
 from pathlib import Path
 
+import pytest
+
 from src.infrastructure.file_system import FileSystemAdapter
 
 
+def _mktouch(path: Path) -> None:
+    """Create an empty file with one open/close (Path.touch also calls utime)."""
+    os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+
+
+def _resolve_kind(root: Path, kind: str) -> Path:
+    """Map a parametrize id to a directory, a file, or a missing path."""
+    return {
+        "dir": root,
+        "file": root / "existing.txt",
+        "missing": root / "nonexistent",
+    }[kind]
+
+
+@pytest.fixture(scope="module")
+def adapter():
+    """Stateless adapter shared by every test in this module."""
+    return FileSystemAdapter()
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """Read-only directory (containing one file) shared across tests."""
+    directory = tmp_path_factory.mktemp("fs_ro")
+    (directory / "existing.txt").touch()
+    return directory
+
+
 class TestFileSystemAdapter:
     """Integration tests for FileSystemAdapter."""
 
-    def test_directory_exists_returns_true_for_existing_directory(self):
-        """Test that directory_exists returns True for an existing directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            adapter = FileSystemAdapter()
-            result = adapter.directory_exists(Path(temp_dir))
-            assert result is True
-
-    def test_directory_exists_returns_false_for_nonexistent_directory(self):
-        """Test that directory_exists returns False for a non-existent directory."""
-        adapter = FileSystemAdapter()
-        result = adapter.directory_exists(Path("/nonexistent/directory"))
-        assert result is False
-
-    def test_directory_exists_returns_false_for_file(self):
-        """Test that directory_exists returns False when path points to a file."""
-        with tempfile.NamedTemporaryFile() as temp_file:
-            adapter = FileSystemAdapter()
-            result = adapter.directory_exists(Path(temp_file.name))
-            assert result is False
-
-    def test_file_exists_returns_true_for_existing_file(self):
-        """Test that file_exists returns True for an existing file."""
-        with tempfile.NamedTemporaryFile() as temp_file:
-            adapter = FileSystemAdapter()
-            result = adapter.file_exists(Path(temp_file.name))
-            assert result is True
-
-    def test_file_exists_returns_false_for_nonexistent_file(self):
-        """Test that file_exists returns False for a non-existent file."""
-        adapter = FileSystemAdapter()
-        result = adapter.file_exists(Path("/nonexistent/file.txt"))
-        assert result is False
-
-    def test_file_exists_returns_false_for_directory(self):
-        """Test that file_exists returns False when path points to a directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            adapter = FileSystemAdapter()
-            result = adapter.file_exists(Path(temp_dir))
-            assert result is False
-
-    def test_list_files_returns_empty_for_nonexistent_directory(self):
+    @pytest.mark.parametrize(
+        "kind,expected", [("dir", True), ("missing", False), ("file", False)]
+    )
+    def test_directory_exists(self, adapter, shared_tmp, kind, expected):
+        """Test directory_exists is True only for an existing directory."""
+        path = _resolve_kind(shared_tmp, kind)
+        assert adapter.directory_exists(path) is expected
+
+    @pytest.mark.parametrize(
+        "kind,expected", [("file", True), ("missing", False), ("dir", False)]
+    )
+    def test_file_exists(self, adapter, shared_tmp, kind, expected):
+        """Test file_exists is True only for an existing regular file."""
+        path = _resolve_kind(shared_tmp, kind)
+        assert adapter.file_exists(path) is expected
+
+    def test_list_files_returns_empty_for_nonexistent_directory(self, adapter):
         """Test that list_files returns empty list for non-existent directory."""
-        adapter = FileSystemAdapter()
         result = adapter.list_files(Path("/nonexistent/directory"))
         assert result == []
 
-    def test_list_files_returns_files_in_directory(self):
+    def test_list_files_returns_files_in_directory(self, adapter, tmp_path):
         """Test that list_files returns files in an existing directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create test files
-            (temp_path / "file1.txt").touch()
-            (temp_path / "file2.md").touch()
-            (temp_path / "subdir").mkdir()
+        # Create test files
+        _mktouch(tmp_path / "file1.txt")
+        _mktouch(tmp_path / "file2.md")
+        (tmp_path / "subdir").mkdir()
 
-            adapter = FileSystemAdapter()
-            result = adapter.list_files(temp_path)
+        result = adapter.list_files(tmp_path)
 
-            # Should return all items (files and directories)
-            assert len(result) == 3
-            assert any(f.name == "file1.txt" for f in result)
-            assert any(f.name == "file2.md" for f in result)
-            assert any(f.name == "subdir" for f in result)
+        # Should return all items (files and directories)
+        assert len(result) == 3
+        assert any(f.name == "file1.txt" for f in result)
+        assert any(f.name == "file2.md" for f in result)
+        assert any(f.name == "subdir" for f in result)
 
-    def test_list_files_with_pattern_filters_correctly(self):
+    def test_list_files_with_pattern_filters_correctly(self, adapter, tmp_path):
         """Test that list_files respects the pattern parameter."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create test files
-            (temp_path / "file1.txt").touch()
-            (temp_path / "file2.md").touch()
-            (temp_path / "document.md").touch()
-
-            adapter = FileSystemAdapter()
-            result = adapter.list_files(temp_path, "*.md")
-
-            # Should return only .md files
-            assert len(result) == 2
-            assert all(f.suffix == ".md" for f in result)
+        # Create test files
+        _mktouch(tmp_path / "file1.txt")
+        _mktouch(tmp_path / "file2.md")
+        _mktouch(tmp_path / "document.md")
+
+        result = adapter.list_files(tmp_path, "*.md")
+
+        # Should return only .md files
+        assert len(result) == 2
+        assert all(f.suffix == ".md" for f in result)
+
+    def test_list_files_with_wildcard_and_recursive_patterns(self, adapter, tmp_path):
+        """Test list_files handles non-suffix and recursive glob patterns."""
+        _mktouch(tmp_path / "file1.txt")
+        _mktouch(tmp_path / "notes.txt")
+        (tmp_path / "subdir").mkdir()
+        _mktouch(tmp_path / "subdir" / "file2.txt")
+
+        wildcard = adapter.list_files(tmp_path, "file?.txt")
+        recursive = adapter.list_files(tmp_path, "**/file*.txt")
+
+        assert [f.name for f in wildcard] == ["file1.txt"]
+        assert sorted(f.name for f in recursive) == ["file1.txt", "file2.txt"]
+
+    def test_recursive_name_pattern_matches_pathlib_glob(self, adapter, tmp_path):
+        """Test the scandir walk for "**/<name>" agrees with Path.glob."""
+        for directory in ("a/b", "a/c.md", ".hidden", "z"):
+            (tmp_path / directory).mkdir(parents=True)
+        for name in ("root.md", "a/one.md", "a/b/two.md", ".hidden/three.md"):
+            _mktouch(tmp_path / name)
+        _mktouch(tmp_path / "z" / "image.png")
+        (tmp_path / "linked.md").symlink_to(tmp_path / "a", target_is_directory=True)
+
+        for pattern in ("**/*.md", "**/*.*", "**/two.md"):
+            result = adapter.list_files(tmp_path, pattern)
+            assert result == list(tmp_path.glob(pattern)), pattern
+
+    def test_prune_hidden_dirs_skips_dot_directories(self, tmp_path):
+        """Test prune_hidden_dirs leaves dot-directories out of recursive walks."""
+        for directory in (".obsidian/plugins", ".trash", "notes"):
+            (tmp_path / directory).mkdir(parents=True)
+        for name in (".obsidian/plugins/readme.md", ".trash/old.md", "notes/a.md"):
+            _mktouch(tmp_path / name)
+        _mktouch(tmp_path / ".hidden.md")
+
+        pruning = FileSystemAdapter(prune_hidden_dirs=True)
+
+        # Hidden files are still listed; only hidden directories are pruned
+        assert sorted(pruning.list_files(tmp_path, "**/*.md")) == [
+            tmp_path / ".hidden.md",
+            tmp_path / "notes" / "a.md",
+        ]
+        listed = pruning.list_files(tmp_path, "**/*.*")
+        assert ".obsidian" not in {path.name for path in listed}
+
+        # And: The default adapter still lists everything, like Path.glob
+        assert len(FileSystemAdapter().list_files(tmp_path, "**/*.md")) == 4
+
+    def test_threaded_walk_matches_sequential_walk(self, tmp_path):
+        """Test scan_workers walks subtrees concurrently in sequential order."""
+        for directory in ("a/b", "c", "d/e/f", ".obsidian", "g"):
+            (tmp_path / directory).mkdir(parents=True)
+        for name in ("root.md", "a/one.md", "a/b/two.md", "d/e/f/three.md"):
+            _mktouch(tmp_path / name)
+        _mktouch(tmp_path / ".obsidian" / "app.md")
+
+        for prune in (False, True):
+            sequential = FileSystemAdapter(prune_hidden_dirs=prune)
+            threaded = FileSystemAdapter(prune_hidden_dirs=prune, scan_workers=3)
+            for pattern in ("**/*.md", "**/*"):
+                assert threaded.list_files(tmp_path, pattern) == (
+                    sequential.list_files(tmp_path, pattern)
+                ), (prune, pattern)
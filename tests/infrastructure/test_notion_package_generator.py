@@ -8,9 +8,10 @@ CRITICAL: All tests verify the precise ZIP structure, file naming, and content
 requirements for successful AppFlowy web import.
 """
 
-import tempfile
+import io
 import zipfile
-from pathlib import Path
+
+import pytest
 
 from src.domain.models import NotionPackage
 from src.infrastructure.generators.notion_package_generator import (
@@ -18,6 +19,50 @@ from src.infrastructure.generators.notion_package_generator import (
 )
 
 
+def _build_zip(
+    generator: NotionPackageGenerator, package: NotionPackage
+) -> zipfile.ZipFile:
+    """Generate a package into memory and open it, skipping the disk round-trip."""
+    buffer = io.BytesIO()
+    generator.write_package(package, buffer)
+    buffer.seek(0)
+    return zipfile.ZipFile(buffer, "r")
+
+
+def _doc(title: str, id32: str, content: str, path: str = "") -> dict:
+    """Build a Notion document dict named "<title> <id32>.md"."""
+    name = f"{title} {id32}.md"
+    return {"name": name, "content": content, "path": path or name}
+
+
+@pytest.fixture(scope="session")
+def canonical_notion_zip(tmp_path_factory):
+    """
+    Representative Notion package generated once for read-only ZIP assertions.
+
+    Tests that only inspect the generated archive share this artifact instead
+    of re-running the generator.
+    """
+    nested_id = "abc123def45678901234567890123456"
+    notion_documents = [
+        _doc(
+            "My Page",
+            "6db51a77742b4b11bedb1f0e02e27af8",
+            "# My Page\n\nThis is page content.\n",
+        ),
+        _doc(
+            "Nested Page",
+            nested_id,
+            "# Nested Page\n\nNested content.\n",
+            path=f"Parent Dir {nested_id}/Nested Page {nested_id}.md",
+        ),
+    ]
+    package = NotionPackage(documents=notion_documents, assets=[], warnings=[])
+
+    output_path = tmp_path_factory.mktemp("notion") / "notion_export.zip"
+    return NotionPackageGenerator().generate_package(package, output_path)
+
+
 class TestNotionPackageGenerator:
     """Test suite validating EXACT Notion ZIP package generation."""
 
@@ -32,61 +77,39 @@ class TestNotionPackageGenerator:
 
         assert generator is not None
 
-    def test_generate_notion_zip_package_exact_structure(self):
+    def test_generate_notion_zip_package_exact_structure(self, canonical_notion_zip):
         """
         Test generating Notion ZIP with EXACT structure AppFlowy expects.
 
         CRITICAL: ZIP must contain markdown files with exact naming format.
         No config.json or documents/ directory - just markdown files directly.
         """
-        generator = NotionPackageGenerator()
-
-        # Given: NotionPackage with exact format documents
-        notion_documents = [
-            {
-                "name": "My Page 6db51a77742b4b11bedb1f0e02e27af8.md",
-                "content": "# My Page\n\nThis is page content.\n",
-                "path": "My Page 6db51a77742b4b11bedb1f0e02e27af8.md",
-            },
-            {
-                "name": "Nested Page abc123def456789012345678901234567.md",
-                "content": "# Nested Page\n\nNested content.\n",
-                "path": "Parent Dir abc123def456789012345678901234567/Nested Page abc123def456789012345678901234567.md",
-            },
-        ]
-
-        package = NotionPackage(documents=notion_documents, assets=[], warnings=[])
-
-        # When: Generate ZIP package
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "notion_export.zip"
-            result_path = generator.generate_package(package, output_path)
-
-            # Then: ZIP must exist and be valid
-            assert result_path.exists()
-            assert zipfile.is_zipfile(result_path)
-
-            # Validate exact ZIP structure
-            with zipfile.ZipFile(result_path, "r") as zf:
-                files = zf.namelist()
-
-                # Should contain markdown files directly (no documents/ directory)
-                assert "My Page 6db51a77742b4b11bedb1f0e02e27af8.md" in files
-                assert (
-                    "Parent Dir abc123def456789012345678901234567/Nested Page abc123def456789012345678901234567.md"
-                    in files
-                )
+        # Given/When: Canonical package generated from exact format documents
+        result_path = canonical_notion_zip
+
+        # Then: ZIP must exist and be valid
+        assert result_path.exists()
+        assert zipfile.is_zipfile(result_path)
+
+        # Validate exact ZIP structure
+        with zipfile.ZipFile(result_path, "r") as zf:
+            files = set(zf.namelist())
+
+            # Should contain markdown files directly (no documents/ directory)
+            assert "My Page 6db51a77742b4b11bedb1f0e02e27af8.md" in files
+            assert (
+                "Parent Dir abc123def45678901234567890123456/Nested Page abc123def45678901234567890123456.md"
+                in files
+            )
 
-                # Should NOT contain config.json (Notion format doesn't use it)
-                assert "config.json" not in files
+            # Should NOT contain config.json (Notion format doesn't use it)
+            assert "config.json" not in files
 
-                # Validate content matches exactly
-                content1 = zf.read(
-                    "My Page 6db51a77742b4b11bedb1f0e02e27af8.md"
-                ).decode("utf-8")
-                assert content1 == "# My Page\n\nThis is page content.\n"
+            # Validate content matches exactly
+            content1 = zf.read("My Page 6db51a77742b4b11bedb1f0e02e27af8.md")
+            assert content1 == b"# My Page\n\nThis is page content.\n"
 
-    def test_generate_package_with_assets_exact_paths(self):
+    def test_generate_package_with_assets_exact_paths(self, tmp_path):
         """
         Test asset handling with EXACT path structure.
 
@@ -95,40 +118,31 @@ class TestNotionPackageGenerator:
         """
         generator = NotionPackageGenerator()
 
-        # Given: Package with assets
-        test_asset = Path("test_image.png")
+        # Given: Package with an asset file
+        test_asset = tmp_path / "test_image.png"
+        test_asset.write_bytes(b"fake_png_data")
         notion_documents = [
-            {
-                "name": "Image Page 1234567890abcdef1234567890abcdef.md",
-                "content": "# Image Page\n\n![Test](Image%20Page%201234567890abcdef1234567890abcdef/test_image.png)\n",
-                "path": "Image Page 1234567890abcdef1234567890abcdef.md",
-            }
+            _doc(
+                "Image Page",
+                "1234567890abcdef1234567890abcdef",
+                "# Image Page\n\n![Test](Image%20Page%201234567890abcdef1234567890abcdef/test_image.png)\n",
+            )
         ]
 
         package = NotionPackage(
             documents=notion_documents, assets=[test_asset], warnings=[]
         )
 
-        # Create temporary asset file
-        with tempfile.TemporaryDirectory() as temp_dir:
-            asset_path = Path(temp_dir) / "test_image.png"
-            asset_path.write_bytes(b"fake_png_data")
-            package = NotionPackage(
-                documents=notion_documents, assets=[asset_path], warnings=[]
-            )
+        # When/Then: Assets should be in correct directory structure
+        with _build_zip(generator, package) as zf:
+            files = set(zf.namelist())
 
-            output_path = Path(temp_dir) / "notion_with_assets.zip"
-            result_path = generator.generate_package(package, output_path)
-
-            # Then: Assets should be in correct directory structure
-            with zipfile.ZipFile(result_path, "r") as zf:
-                files = zf.namelist()
-
-                # Asset should be in page directory (URL-decoded for ZIP structure)
-                expected_asset_path = (
-                    "Image Page 1234567890abcdef1234567890abcdef/test_image.png"
-                )
-                assert expected_asset_path in files
+            # Asset should be in page directory (URL-decoded for ZIP structure)
+            expected_asset_path = (
+                "Image Page 1234567890abcdef1234567890abcdef/test_image.png"
+            )
+            assert expected_asset_path in files
+            assert zf.read(expected_asset_path) == b"fake_png_data"
 
     def test_generate_empty_package_gracefully(self):
         """
@@ -141,19 +155,11 @@ class TestNotionPackageGenerator:
         # Given: Empty NotionPackage
         package = NotionPackage(documents=[], assets=[], warnings=[])
 
-        # When: Generate ZIP package
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "empty_notion.zip"
-            result_path = generator.generate_package(package, output_path)
-
-            # Then: Should create valid but empty ZIP
-            assert result_path.exists()
-            assert zipfile.is_zipfile(result_path)
-
-            with zipfile.ZipFile(result_path, "r") as zf:
-                files = zf.namelist()
-                # May contain warnings.txt if warnings present, otherwise empty
-                assert len(files) == 0
+        # When/Then: Should create valid but empty ZIP
+        with _build_zip(generator, package) as zf:
+            files = set(zf.namelist())
+            # May contain warnings.txt if warnings present, otherwise empty
+            assert len(files) == 0
 
     def test_include_warnings_when_present(self):
         """
@@ -170,21 +176,16 @@ class TestNotionPackageGenerator:
             warnings=["Warning 1: Wikilink not resolved", "Warning 2: Image not found"],
         )
 
-        # When: Generate ZIP package
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "notion_with_warnings.zip"
-            result_path = generator.generate_package(package, output_path)
-
-            # Then: Should include warnings.txt
-            with zipfile.ZipFile(result_path, "r") as zf:
-                files = zf.namelist()
-                assert "warnings.txt" in files
+        # When/Then: Should include warnings.txt
+        with _build_zip(generator, package) as zf:
+            files = set(zf.namelist())
+            assert "warnings.txt" in files
 
-                warnings_content = zf.read("warnings.txt").decode("utf-8")
-                assert "Warning 1: Wikilink not resolved" in warnings_content
-                assert "Warning 2: Image not found" in warnings_content
+            warnings_content = zf.read("warnings.txt")
+            assert b"Warning 1: Wikilink not resolved" in warnings_content
+            assert b"Warning 2: Image not found" in warnings_content
 
-    def test_validate_notion_package_structure(self):
+    def test_validate_notion_package_structure(self, canonical_notion_zip):
         """
         Test package validation for Notion format.
 
@@ -192,25 +193,12 @@ class TestNotionPackageGenerator:
         """
         generator = NotionPackageGenerator()
 
-        # Given: Valid Notion package
-        notion_documents = [
-            {
-                "name": "Test Page abcdef1234567890abcdef1234567890.md",
-                "content": "# Test\n",
-                "path": "Test Page abcdef1234567890abcdef1234567890.md",
-            }
-        ]
-        package = NotionPackage(documents=notion_documents, assets=[], warnings=[])
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "valid_notion.zip"
-            generator.generate_package(package, output_path)
+        # When: Validate the canonical (valid) Notion package
+        is_valid = generator.validate_package(canonical_notion_zip)
 
-            # When: Validate package
-            is_valid = generator.validate_package(output_path)
-
-            # Then: Should be valid
-            assert is_valid
+        # Then: Should be valid, whether given as a path or raw bytes
+        assert is_valid
+        assert generator.validate_package(canonical_notion_zip.read_bytes())
 
     def test_reject_invalid_zip_files(self):
         """
@@ -220,16 +208,14 @@ class TestNotionPackageGenerator:
         """
         generator = NotionPackageGenerator()
 
-        # Given: Invalid file (not a ZIP)
-        with tempfile.TemporaryDirectory() as temp_dir:
-            invalid_path = Path(temp_dir) / "invalid.zip"
-            invalid_path.write_text("This is not a ZIP file")
+        # Given: Invalid data (not a ZIP)
+        invalid_data = b"This is not a ZIP file"
 
-            # When: Validate invalid file
-            is_valid = generator.validate_package(invalid_path)
+        # When: Validate invalid data
+        is_valid = generator.validate_package(invalid_data)
 
-            # Then: Should be invalid
-            assert not is_valid
+        # Then: Should be invalid
+        assert not is_valid
 
     def test_handle_duplicate_filenames_in_zip(self):
         """
@@ -241,29 +227,16 @@ class TestNotionPackageGenerator:
 
         # Given: Documents that would create duplicate ZIP paths
         notion_documents = [
-            {
-                "name": "Same Name 1234567890abcdef1234567890abcdef.md",
-                "content": "# First Version\n",
-                "path": "Same Name 1234567890abcdef1234567890abcdef.md",
-            },
-            {
-                "name": "Same Name abcdef1234567890abcdef1234567890.md",
-                "content": "# Second Version\n",
-                "path": "Same Name abcdef1234567890abcdef1234567890.md",
-            },
+            _doc("Same Name", "1234567890abcdef1234567890abcdef", "# First Version\n"),
+            _doc("Same Name", "abcdef1234567890abcdef1234567890", "# Second Version\n"),
         ]
         package = NotionPackage(documents=notion_documents, assets=[], warnings=[])
 
-        # When: Generate package
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "duplicate_names.zip"
-            result_path = generator.generate_package(package, output_path)
-
-            # Then: Should handle duplicates without overwriting
-            with zipfile.ZipFile(result_path, "r") as zf:
-                files = zf.namelist()
-                # Both documents should exist (different IDs make them unique)
-                assert len([f for f in files if f.endswith(".md")]) == 2
+        # When/Then: Should handle duplicates without overwriting
+        with _build_zip(generator, package) as zf:
+            files = set(zf.namelist())
+            # Both documents should exist (different IDs make them unique)
+            assert sum(1 for f in files if f.endswith(".md")) == 2
 
     def test_preserve_directory_structure_exactly(self):
         """
@@ -274,40 +247,35 @@ class TestNotionPackageGenerator:
         generator = NotionPackageGenerator()
 
         # Given: Nested document structure
+        root_dir = "Root Page 1111111111111111111111111111111"
+        child_dir = f"{root_dir}/Child Page 2222222222222222222222222222222"
         notion_documents = [
-            {
-                "name": "Root Page 1111111111111111111111111111111.md",
-                "content": "# Root\n",
-                "path": "Root Page 1111111111111111111111111111111.md",
-            },
-            {
-                "name": "Child Page 2222222222222222222222222222222.md",
-                "content": "# Child\n",
-                "path": "Root Page 1111111111111111111111111111111/Child Page 2222222222222222222222222222222.md",
-            },
-            {
-                "name": "Grandchild 3333333333333333333333333333333.md",
-                "content": "# Grandchild\n",
-                "path": "Root Page 1111111111111111111111111111111/Child Page 2222222222222222222222222222222/Grandchild 3333333333333333333333333333333.md",
-            },
+            _doc("Root Page", "1111111111111111111111111111111", "# Root\n"),
+            _doc(
+                "Child Page",
+                "2222222222222222222222222222222",
+                "# Child\n",
+                path=f"{child_dir}.md",
+            ),
+            _doc(
+                "Grandchild",
+                "3333333333333333333333333333333",
+                "# Grandchild\n",
+                path=f"{child_dir}/Grandchild 3333333333333333333333333333333.md",
+            ),
         ]
         package = NotionPackage(documents=notion_documents, assets=[], warnings=[])
 
-        # When: Generate package
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "nested_structure.zip"
-            result_path = generator.generate_package(package, output_path)
-
-            # Then: Directory structure should be preserved exactly
-            with zipfile.ZipFile(result_path, "r") as zf:
-                files = zf.namelist()
-
-                assert "Root Page 1111111111111111111111111111111.md" in files
-                assert (
-                    "Root Page 1111111111111111111111111111111/Child Page 2222222222222222222222222222222.md"
-                    in files
-                )
-                assert (
-                    "Root Page 1111111111111111111111111111111/Child Page 2222222222222222222222222222222/Grandchild 3333333333333333333333333333333.md"
-                    in files
-                )
+        # When/Then: Directory structure should be preserved exactly
+        with _build_zip(generator, package) as zf:
+            files = set(zf.namelist())
+
+            assert "Root Page 1111111111111111111111111111111.md" in files
+            assert (
+                "Root Page 1111111111111111111111111111111/Child Page 2222222222222222222222222222222.md"
+                in files
+            )
+            assert (
+                "Root Page 1111111111111111111111111111111/Child Page 2222222222222222222222222222222/Grandchild 3333333333333333333333333333333.md"
+                in files
+            )
@@ -4,33 +4,54 @@ Test cases for OutlinePackageGenerator.
 These tests validate the creation of Outline-compatible ZIP packages.
 """
 
+import io
 import json
-import tempfile
+import os
 import zipfile
-from pathlib import Path
+import zlib
+from types import MappingProxyType
+
+import pytest
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 from src.domain.models import OutlinePackage
+from src.infrastructure.generators import outline_package_generator
 from src.infrastructure.generators.outline_package_generator import (
     OutlinePackageGenerator,
 )
 
 
+def _write_blob(path, data):
+    """Create or truncate path and write data with raw os-level calls."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="class")
+def test_image(tmp_path_factory):
+    """Fake PNG attachment written once and shared by a test class."""
+    image = tmp_path_factory.mktemp("attachments") / "test_image.png"
+    _write_blob(image, b"fake image data")
+    return image
+
+
 class TestOutlinePackageGenerator:
     """Test suite for OutlinePackageGenerator."""
 
     def setup_method(self):
         """Set up test fixtures."""
         self.generator = OutlinePackageGenerator()
-        self.temp_dir = Path(tempfile.mkdtemp())
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
 
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-
-    def test_empty_package_generation(self):
+    def test_empty_package_generation(self, tmp_path):
         """Test generation of empty package."""
         # Given: Empty OutlinePackage
         package = OutlinePackage(
@@ -55,7 +76,7 @@ class TestOutlinePackageGenerator:
             warnings=[],
         )
 
-        output_path = self.temp_dir / "empty.zip"
+        output_path = tmp_path / "empty.zip"
 
         # When: We generate the package
         result_path = self.generator.generate_package(package, output_path)
@@ -72,17 +93,73 @@ class TestOutlinePackageGenerator:
             assert "Empty Collection.json" in files
 
             # Check metadata content
-            metadata_content = json.loads(zf.read("metadata.json"))
+            metadata_content = _loads(zf.read("metadata.json"))
             assert metadata_content["exportVersion"] == 1
             assert metadata_content["createdById"] == "user-uuid"
 
             # Check collection content
-            collection_content = json.loads(zf.read("Empty Collection.json"))
+            collection_content = _loads(zf.read("Empty Collection.json"))
             assert collection_content["collection"]["name"] == "Empty Collection"
             assert collection_content["documents"] == {}
             assert collection_content["attachments"] == {}
 
-    def test_package_with_documents(self):
+    def test_empty_package_skips_structure_walk(self, tmp_path, monkeypatch):
+        """Test packages without documents or attachments skip ID extraction."""
+        # Given: Collections with structure but no documents or attachments
+        def fail(collection):
+            raise AssertionError("documentStructure should not be walked")
+
+        monkeypatch.setattr(self.generator, "_extract_document_ids", fail)
+        package = OutlinePackage(
+            metadata={"exportVersion": 1},
+            collections=[
+                {"id": "c1", "name": "One", "documentStructure": [{"id": "x"}]},
+                {"id": "c2", "name": "Two", "documentStructure": []},
+            ],
+            documents={},
+            attachments={},
+            warnings=[],
+        )
+
+        output_path = tmp_path / "empty_short_circuit.zip"
+
+        # When: We generate the package
+        self.generator.generate_package(package, output_path)
+
+        # Then: Each collection is written with empty maps
+        with zipfile.ZipFile(output_path, "r") as zf:
+            for name in ("One.json", "Two.json"):
+                collection = _loads(zf.read(name))
+                assert collection["documents"] == {}
+                assert collection["attachments"] == {}
+
+    def test_metadata_with_nested_values(self, tmp_path):
+        """Test metadata.json is written for nested (uncacheable) metadata too."""
+        # Given: Metadata holding a nested dict and a bool next to an int
+        metadata = {"exportVersion": 1, "flag": True, "extra": {"a": [1, 2]}}
+        package = OutlinePackage(
+            metadata=metadata, collections=[], documents={}, attachments={}, warnings=[]
+        )
+
+        output_path = tmp_path / "nested_metadata.zip"
+
+        # When: We generate the package twice with different value types
+        self.generator.generate_package(package, output_path)
+        with zipfile.ZipFile(output_path, "r") as zf:
+            nested = _loads(zf.read("metadata.json"))
+
+        flat = {"exportVersion": True}
+        self.generator.generate_package(
+            OutlinePackage(flat, [], {}, {}, []), output_path
+        )
+        with zipfile.ZipFile(output_path, "r") as zf:
+            cached = _loads(zf.read("metadata.json"))
+
+        # Then: Both round-trip exactly
+        assert nested == metadata
+        assert cached == {"exportVersion": True}
+
+    def test_package_with_documents(self, tmp_path):
         """Test generation of package with documents."""
         # Given: OutlinePackage with documents
         package = OutlinePackage(
@@ -128,7 +205,7 @@ class TestOutlinePackageGenerator:
             warnings=[],
         )
 
-        output_path = self.temp_dir / "with_docs.zip"
+        output_path = tmp_path / "with_docs.zip"
 
         # When: We generate the package
         result_path = self.generator.generate_package(package, output_path)
@@ -138,7 +215,7 @@ class TestOutlinePackageGenerator:
         assert output_path.exists()
 
         with zipfile.ZipFile(output_path, "r") as zf:
-            collection_content = json.loads(zf.read("Test Collection.json"))
+            collection_content = _loads(zf.read("Test Collection.json"))
 
             # Check documents are included
             assert "doc-uuid-1" in collection_content["documents"]
@@ -146,12 +223,9 @@ class TestOutlinePackageGenerator:
             assert document["title"] == "Document 1"
             assert document["data"]["type"] == "doc"
 
-    def test_package_with_attachments(self):
+    def test_package_with_attachments(self, tmp_path, test_image):
         """Test generation of package with attachments."""
-        # Given: Test attachment file
-        test_image = self.temp_dir / "test_image.png"
-        test_image.write_bytes(b"fake image data")
-
+        # Given: Test attachment file (from the class-scoped fixture)
         package = OutlinePackage(
             metadata={
                 "exportVersion": 1,
@@ -181,7 +255,7 @@ class TestOutlinePackageGenerator:
             warnings=[],
         )
 
-        output_path = self.temp_dir / "with_attachments.zip"
+        output_path = tmp_path / "with_attachments.zip"
 
         # When: We generate the package (provide attachments mapping)
         attachments_mapping = {"attachment-uuid": test_image}
@@ -203,7 +277,194 @@ class TestOutlinePackageGenerator:
             attachment_data = zf.read("uploads/test_image.png")
             assert attachment_data == b"fake image data"
 
-    def test_package_with_warnings(self):
+    def test_attachment_sizes_round_trip(self, tmp_path):
+        """Test empty and multi-slice attachments are copied byte for byte."""
+        # Given: An empty file and one larger than a single copy slice
+        payloads = {"empty.bin": b"", "large.bin": bytes(range(256)) * 4200}
+        attachments = {}
+        attachments_mapping = {}
+        for name, data in payloads.items():
+            _write_blob(tmp_path / name, data)
+            attachments[name] = {"id": name, "documentId": "doc", "name": name}
+            attachments_mapping[name] = tmp_path / name
+
+        package = OutlinePackage(
+            metadata={"exportVersion": 1},
+            collections=[],
+            documents={},
+            attachments=attachments,
+            warnings=[],
+        )
+
+        output_path = tmp_path / "sizes.zip"
+
+        # When: We generate the package
+        self.generator.generate_package(package, output_path, attachments_mapping)
+
+        # Then: Both attachments are stored intact
+        with zipfile.ZipFile(output_path, "r") as zf:
+            for name, data in payloads.items():
+                assert zf.read(f"uploads/{name}") == data
+
+    def test_json_deflated_and_attachments_stored(self, tmp_path, test_image):
+        """Test JSON and text attachments are deflated, binary ones stored."""
+        # Given: Attachments typed by contentType or only by file extension
+        attachments = {
+            "png": {"documentId": "doc", "name": "a.png", "contentType": "image/png"},
+            "pdf": {"documentId": "doc", "name": "b.pdf"},
+            "md": {"documentId": "doc", "name": "c.md", "contentType": "text/markdown"},
+            "svg": {"documentId": "doc", "name": "d.svg"},
+            "raw": {"documentId": "doc", "name": "e.unknownext"},
+        }
+        package = OutlinePackage(
+            metadata={"exportVersion": 1},
+            collections=[{"id": "c", "name": "Docs", "documentStructure": []}],
+            documents={},
+            attachments=attachments,
+            warnings=[],
+        )
+
+        output_path = tmp_path / "methods.zip"
+
+        # When: We generate the package
+        self.generator.generate_package(
+            package, output_path, dict.fromkeys(attachments, test_image)
+        )
+
+        # Then: Only JSON and text-like attachments go through deflate
+        with zipfile.ZipFile(output_path, "r") as zf:
+            methods = {info.filename: info.compress_type for info in zf.infolist()}
+        assert methods == {
+            "metadata.json": zipfile.ZIP_DEFLATED,
+            "Docs.json": zipfile.ZIP_DEFLATED,
+            "uploads/a.png": zipfile.ZIP_STORED,
+            "uploads/b.pdf": zipfile.ZIP_STORED,
+            "uploads/c.md": zipfile.ZIP_DEFLATED,
+            "uploads/d.svg": zipfile.ZIP_DEFLATED,
+            "uploads/e.unknownext": zipfile.ZIP_STORED,
+        }
+
+    def test_unmappable_attachment_streamed_in_chunks(self, tmp_path, monkeypatch):
+        """Test attachments are still copied when they can't be memory-mapped."""
+        # Given: An attachment larger than one copy chunk and mmap failing
+        data = bytes(range(256)) * 4200
+        _write_blob(tmp_path / "large.bin", data)
+        package = OutlinePackage(
+            metadata={"exportVersion": 1},
+            collections=[],
+            documents={},
+            attachments={"att": {"id": "att", "name": "large.bin"}},
+            warnings=[],
+        )
+
+        def unmappable(*args, **kwargs):
+            raise OSError("mmap not supported")
+
+        monkeypatch.setattr(outline_package_generator.mmap, "mmap", unmappable)
+
+        output_path = tmp_path / "unmappable.zip"
+
+        # When: We generate the package
+        self.generator.generate_package(
+            package, output_path, {"att": tmp_path / "large.bin"}
+        )
+
+        # Then: The attachment is copied byte for byte
+        with zipfile.ZipFile(output_path, "r") as zf:
+            assert zf.read("uploads/large.bin") == data
+
+    def test_json_entries_deflated_at_fastest_level(self, tmp_path):
+        """Test JSON entries are compressed with deflate level 1."""
+        # Given: A package with a compressible collection
+        package = OutlinePackage(
+            metadata={"exportVersion": 1, "note": "metadata " * 50},
+            collections=[
+                {"id": "c", "name": "Docs", "documentStructure": [{"id": "doc"}]}
+            ],
+            documents={"doc": {"id": "doc", "text": "lorem ipsum " * 500}},
+            attachments={},
+            warnings=[],
+        )
+
+        output_path = tmp_path / "level.zip"
+
+        # When: We generate the package
+        self.generator.generate_package(package, output_path)
+
+        # Then: Each entry is exactly as large as a level-1 raw deflate stream
+        with zipfile.ZipFile(output_path, "r") as zf:
+            for info in zf.infolist():
+                compressor = zlib.compressobj(1, zlib.DEFLATED, -15)
+                data = zf.read(info)
+                expected = compressor.compress(data) + compressor.flush()
+                assert info.compress_size == len(expected), info.filename
+
+    def test_entry_timestamps(self, tmp_path):
+        """Test every entry, including pre-1980 attachments, gets a fixed date."""
+        # Given: An attachment whose mtime is the Unix epoch (before 1980)
+        old_file = tmp_path / "old.png"
+        _write_blob(old_file, b"old")
+        os.utime(old_file, (0, 0))
+
+        package = OutlinePackage(
+            metadata={"exportVersion": 1},
+            collections=[],
+            documents={},
+            attachments={
+                "old": {"id": "old", "documentId": "doc", "name": "old.png"},
+                "gone": {"id": "gone", "documentId": "doc", "name": "gone.png"},
+            },
+            warnings=[],
+        )
+
+        output_path = tmp_path / "timestamps.zip"
+
+        # When: We generate the package (one attachment file doesn't exist)
+        self.generator.generate_package(
+            package, output_path, {"old": old_file, "gone": tmp_path / "gone.png"}
+        )
+
+        # Then: Every entry is dated 1980-01-01 and nothing raised
+        with zipfile.ZipFile(output_path, "r") as zf:
+            assert {info.date_time for info in zf.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+            assert zf.read("uploads/old.png") == b"old"
+            assert zf.read("uploads/gone.png").startswith(b"Missing file: ")
+
+    def test_identical_inputs_give_identical_packages(self, tmp_path, test_image):
+        """Test packages are byte-identical regardless of mtimes and key order."""
+
+        # Given: The same package content, with metadata keys in different orders
+        def build(metadata):
+            return OutlinePackage(
+                metadata=metadata,
+                collections=[{"id": "c", "name": "Docs", "documentStructure": []}],
+                documents={},
+                attachments={
+                    "att": {"id": "att", "documentId": "d", "name": "test_image.png"}
+                },
+                warnings=[],
+            )
+
+        attachments_mapping = {"att": test_image}
+
+        # When: We generate it twice, touching the attachment in between
+        first = self.generator.generate_package_bytes(
+            build({"version": "1", "exportVersion": 1}), attachments_mapping
+        )
+        os.utime(test_image, (1_700_000_000, 1_700_000_000))
+        second = self.generator.generate_package_bytes(
+            build({"exportVersion": 1, "version": "1"}), attachments_mapping
+        )
+
+        # Then: The archives are identical, with canonical metadata.json
+        assert first == second
+        with zipfile.ZipFile(io.BytesIO(first), "r") as zf:
+            assert zf.read("metadata.json") == (
+                b'{\n  "exportVersion": 1,\n  "version": "1"\n}'
+            )
+            assert {info.external_attr for info in zf.infolist()} == {0o600 << 16}
+
+    def test_package_with_warnings(self, tmp_path):
         """Test generation of package with warnings - warnings are handled by CLI, not ZIP."""
         # Given: OutlinePackage with warnings
         package = OutlinePackage(
@@ -227,7 +488,7 @@ class TestOutlinePackageGenerator:
             warnings=["Warning 1", "Warning 2", "Broken link found"],
         )
 
-        output_path = self.temp_dir / "with_warnings.zip"
+        output_path = tmp_path / "with_warnings.zip"
 
         # When: We generate the package
         result_path = self.generator.generate_package(package, output_path)
@@ -243,7 +504,31 @@ class TestOutlinePackageGenerator:
             assert "metadata.json" in files
             assert "Warning Collection.json" in files
 
-    def test_multiple_collections(self):
+    def test_package_warnings_never_read(self, tmp_path):
+        """Test packaging does not touch package.warnings at all."""
+
+        # Given: Warnings that fail on any access
+        class UntouchableWarnings(list):
+            def __iter__(self):
+                raise AssertionError("warnings were iterated")
+
+            def __len__(self):
+                raise AssertionError("warnings were measured")
+
+        package = OutlinePackage(
+            metadata={"exportVersion": 1},
+            collections=[{"id": "c", "name": "Docs", "documentStructure": []}],
+            documents={},
+            attachments={},
+            warnings=UntouchableWarnings(["Unresolved link"]),
+        )
+
+        # When/Then: Generation succeeds without reading them
+        output_path = self.generator.generate_package(package, tmp_path / "w.zip")
+        with zipfile.ZipFile(output_path, "r") as zf:
+            assert set(zf.namelist()) == {"metadata.json", "Docs.json"}
+
+    def test_multiple_collections(self, tmp_path):
         """Test generation of package with multiple collections."""
         # Given: OutlinePackage with multiple collections
         package = OutlinePackage(
@@ -273,7 +558,7 @@ class TestOutlinePackageGenerator:
             warnings=[],
         )
 
-        output_path = self.temp_dir / "multiple_collections.zip"
+        output_path = tmp_path / "multiple_collections.zip"
 
         # When: We generate the package
         result_path = self.generator.generate_package(package, output_path)
@@ -289,7 +574,7 @@ class TestOutlinePackageGenerator:
             assert "Collection Two.json" in files
             assert "metadata.json" in files
 
-    def test_multiple_collections_with_isolated_documents(self):
+    def test_multiple_collections_with_isolated_documents(self, tmp_path):
         """Test that each collection contains ONLY its own documents."""
         # Given: Multiple collections with different documents
         package = OutlinePackage(
@@ -370,7 +655,7 @@ class TestOutlinePackageGenerator:
             warnings=[],
         )
 
-        output_path = self.temp_dir / "isolated_docs.zip"
+        output_path = tmp_path / "isolated_docs.zip"
 
         # When: We generate the package
         result_path = self.generator.generate_package(package, output_path)
@@ -378,7 +663,7 @@ class TestOutlinePackageGenerator:
         # Then: Each collection should contain ONLY its own documents
         with zipfile.ZipFile(output_path, "r") as zf:
             # Check Collection One
-            collection_one = json.loads(zf.read("Collection One.json"))
+            collection_one = _loads(zf.read("Collection One.json"))
             assert "doc-1" in collection_one["documents"]
             assert "doc-2" in collection_one["documents"]
             assert "doc-3" not in collection_one["documents"]  # MUST NOT contain doc from collection 2
@@ -386,7 +671,7 @@ class TestOutlinePackageGenerator:
             assert len(collection_one["documents"]) == 2
 
             # Check Collection Two
-            collection_two = json.loads(zf.read("Collection Two.json"))
+            collection_two = _loads(zf.read("Collection Two.json"))
             assert "doc-3" in collection_two["documents"]
             assert "doc-1" not in collection_two["documents"]  # MUST NOT contain docs from collection 1
             assert "doc-2" not in collection_two["documents"]  # MUST NOT contain docs from collection 1
@@ -394,10 +679,10 @@ class TestOutlinePackageGenerator:
             assert len(collection_two["documents"]) == 1
 
             # Check Empty Collection
-            empty_collection = json.loads(zf.read("Empty Collection.json"))
+            empty_collection = _loads(zf.read("Empty Collection.json"))
             assert len(empty_collection["documents"]) == 0  # MUST be empty
 
-    def test_collection_document_filtering(self):
+    def test_collection_document_filtering(self, tmp_path):
         """Test that documents are filtered based on documentStructure."""
         # Given: Collection with specific documentStructure
         package = OutlinePackage(
@@ -421,20 +706,20 @@ class TestOutlinePackageGenerator:
             warnings=[],
         )
 
-        output_path = self.temp_dir / "filtered.zip"
+        output_path = tmp_path / "filtered.zip"
 
         # When: We generate the package
         self.generator.generate_package(package, output_path)
 
         # Then: Collection should contain only doc-a
         with zipfile.ZipFile(output_path, "r") as zf:
-            collection = json.loads(zf.read("Filtered Collection.json"))
+            collection = _loads(zf.read("Filtered Collection.json"))
             assert "doc-a" in collection["documents"]
             assert "doc-b" not in collection["documents"]
             assert "doc-c" not in collection["documents"]
             assert len(collection["documents"]) == 1
 
-    def test_collection_attachment_filtering(self):
+    def test_collection_attachment_filtering(self, tmp_path):
         """Test that attachments are filtered based on their associated documents."""
         # Given: Collections with documents and attachments
         package = OutlinePackage(
@@ -490,7 +775,7 @@ class TestOutlinePackageGenerator:
             warnings=[],
         )
 
-        output_path = self.temp_dir / "attachment_filtering.zip"
+        output_path = tmp_path / "attachment_filtering.zip"
 
         # When: We generate the package
         self.generator.generate_package(package, output_path)
@@ -498,7 +783,7 @@ class TestOutlinePackageGenerator:
         # Then: Each collection should contain only attachments for its documents
         with zipfile.ZipFile(output_path, "r") as zf:
             # Check Collection 1 - should have attachments for doc-1
-            collection_1 = json.loads(zf.read("Collection With Attachments.json"))
+            collection_1 = _loads(zf.read("Collection With Attachments.json"))
             assert "att-1" in collection_1["attachments"]
             assert "att-2" in collection_1["attachments"]
             assert "att-3" not in collection_1["attachments"]  # Belongs to doc-2
@@ -506,14 +791,213 @@ class TestOutlinePackageGenerator:
             assert len(collection_1["attachments"]) == 2
 
             # Check Collection 2 - should have attachments for doc-2
-            collection_2 = json.loads(zf.read("Collection Without Attachments.json"))
+            collection_2 = _loads(zf.read("Collection Without Attachments.json"))
             assert "att-3" in collection_2["attachments"]
             assert "att-1" not in collection_2["attachments"]  # Belongs to doc-1
             assert "att-2" not in collection_2["attachments"]  # Belongs to doc-1
             assert "att-orphan" not in collection_2["attachments"]  # Orphaned
             assert len(collection_2["attachments"]) == 1
 
-    def test_safe_filename_generation(self):
+    def test_shared_document_attachments_in_every_collection(self, tmp_path):
+        """Test a document listed in two collections brings its attachments to both."""
+        # Given: doc-shared appears in both collections' documentStructure
+        package = OutlinePackage(
+            metadata={"exportVersion": 1},
+            collections=[
+                {
+                    "id": "c1",
+                    "name": "First",
+                    "documentStructure": [{"id": "doc-shared"}],
+                },
+                {
+                    "id": "c2",
+                    "name": "Second",
+                    "documentStructure": [{"id": "doc-2"}, {"id": "doc-shared"}],
+                },
+            ],
+            documents={
+                "doc-shared": {"id": "doc-shared", "title": "Shared"},
+                "doc-2": {"id": "doc-2", "title": "Two"},
+            },
+            attachments={
+                "att-shared": {
+                    "id": "att-shared",
+                    "documentId": "doc-shared",
+                    "name": "shared.png",
+                },
+                "att-2": {"id": "att-2", "documentId": "doc-2", "name": "two.png"},
+                "att-none": {"id": "att-none", "name": "none.png"},
+            },
+            warnings=[],
+        )
+
+        output_path = tmp_path / "shared.zip"
+
+        # When: We generate the package
+        self.generator.generate_package(package, output_path)
+
+        # Then: Attachments follow their document into each collection
+        with zipfile.ZipFile(output_path, "r") as zf:
+            first = _loads(zf.read("First.json"))
+            second = _loads(zf.read("Second.json"))
+            assert set(first["documents"]) == {"doc-shared"}
+            assert set(first["attachments"]) == {"att-shared"}
+            assert set(second["documents"]) == {"doc-shared", "doc-2"}
+            assert set(second["attachments"]) == {"att-shared", "att-2"}
+
+    def test_shared_documents_encoded_once(self, tmp_path, monkeypatch):
+        """Test a document listed in several collections is serialized once."""
+        # Given: One document shared by three collections
+        shared = {"id": "doc-shared", "title": "Shared", "data": {"content": []}}
+        package = OutlinePackage(
+            metadata={"exportVersion": 1},
+            collections=[
+                {"id": name, "name": name, "documentStructure": [{"id": "doc-shared"}]}
+                for name in ("A", "B", "C")
+            ],
+            documents={"doc-shared": shared},
+            attachments={},
+            warnings=[],
+        )
+        encoded = []
+        dumps = outline_package_generator._dumps
+
+        def counting_dumps(data):
+            encoded.append(data)
+            return dumps(data)
+
+        monkeypatch.setattr(outline_package_generator, "_dumps", counting_dumps)
+
+        output_path = tmp_path / "shared_bodies.zip"
+
+        # When: We generate the package
+        self.generator.generate_package(package, output_path)
+
+        # Then: The body is encoded once and written identically everywhere
+        assert sum(1 for data in encoded if data is shared) == 1
+        with zipfile.ZipFile(output_path, "r") as zf:
+            for name in ("A", "B", "C"):
+                documents = _loads(zf.read(f"{name}.json"))["documents"]
+                assert documents == {"doc-shared": shared}
+
+    def test_doc_index_maps_documents_to_every_collection(self):
+        """Test the document index lists each collection containing a document."""
+        # Given: Two collections sharing one nested document
+        collections = [
+            {
+                "name": "A",
+                "documentStructure": [{"id": "a", "children": [{"id": "s"}]}],
+            },
+            {"name": "B", "documentStructure": [{"id": "s"}, {"id": "b"}]},
+            {"name": "Empty", "documentStructure": []},
+        ]
+
+        # When: We build the index
+        doc_index = self.generator._build_doc_index(collections)
+
+        # Then: Every document maps to its collection indices in order
+        assert doc_index == {"a": [0], "s": [0, 1], "b": [1]}
+
+    def test_in_memory_and_streamed_packages_match(self, tmp_path):
+        """Test small (in-memory) and large (streamed) packages have equal content."""
+        # Given: One package under the in-memory document limit and one over it
+        def build(count):
+            ids = [f"doc-{i}" for i in range(count)]
+            return OutlinePackage(
+                metadata={"exportVersion": 1},
+                collections=[
+                    {
+                        "id": "c",
+                        "name": "Docs",
+                        "documentStructure": [{"id": doc_id} for doc_id in ids],
+                    }
+                ],
+                documents={doc_id: {"id": doc_id} for doc_id in ids},
+                attachments={},
+                warnings=[],
+            )
+
+        limit = outline_package_generator._IN_MEMORY_MAX_DOCUMENTS
+
+        # When: We generate both
+        small = self.generator.generate_package(build(limit), tmp_path / "s.zip")
+        large = self.generator.generate_package(build(limit + 1), tmp_path / "l.zip")
+
+        # Then: Both archives hold every document
+        for path, count in ((small, limit), (large, limit + 1)):
+            with zipfile.ZipFile(path, "r") as zf:
+                assert len(_loads(zf.read("Docs.json"))["documents"]) == count
+
+    def test_generate_package_bytes_matches_file(self, tmp_path, test_image):
+        """Test the in-memory package has the same bytes as the written file."""
+        # Given: A package with a document and an attachment
+        package = OutlinePackage(
+            metadata={"exportVersion": 1, "version": "1", "createdAt": "now"},
+            collections=[
+                {"id": "c", "name": "Docs", "documentStructure": [{"id": "doc"}]}
+            ],
+            documents={"doc": {"id": "doc", "title": "Doc"}},
+            attachments={
+                "att": {"id": "att", "documentId": "doc", "name": "test_image.png"}
+            },
+            warnings=[],
+        )
+        attachments_mapping = {"att": test_image}
+
+        # When: We generate it both in memory and to a file
+        data = self.generator.generate_package_bytes(package, attachments_mapping)
+        output_path = self.generator.generate_package(
+            package, tmp_path / "bytes.zip", attachments_mapping
+        )
+
+        # Then: Both are the same valid package
+        assert data == output_path.read_bytes()
+        assert self.generator.validate_package(io.BytesIO(data))
+
+    def test_write_package_streams_to_non_seekable_output(self, test_image):
+        """Test packages can be streamed into a write-only, non-seekable sink."""
+
+        # Given: A sink that only supports write (like a pipe or socket)
+        class WriteOnlySink:
+            def __init__(self):
+                self.chunks = []
+
+            def write(self, data):
+                self.chunks.append(bytes(data))
+                return len(data)
+
+            def flush(self):
+                pass
+
+        package = OutlinePackage(
+            metadata={"exportVersion": 1, "version": "1", "createdAt": "now"},
+            collections=[
+                {"id": "c", "name": "Docs", "documentStructure": [{"id": "doc-1"}]}
+            ],
+            documents={"doc-1": {"id": "doc-1", "title": "One"}},
+            attachments={
+                "att-1": {
+                    "id": "att-1",
+                    "documentId": "doc-1",
+                    "name": "test_image.png",
+                    "key": "uploads/test_image.png",
+                }
+            },
+            warnings=[],
+        )
+        sink = WriteOnlySink()
+
+        # When: We stream the package into it
+        self.generator.write_package(package, sink, {"att-1": test_image})
+
+        # Then: The concatenated chunks form a valid, complete Outline package
+        data = io.BytesIO(b"".join(sink.chunks))
+        assert self.generator.validate_package(data)
+        with zipfile.ZipFile(data, "r") as zf:
+            assert zf.read("uploads/test_image.png") == b"fake image data"
+            assert _loads(zf.read("Docs.json"))["documents"]["doc-1"]["title"] == "One"
+
+    def test_safe_filename_generation(self, tmp_path):
         """Test that unsafe characters in collection names are handled."""
         # Given: OutlinePackage with unsafe collection name
         package = OutlinePackage(
@@ -537,7 +1021,7 @@ class TestOutlinePackageGenerator:
             warnings=[],
         )
 
-        output_path = self.temp_dir / "safe_names.zip"
+        output_path = tmp_path / "safe_names.zip"
 
         # When: We generate the package
         result_path = self.generator.generate_package(package, output_path)
@@ -560,10 +1044,26 @@ class TestOutlinePackageGenerator:
             assert "*" not in safe_name
             assert "?" not in safe_name
 
-    def test_output_directory_creation(self):
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("Plain Name", "Plain Name"),
+            ('a<b>c:d"e/f\\g|h?i*j', "a_b_c_d_e_f_g_h_i_j"),
+            ("tab\tand\x7fdel", "tabanddel"),
+            ("  Trailing dots... ", "Trailing dots"),
+            (" . ", "Untitled"),
+            ("x" * 250, "x" * 200),
+            ("Ends with NBSP\u00a0", "Ends with NBSP"),
+        ],
+    )
+    def test_sanitize_filename(self, name, expected):
+        """Test filename sanitizing replaces, drops and trims characters."""
+        assert self.generator._sanitize_filename(name) == expected
+
+    def test_output_directory_creation(self, tmp_path):
         """Test that output directory is created if it doesn't exist."""
         # Given: Output path in non-existent directory
-        non_existent_dir = self.temp_dir / "new_dir" / "nested"
+        non_existent_dir = tmp_path / "new_dir" / "nested"
         output_path = non_existent_dir / "test.zip"
 
         package = OutlinePackage(
@@ -582,11 +1082,109 @@ class TestOutlinePackageGenerator:
         assert output_path.exists()
         assert non_existent_dir.exists()
 
-    def validate_package(self, package_path: Path) -> bool:
+    def test_deeply_nested_document_ids_extracted_without_recursion(self):
+        """Test ID extraction handles nesting deeper than the recursion limit."""
+        # Given: A single chain of documents nested 5000 levels deep
+        node = {"id": "doc-4999", "children": []}
+        for depth in range(4998, -1, -1):
+            node = {"id": f"doc-{depth}", "children": [node]}
+        collection = {"name": "Deep", "documentStructure": [node]}
+
+        # When: We extract the document IDs
+        doc_ids = self.generator._extract_document_ids(collection)
+
+        # Then: Every level is found
+        assert len(doc_ids) == 5000
+        assert "doc-0" in doc_ids and "doc-4999" in doc_ids
+
+    def test_document_ids_yielded_breadth_first(self):
+        """Test IDs come out level by level, siblings in document order."""
+        # Given: Two top-level documents, each with nested children
+        structure = [
+            {"id": "a", "children": [{"id": "a1", "children": [{"id": "a1x"}]}]},
+            {"id": "b", "children": [{"id": "b1"}, {"id": "b2"}]},
+        ]
+
+        # When: We iterate the document IDs
+        doc_ids = list(self.generator._iter_document_ids(structure))
+
+        # Then: Parents precede children and sibling order is kept
+        assert doc_ids == ["a", "b", "a1", "b1", "b2", "a1x"]
+
+    def test_documents_accept_read_only_mapping(self, tmp_path):
+        """Test that documents may be any mapping, not only a dict."""
+        # Given: Documents supplied through a read-only mapping view
+        documents = MappingProxyType({"doc-1": {"id": "doc-1", "title": "One"}})
+        package = OutlinePackage(
+            metadata={"exportVersion": 1},
+            collections=[
+                {"id": "c", "name": "Mapped", "documentStructure": [{"id": "doc-1"}]}
+            ],
+            documents=documents,
+            attachments={},
+            warnings=[],
+        )
+
+        output_path = tmp_path / "mapped.zip"
+
+        # When: We generate the package
+        self.generator.generate_package(package, output_path)
+
+        # Then: The document is written to its collection
+        with zipfile.ZipFile(output_path, "r") as zf:
+            collection = _loads(zf.read("Mapped.json"))
+            assert collection["documents"] == {"doc-1": {"id": "doc-1", "title": "One"}}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_layout_matches_json_dumps(self, tmp_path, monkeypatch, use_orjson):
+        """Test metadata and collection JSON match json.dumps(indent=2) output."""
+        # Given: orjson either used (when installed) or unavailable
+        if not use_orjson:
+            monkeypatch.setattr(outline_package_generator, "orjson", None)
+        metadata = {"exportVersion": 1, "createdByEmail": "user@example.com"}
+        collection = {"id": "c", "name": "Layout", "documentStructure": [{"id": "d1"}]}
+        documents = {
+            "d1": {"id": "d1", "title": "One", "data": {"type": "doc", "content": []}}
+        }
+        attachments = {"a1": {"id": "a1", "documentId": "d1", "name": "x.png"}}
+        package = OutlinePackage(
+            metadata=metadata,
+            collections=[collection],
+            documents=documents,
+            attachments=attachments,
+            warnings=[],
+        )
+
+        output_path = tmp_path / "layout.zip"
+
+        # When: We generate the package
+        self.generator.generate_package(package, output_path)
+
+        # Then: JSON entries are byte-identical to json.dumps output
+        expected_collection = {
+            "collection": collection,
+            "documents": documents,
+            "attachments": attachments,
+        }
+        with zipfile.ZipFile(output_path, "r") as zf:
+            assert (
+                zf.read("metadata.json")
+                == json.dumps(metadata, indent=2, sort_keys=True).encode()
+            )
+            assert (
+                zf.read("Layout.json")
+                == json.dumps(expected_collection, indent=2).encode()
+            )
+
+    def test_validate_package(self, tmp_path):
         """Test the validate_package method."""
         # Given: Valid package
         package = OutlinePackage(
-            metadata={"exportVersion": 1},
+            metadata={
+                "exportVersion": 1,
+                "version": "0.78.0-0",
+                "createdAt": "2024-07-18T18:18:14.221Z",
+            },
             collections=[
                 {
                     "id": "test-id",
@@ -600,7 +1198,7 @@ class TestOutlinePackageGenerator:
             warnings=[],
         )
 
-        output_path = self.temp_dir / "validate_test.zip"
+        output_path = tmp_path / "validate_test.zip"
         self.generator.generate_package(package, output_path)
 
         # When: We validate the package
@@ -609,7 +1207,32 @@ class TestOutlinePackageGenerator:
         # Then: Should return True for valid package
         assert is_valid is True
 
-    def test_integration_nested_folders_with_documents(self):
+    def test_validate_package_rejects_malformed_json(self, tmp_path):
+        """Test validate_package returns False when a collection isn't valid JSON."""
+        # Given: Valid metadata but a truncated collection file
+        package_path = tmp_path / "malformed.zip"
+        with zipfile.ZipFile(package_path, "w") as zf:
+            zf.writestr(
+                "metadata.json",
+                '{"exportVersion": 1, "version": "1", "createdAt": "now"}',
+            )
+            zf.writestr("Broken.json", '{"collection": {')
+
+        # When/Then: Validation fails rather than raising
+        assert self.generator.validate_package(package_path) is False
+
+        # And: A central-directory-only check accepts the layout unread
+        assert self.generator.validate_package(package_path, check_contents=False)
+
+    def test_validate_package_rejects_missing_and_non_zip_files(self, tmp_path):
+        """Test validate_package returns False for absent or non-ZIP files."""
+        not_zip = tmp_path / "not.zip"
+        _write_blob(not_zip, b"This is not a ZIP file")
+
+        assert self.generator.validate_package(tmp_path / "missing.zip") is False
+        assert self.generator.validate_package(not_zip) is False
+
+    def test_integration_nested_folders_with_documents(self, tmp_path):
         """Integration test: Verify correct document distribution in nested folder structure."""
         # Given: Complex nested folder structure like real Obsidian vault
         package = OutlinePackage(
@@ -665,7 +1288,7 @@ class TestOutlinePackageGenerator:
             warnings=[],
         )
 
-        output_path = self.temp_dir / "integration_test.zip"
+        output_path = tmp_path / "integration_test.zip"
 
         # When: We generate the package
         self.generator.generate_package(package, output_path)
@@ -673,22 +1296,22 @@ class TestOutlinePackageGenerator:
         # Then: Verify complete isolation of documents and attachments
         with zipfile.ZipFile(output_path, "r") as zf:
             # Root collection
-            root = json.loads(zf.read("Root.json"))
+            root = _loads(zf.read("Root.json"))
             assert list(root["documents"].keys()) == ["root-doc"]
             assert list(root["attachments"].keys()) == ["att-root"]
 
             # Folder A
-            folder_a = json.loads(zf.read("Folder A.json"))
+            folder_a = _loads(zf.read("Folder A.json"))
             assert set(folder_a["documents"].keys()) == {"doc-a1", "doc-a2"}
             assert list(folder_a["attachments"].keys()) == ["att-a1"]
 
             # Subfolder
-            subfolder = json.loads(zf.read("Folder A_Subfolder.json"))
+            subfolder = _loads(zf.read("Folder A_Subfolder.json"))
             assert list(subfolder["documents"].keys()) == ["doc-sub"]
             assert list(subfolder["attachments"].keys()) == ["att-sub"]
 
             # Folder B
-            folder_b = json.loads(zf.read("Folder B.json"))
+            folder_b = _loads(zf.read("Folder B.json"))
             assert list(folder_b["documents"].keys()) == ["doc-b1"]
             assert list(folder_b["attachments"].keys()) == ["att-b1"]
 
@@ -706,7 +1329,7 @@ class TestOutlinePackageGenerator:
                         other_docs = set(other["documents"].keys())
                         assert collection_docs.isdisjoint(other_docs)
 
-    def test_nested_document_structure_extraction(self):
+    def test_nested_document_structure_extraction(self, tmp_path):
         """Test that nested document structures are properly extracted."""
         # Given: Collection with nested documentStructure
         package = OutlinePackage(
@@ -796,14 +1419,14 @@ class TestOutlinePackageGenerator:
             warnings=[],
         )
 
-        output_path = self.temp_dir / "nested_structure.zip"
+        output_path = tmp_path / "nested_structure.zip"
 
         # When: Generate package
         self.generator.generate_package(package, output_path)
 
         # Then: Verify nested documents are included in collection
         with zipfile.ZipFile(output_path, "r") as zf:
-            collection_data = json.loads(zf.read("Test Collection.json"))
+            collection_data = _loads(zf.read("Test Collection.json"))
 
             # All nested documents should be included
             collection_docs = collection_data["documents"]
@@ -5,6 +5,7 @@ These tests validate the complete folder hierarchy extraction and export pipelin
 with actual vault structures.
 """
 
+from collections import deque
 from pathlib import Path
 
 import pytest
@@ -14,6 +15,35 @@ from src.domain.vault_analyzer import FolderAnalyzer, VaultAnalyzer
 from src.infrastructure.file_system import FileSystemAdapter
 from src.infrastructure.parsers.wikilink_parser import WikiLinkParser
 
+# Folders known to exist in the real test vault
+_EXPECTED_FOLDERS = frozenset(
+    {
+        "_obsidian",  # root
+        "Chats",
+        "Efforts",
+        "_Teaching",
+        "exam assignments done",
+        "_Applications",
+        "DFF Green CDIs",
+        "_Concepts",
+        "_Daily Notes",
+        "_Dissemination",
+        "_Mess",
+        "_Papers",
+        "_People",
+        "_Research projects",
+        "DREAMS project",
+        "MEGAprojects",
+        "_Reviews and organizing",
+        "_Templates",
+        "_Writing",
+        "__files",
+        "mission digital wellbeing meeting notes 07",
+        "04",
+        "smart-chats",
+    }
+)
+
 
 class TestRealVaultFolderIntegration:
     """Integration tests using real Obsidian vault data."""
@@ -52,36 +82,13 @@ class TestRealVaultFolderIntegration:
         assert result.root_folder.name == "_obsidian"
         assert len(result.all_folders) >= 1  # At least root folder
 
-        # And: Should detect known subfolders
-        folder_names = {folder.name for folder in result.all_folders}
-        expected_folders = {
-            "_obsidian",  # root
-            "Chats",
-            "Efforts",
-            "_Teaching",
-            "exam assignments done",
-            "_Applications",
-            "DFF Green CDIs",
-            "_Concepts",
-            "_Daily Notes",
-            "_Dissemination",
-            "_Mess",
-            "_Papers",
-            "_People",
-            "_Research projects",
-            "DREAMS project",
-            "MEGAprojects",
-            "_Reviews and organizing",
-            "_Templates",
-            "_Writing",
-            "__files",
-            "mission digital wellbeing meeting notes 07",
-            "04",
-            "smart-chats",
+        # And: Should detect known subfolders; at least some of the expected
+        # folders should be present
+        detected_expected = {
+            folder.name
+            for folder in result.all_folders
+            if folder.name in _EXPECTED_FOLDERS
         }
-
-        # Should contain at least some of the expected folders
-        detected_expected = folder_names.intersection(expected_folders)
         assert len(detected_expected) >= 5, (
             f"Expected to detect major folders, only found: {detected_expected}"
         )
@@ -170,12 +177,13 @@ class TestRealVaultFolderIntegration:
         # When: We analyze with folder support
         result = vault_analyzer.scan_vault_with_folders(real_vault_path)
 
-        # Then: Files should be mapped to correct folders
-        for file_path, containing_folder in result.folder_mapping.items():
-            # File's parent should match folder's path
-            assert file_path.parent == containing_folder.path, (
-                f"File {file_path} mapped to wrong folder {containing_folder.path}, expected {file_path.parent}"
-            )
+        # Then: Each file's parent should match its folder's path
+        mismatches = {
+            file_path
+            for file_path, containing_folder in result.folder_mapping.items()
+            if file_path.parent != containing_folder.path
+        }
+        assert not mismatches, f"Files mapped to wrong folders: {mismatches}"
 
         # And: All markdown files should be mapped to some folder
         mapped_files = set(result.folder_mapping.keys())
@@ -195,23 +203,18 @@ class TestRealVaultFolderIntegration:
         # When: We analyze folder structure
         result = analyzer.analyze_folder_structure(real_vault_path)
 
-        # Then: Should handle empty folders gracefully
-        def check_folder_consistency(folder):
-            # Folder should have valid path
-            assert folder.path.exists()
+        # Then: Should handle empty folders gracefully. Folders come from
+        # the directory listing, so they need no exists() check
+        stack = deque([(result, 0)])
+        while stack:
+            folder, expected_level = stack.popleft()
 
-            # Level should be consistent with path depth relative to root
-            expected_level = len(folder.path.relative_to(real_vault_path).parts)
-            if folder.path == real_vault_path:
-                expected_level = 0
+            # Level should be one deeper than the parent's, starting at 0
             assert folder.level == expected_level
 
-            # Check children recursively
             for child in folder.child_folders:
                 assert child.parent_path == folder.path
-                check_folder_consistency(child)
-
-        check_folder_consistency(result)
+                stack.append((child, expected_level + 1))
 
     def test_real_vault_large_structure_performance(
         self, vault_analyzer, real_vault_path
@@ -9,8 +9,8 @@ CRITICAL: These tests use real implementations, not mocks, to ensure
 proper integration and catch configuration errors.
 """
 
-import tempfile
-from pathlib import Path
+import multiprocessing
+import zipfile
 
 import pytest
 
@@ -31,11 +31,85 @@ from src.infrastructure.parsers.block_reference_parser import BlockReferencePars
 from src.infrastructure.parsers.callout_parser import CalloutParser
 from src.infrastructure.parsers.wikilink_parser import WikiLinkParser
 
+_TEST_NOTE = b"# Test Note\n\nThis is a test note for integration testing."
+
+
+@pytest.fixture(scope="session")
+def minimal_vault(tmp_path_factory):
+    """
+    Minimal valid vault with a single note, built once and only read.
+
+    Tests that export it write their packages to their own tmp_path.
+    """
+    vault_path = tmp_path_factory.mktemp("vault") / "test_vault"
+
+    # Create .obsidian directory to make it a valid vault
+    (vault_path / ".obsidian").mkdir(parents=True)
+
+    # Create a simple markdown file
+    (vault_path / "test_note.md").write_bytes(_TEST_NOTE)
+    return vault_path
+
+
+@pytest.fixture(scope="module")
+def file_system():
+    """Real file system adapter shared by the module's tests."""
+    return FileSystemAdapter()
+
+
+@pytest.fixture(scope="module")
+def wikilink_parser():
+    """Real wikilink parser shared by the module's tests."""
+    return WikiLinkParser()
+
+
+@pytest.fixture(scope="module")
+def wikilink_resolver():
+    """Real wikilink resolver shared by the module's tests."""
+    return WikiLinkResolver()
+
+
+@pytest.fixture(scope="module")
+def callout_parser():
+    """Real callout parser shared by the module's tests."""
+    return CalloutParser()
+
+
+@pytest.fixture(scope="module")
+def block_reference_parser():
+    """Real block reference parser shared by the module's tests."""
+    return BlockReferenceParser()
+
+
+@pytest.fixture(scope="module")
+def content_transformer(
+    wikilink_parser, wikilink_resolver, callout_parser, block_reference_parser
+):
+    """Real content transformer built from the shared parsers."""
+    return ContentTransformer(
+        wikilink_parser, wikilink_resolver, callout_parser, block_reference_parser
+    )
+
+
+@pytest.fixture(scope="module")
+def use_case(file_system, wikilink_parser, content_transformer):
+    """NotionExportUseCase wired with real dependencies, built once."""
+    return NotionExportUseCase(
+        vault_analyzer=VaultAnalyzer(file_system, wikilink_parser),
+        vault_index_builder=VaultIndexBuilder(file_system),
+        content_transformer=content_transformer,
+        notion_document_generator=NotionDocumentGenerator(),
+        notion_package_generator=NotionPackageGenerator(),
+        file_system=file_system,
+    )
+
 
 class TestNotionExportIntegration:
     """Integration test suite for complete Notion export pipeline."""
 
-    def test_create_notion_export_use_case_with_real_dependencies(self):
+    def test_create_notion_export_use_case_with_real_dependencies(
+        self, file_system, wikilink_parser, content_transformer
+    ):
         """
         Test creating NotionExportUseCase with real dependencies.
 
@@ -44,16 +118,8 @@ class TestNotionExportIntegration:
         configured and can be instantiated together.
         """
         # Given: Real dependency implementations
-        file_system = FileSystemAdapter()
-        wikilink_parser = WikiLinkParser()
         vault_analyzer = VaultAnalyzer(file_system, wikilink_parser)
         vault_index_builder = VaultIndexBuilder(file_system)
-        wikilink_resolver = WikiLinkResolver()
-        callout_parser = CalloutParser()
-        block_reference_parser = BlockReferenceParser()
-        content_transformer = ContentTransformer(
-            wikilink_parser, wikilink_resolver, callout_parser, block_reference_parser
-        )
         notion_document_generator = NotionDocumentGenerator()
         notion_package_generator = NotionPackageGenerator()
 
@@ -70,113 +136,87 @@ class TestNotionExportIntegration:
         # Then: Should initialize successfully
         assert use_case is not None
 
-    def test_export_minimal_vault_end_to_end(self):
+    def test_export_minimal_vault_end_to_end(self, use_case, minimal_vault, tmp_path):
         """
         Test complete export pipeline with minimal real vault.
 
-        Creates a temporary vault with basic content and runs the complete
-        export pipeline to ensure all services integrate correctly.
+        Exports the shared minimal vault through the complete pipeline to
+        ensure all services integrate correctly.
         """
-        # Given: Real dependencies
-        file_system = FileSystemAdapter()
-        wikilink_parser = WikiLinkParser()
-        vault_analyzer = VaultAnalyzer(file_system, wikilink_parser)
-        wikilink_resolver = WikiLinkResolver()
-        callout_parser = CalloutParser()
-        block_reference_parser = BlockReferenceParser()
-        content_transformer = ContentTransformer(
-            wikilink_parser, wikilink_resolver, callout_parser, block_reference_parser
-        )
-        notion_document_generator = NotionDocumentGenerator()
-        notion_package_generator = NotionPackageGenerator()
-
-        vault_index_builder = VaultIndexBuilder(file_system)
-
-        use_case = NotionExportUseCase(
-            vault_analyzer=vault_analyzer,
-            vault_index_builder=vault_index_builder,
-            content_transformer=content_transformer,
-            notion_document_generator=notion_document_generator,
-            notion_package_generator=notion_package_generator,
-            file_system=file_system,
+        # Configure export
+        config = NotionExportConfig(
+            vault_path=minimal_vault,
+            output_path=tmp_path / "test_export.zip",
+            package_name="IntegrationTest",
         )
 
-        # Create minimal test vault
-        with tempfile.TemporaryDirectory() as temp_dir:
-            vault_path = Path(temp_dir) / "test_vault"
-            vault_path.mkdir()
-
-            # Create .obsidian directory to make it a valid vault
-            obsidian_dir = vault_path / ".obsidian"
-            obsidian_dir.mkdir()
+        # When: Run complete export pipeline
+        result = use_case.export(config)
 
-            # Create a simple markdown file
-            test_file = vault_path / "test_note.md"
-            test_file.write_text(
-                "# Test Note\n\nThis is a test note for integration testing."
-            )
-
-            # Configure export
-            output_path = Path(temp_dir) / "test_export.zip"
-            config = NotionExportConfig(
-                vault_path=vault_path,
-                output_path=output_path,
-                package_name="IntegrationTest",
-            )
-
-            # When: Run complete export pipeline
-            result = use_case.export(config)
-
-            # Then: Should complete without dependency errors
-            assert result is not None
-            # Note: We don't assert success=True here because content_transformer
-            # might have issues with our minimal test content, but the integration
-            # should work without dependency injection failures
+        # Then: Should complete without dependency errors
+        assert result is not None
+        # Note: We don't assert success=True here because content_transformer
+        # might have issues with our minimal test content, but the integration
+        # should work without dependency injection failures
 
-    def test_validate_only_mode_integration(self):
+    def test_validate_only_mode_integration(self, use_case, minimal_vault):
         """
         Test validate-only mode with real dependencies.
 
         Ensures validation mode works with actual service implementations.
         """
-        # Given: Real dependencies
-        file_system = FileSystemAdapter()
-        wikilink_parser = WikiLinkParser()
-        vault_analyzer = VaultAnalyzer(file_system, wikilink_parser)
-        wikilink_resolver = WikiLinkResolver()
-        callout_parser = CalloutParser()
-        block_reference_parser = BlockReferenceParser()
-        content_transformer = ContentTransformer(
-            wikilink_parser, wikilink_resolver, callout_parser, block_reference_parser
-        )
-        notion_document_generator = NotionDocumentGenerator()
-        notion_package_generator = NotionPackageGenerator()
+        # When: Run validation
+        result = use_case.validate(minimal_vault)
 
-        vault_index_builder = VaultIndexBuilder(file_system)
+        # Then: Should complete validation without dependency errors
+        assert result is not None
+        assert result.processing_time >= 0
 
-        use_case = NotionExportUseCase(
-            vault_analyzer=vault_analyzer,
-            vault_index_builder=vault_index_builder,
-            content_transformer=content_transformer,
-            notion_document_generator=notion_document_generator,
-            notion_package_generator=notion_package_generator,
-            file_system=file_system,
-        )
+    @pytest.mark.parametrize("start_method", [None, "spawn"])
+    def test_parallel_transform_matches_serial(self, use_case, tmp_path, start_method):
+        """
+        Test that transforming in a process pool gives the serial results.
 
-        # Create minimal test vault
-        with tempfile.TemporaryDirectory() as temp_dir:
-            vault_path = Path(temp_dir) / "test_vault"
-            vault_path.mkdir()
+        Under spawn every initializer argument is pickled, so the workers must
+        build their transformer from a picklable factory rather than receive
+        the live parsers.
+        """
+        mp_context = multiprocessing.get_context(start_method) if start_method else None
+
+        # Given: A vault with linked and broken notes
+        vault_path = tmp_path / "vault"
+        (vault_path / ".obsidian").mkdir(parents=True)
+        for i in range(6):
+            (vault_path / f"note{i}.md").write_text(
+                f"# Note {i}\n\nSee [[note{i + 1}]] and [[Missing {i}]].\n"
+            )
+
+        # When: Exporting with one and with two workers
+        results = [
+            use_case.export(
+                NotionExportConfig(
+                    vault_path=vault_path,
+                    output_path=tmp_path / f"export{workers}.zip",
+                    package_name="Parallel",
+                    workers=workers,
+                    mp_context=mp_context,
+                )
+            )
+            for workers in (1, 2)
+        ]
 
-            obsidian_dir = vault_path / ".obsidian"
-            obsidian_dir.mkdir()
+        # Then: Both runs transform the same files with the same warnings
+        serial, parallel = results
+        assert not parallel.errors
+        assert parallel.files_processed == serial.files_processed == 6
+        assert parallel.warnings == serial.warnings
 
-            # When: Run validation
-            result = use_case.validate(vault_path)
+        # And: The same pages are packaged (page IDs are random per run)
+        def page_titles(package_path):
+            with zipfile.ZipFile(package_path) as zf:
+                return [name.rsplit(" ", 1)[0] for name in zf.namelist()]
 
-            # Then: Should complete validation without dependency errors
-            assert result is not None
-            assert result.processing_time >= 0
+        assert page_titles(parallel.output_path) == page_titles(serial.output_path)
 
     def test_missing_dependency_raises_clear_error(self):
         """
@@ -5,48 +5,104 @@ Following TDD approach - these tests define the expected behavior
 for the Click-based command-line interface.
 """
 
-import tempfile
+from dataclasses import replace
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
-from click.testing import CliRunner
+import pytest
 
 from src.application.export_use_case import ExportResult
-from src.cli import cli, convert_command
+from src.cli import convert_command, run_convert
+
+# Bare results shared by the tests (the CLI only reads them); tests that need
+# their own output path or counts derive a copy with dataclasses.replace
+_SUCCESS_RESULT = ExportResult(success=True)
+_FAILED_RESULT = ExportResult(success=False)
+
+# Golden output of test_export_summary_formatting; {output} is the package path
+_SUMMARY_OUTPUT = """
+==================================================
+CONVERSION RESULTS
+==================================================
+✅ Conversion completed successfully!
+📦 Package created: {output}
+
+📊 Statistics:
+   Files processed: 10
+   Assets processed: 5
+   Processing time: 2.50s
+
+⚠️  3 warnings:
+   • Warning 1
+   • Warning 2
+   • Warning 3
+
+🔗 1 broken link detected:
+   • note1 → missing
+
+🎉 Next steps:
+   1. Open AppFlowy
+   2. Go to Settings → Import
+   3. Select the generated package: {output}
+   4. Follow AppFlowy's import wizard
+"""
+
+# Build and render the command tree during session setup, so whichever test
+# runs first does not pay Click's cold-start cost
+pytestmark = pytest.mark.usefixtures("cli_help", "convert_help")
+
+
+@pytest.fixture(scope="class")
+def vault_dir(tmp_path_factory):
+    """Empty vault directory shared by a test class (the use case is mocked)."""
+    return str(tmp_path_factory.mktemp("vault"))
+
+
+@pytest.fixture
+def mock_create_use_case(monkeypatch):
+    """Stand-in for the AppFlowy use case factory the CLI calls."""
+    factory = Mock()
+    monkeypatch.setattr("src.cli.create_export_use_case", factory)
+    return factory
+
+
+@pytest.fixture
+def output_path(tmp_path):
+    """Per-test package path, so tests never write to a shared location."""
+    return tmp_path / "export.zip"
 
 
 class TestCLI:
     """Test suite for CLI interface following TDD methodology."""
 
-    def test_cli_help(self):
+    def test_cli_help(self, cli_help):
         """
         Test CLI help output.
 
         Should display help information and available commands.
         """
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
+        result = cli_help
 
         assert result.exit_code == 0
         assert "convert" in result.output.lower()
         assert "appflowy" in result.output.lower()
 
-    def test_convert_command_help(self):
+    def test_convert_command_help(self, convert_help):
         """
         Test convert command help output.
 
         Should display convert command options and usage.
         """
-        runner = CliRunner()
-        result = runner.invoke(convert_command, ["--help"])
+        result = convert_help
 
         assert result.exit_code == 0
         assert "vault_path" in result.output.lower()
         assert "output" in result.output.lower()
         assert "verbose" in result.output.lower()
 
-    @patch("src.cli.create_export_use_case")
-    def test_convert_command_success(self, mock_create_use_case):
+    def test_convert_command_success(
+        self, mock_create_use_case, runner, vault_dir, output_path
+    ):
         """
         Test successful vault conversion via CLI.
 
@@ -57,33 +113,30 @@ class TestCLI:
         mock_create_use_case.return_value = mock_use_case
 
         # Mock successful export result
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "export.zip"
-            mock_result = ExportResult(
-                success=True,
-                output_path=output_path,
-                files_processed=5,
-                assets_processed=2,
-                warnings=["Sample warning"],
-                errors=[],
-                processing_time=1.5,
-            )
-            mock_use_case.export_vault.return_value = mock_result
-
-            runner = CliRunner()
-            with tempfile.TemporaryDirectory() as vault_dir:
-                result = runner.invoke(
-                    convert_command,
-                    [vault_dir, "--output", str(output_path), "--name", "Test Export"],
-                )
-
-                assert result.exit_code == 0
-                assert "success" in result.output.lower()
-                assert "files processed: 5" in result.output.lower()
-                assert "1 warning" in result.output.lower()
-
-    @patch("src.cli.create_export_use_case")
-    def test_convert_command_with_errors(self, mock_create_use_case):
+        mock_result = ExportResult(
+            success=True,
+            output_path=output_path,
+            files_processed=5,
+            assets_processed=2,
+            warnings=["Sample warning"],
+            errors=[],
+            processing_time=1.5,
+        )
+        mock_use_case.export_vault.return_value = mock_result
+
+        result = runner.invoke(
+            convert_command,
+            [vault_dir, "--output", str(output_path), "--name", "Test Export"],
+        )
+
+        assert result.exit_code == 0
+        assert "success" in result.output.lower()
+        assert "files processed: 5" in result.output.lower()
+        assert "1 warning" in result.output.lower()
+
+    def test_convert_command_with_errors(
+        self, mock_create_use_case, runner, vault_dir, output_path
+    ):
         """
         Test conversion with errors via CLI.
 
@@ -103,18 +156,17 @@ class TestCLI:
         )
         mock_use_case.export_vault.return_value = mock_result
 
-        runner = CliRunner()
-        with tempfile.TemporaryDirectory() as vault_dir:
-            result = runner.invoke(
-                convert_command, [vault_dir, "--output", "/tmp/export.zip"]
-            )
+        result = runner.invoke(
+            convert_command, [vault_dir, "--output", str(output_path)]
+        )
 
-            assert result.exit_code != 0
-            assert "failed" in result.output.lower() or "error" in result.output.lower()
-            assert "2 errors" in result.output.lower()
+        assert result.exit_code != 0
+        assert "failed" in result.output.lower() or "error" in result.output.lower()
+        assert "2 errors" in result.output.lower()
 
-    @patch("src.cli.create_export_use_case")
-    def test_convert_command_verbose_mode(self, mock_create_use_case):
+    def test_convert_command_verbose_mode(
+        self, mock_create_use_case, runner, vault_dir, output_path
+    ):
         """
         Test conversion with verbose output.
 
@@ -125,28 +177,28 @@ class TestCLI:
         mock_create_use_case.return_value = mock_use_case
 
         # Mock successful export with progress reporting
-        mock_result = ExportResult(
-            success=True,
-            output_path=Path("/tmp/export.zip"),
+        mock_result = replace(
+            _SUCCESS_RESULT,
+            output_path=output_path,
             files_processed=2,
             processing_time=1.0,
         )
         mock_use_case.export_vault.return_value = mock_result
 
-        runner = CliRunner()
-        with tempfile.TemporaryDirectory() as vault_dir:
-            result = runner.invoke(
-                convert_command, [vault_dir, "--output", "/tmp/export.zip", "--verbose"]
-            )
-
-            assert result.exit_code == 0
-            # Should capture progress messages from the progress callback
-            mock_use_case.export_vault.assert_called_once()
-            call_args = mock_use_case.export_vault.call_args[0][0]
-            assert call_args.progress_callback is not None
+        result = runner.invoke(
+            convert_command,
+            [vault_dir, "--output", str(output_path), "--verbose"],
+        )
 
-    @patch("src.cli.create_export_use_case")
-    def test_convert_command_validate_only(self, mock_create_use_case):
+        assert result.exit_code == 0
+        # Should capture progress messages from the progress callback
+        mock_use_case.export_vault.assert_called_once()
+        call_args = mock_use_case.export_vault.call_args[0][0]
+        assert call_args.progress_callback is not None
+
+    def test_convert_command_validate_only(
+        self, mock_create_use_case, runner, vault_dir
+    ):
         """
         Test validation-only mode via CLI.
 
@@ -166,66 +218,54 @@ class TestCLI:
         )
         mock_use_case.export_vault.return_value = mock_result
 
-        runner = CliRunner()
-        with tempfile.TemporaryDirectory() as vault_dir:
-            result = runner.invoke(convert_command, [vault_dir, "--validate-only"])
+        result = runner.invoke(convert_command, [vault_dir, "--validate-only"])
 
-            assert result.exit_code == 0
-            assert "validation" in result.output.lower()
-            assert "2 broken links" in result.output.lower()
-            assert "package" not in result.output.lower()  # No package created
+        assert result.exit_code == 0
+        assert "validation" in result.output.lower()
+        assert "2 broken links" in result.output.lower()
+        assert "package" not in result.output.lower()  # No package created
 
-    def test_convert_command_missing_vault(self):
+    def test_convert_command_with_custom_output_name(
+        self, mock_create_use_case, vault_dir, output_path
+    ):
         """
-        Test conversion with non-existent vault path.
+        Test conversion with custom package name.
 
-        Should display error message and return error exit code.
+        Should pass package name to export use case.
         """
-        runner = CliRunner()
-        result = runner.invoke(
-            convert_command, ["/nonexistent/vault/path", "--output", "/tmp/export.zip"]
-        )
+        # Mock the export use case
+        mock_use_case = Mock()
+        mock_create_use_case.return_value = mock_use_case
 
-        assert result.exit_code != 0
-        assert (
-            "not found" in result.output.lower()
-            or "does not exist" in result.output.lower()
+        mock_result = replace(_SUCCESS_RESULT, output_path=output_path)
+        mock_use_case.export_vault.return_value = mock_result
+
+        exit_code = run_convert(
+            Path(vault_dir), output=output_path, name="My Custom Export"
         )
 
-    @patch("src.cli.create_export_use_case")
-    def test_convert_command_with_custom_output_name(self, mock_create_use_case):
+        assert exit_code == 0
+        mock_use_case.export_vault.assert_called_once()
+        call_config = mock_use_case.export_vault.call_args[0][0]
+        assert call_config.package_name == "My Custom Export"
+
+    def test_run_convert_returns_exit_code(self, mock_create_use_case, vault_dir):
         """
-        Test conversion with custom package name.
+        Test the in-process entry point reports failures as exit codes.
 
-        Should pass package name to export use case.
+        Should return 1 instead of raising for a missing vault or failed export.
         """
-        # Mock the export use case
         mock_use_case = Mock()
         mock_create_use_case.return_value = mock_use_case
+        mock_use_case.export_vault.return_value = _FAILED_RESULT
 
-        mock_result = ExportResult(success=True, output_path=Path("/tmp/custom.zip"))
-        mock_use_case.export_vault.return_value = mock_result
+        assert run_convert(Path("/nonexistent/vault/path")) == 1
+        mock_create_use_case.assert_not_called()
+        assert run_convert(Path(vault_dir), validate_only=True) == 1
 
-        runner = CliRunner()
-        with tempfile.TemporaryDirectory() as vault_dir:
-            result = runner.invoke(
-                convert_command,
-                [
-                    vault_dir,
-                    "--output",
-                    "/tmp/custom.zip",
-                    "--name",
-                    "My Custom Export",
-                ],
-            )
-
-            assert result.exit_code == 0
-            mock_use_case.export_vault.assert_called_once()
-            call_config = mock_use_case.export_vault.call_args[0][0]
-            assert call_config.package_name == "My Custom Export"
-
-    @patch("src.cli.create_export_use_case")
-    def test_progress_reporting_callback(self, mock_create_use_case):
+    def test_progress_reporting_callback(
+        self, mock_create_use_case, runner, vault_dir, output_path
+    ):
         """
         Test progress reporting callback functionality.
 
@@ -241,67 +281,74 @@ class TestCLI:
                 config.progress_callback("Scanning vault structure...")
                 config.progress_callback("Processing file1.md...")
                 config.progress_callback("Creating package...")
-            return ExportResult(success=True, output_path=Path("/tmp/export.zip"))
+            return replace(_SUCCESS_RESULT, output_path=output_path)
 
         mock_use_case.export_vault.side_effect = mock_export_vault
 
-        runner = CliRunner()
-        with tempfile.TemporaryDirectory() as vault_dir:
-            result = runner.invoke(
-                convert_command, [vault_dir, "--output", "/tmp/export.zip", "--verbose"]
-            )
+        result = runner.invoke(
+            convert_command,
+            [vault_dir, "--output", str(output_path), "--verbose"],
+        )
 
-            assert result.exit_code == 0
-            assert "Scanning vault" in result.output
-            assert "Processing file1.md" in result.output
-            assert "Creating package" in result.output
+        assert result.exit_code == 0
+        assert "Scanning vault" in result.output
+        assert "Processing file1.md" in result.output
+        assert "Creating package" in result.output
 
-    def test_convert_command_output_path_validation(self):
+    def test_convert_command_output_path_validation(
+        self, mock_create_use_case, runner, vault_dir, tmp_path
+    ):
         """
         Test output path validation.
 
         Should validate output directory exists and create if needed.
         """
-        runner = CliRunner()
-        with tempfile.TemporaryDirectory() as vault_dir:
-            # Test with non-existent output directory
-            with tempfile.TemporaryDirectory() as temp_dir:
-                output_path = Path(temp_dir) / "subdir" / "export.zip"
-
-                # Should work - directory should be created
-                with patch("src.cli.create_export_use_case") as mock_create:
-                    mock_use_case = Mock()
-                    mock_create.return_value = mock_use_case
-                    mock_use_case.export_vault.return_value = ExportResult(
-                        success=True, output_path=output_path
-                    )
-
-                    result = runner.invoke(
-                        convert_command, [vault_dir, "--output", str(output_path)]
-                    )
-
-                    # Should succeed
-                    assert result.exit_code == 0
-
-    def test_error_handling_and_formatting(self):
+        # Test with non-existent output directory
+        output_path = tmp_path / "subdir" / "export.zip"
+
+        # Should work - directory should be created
+        mock_use_case = Mock()
+        mock_create_use_case.return_value = mock_use_case
+        mock_use_case.export_vault.return_value = replace(
+            _SUCCESS_RESULT, output_path=output_path
+        )
+
+        result = runner.invoke(
+            convert_command, [vault_dir, "--output", str(output_path)]
+        )
+
+        # Should succeed, with the missing directory created by the CLI
+        assert result.exit_code == 0
+        assert output_path.parent.is_dir()
+
+    @pytest.mark.parametrize(
+        "argv,must_contain",
+        [
+            ([], "missing"),
+            (["/nonexistent/vault/path", "--output", "export.zip"], "does not exist"),
+            (["--output", ".", "."], "is a directory"),
+        ],
+        ids=["no-arguments", "missing-vault", "output-is-directory"],
+    )
+    def test_invalid_arguments_are_reported(self, runner, argv, must_contain):
         """
-        Test error message formatting and handling.
+        Test error message formatting for bad or incomplete arguments.
 
-        Should display user-friendly error messages.
+        Should exit non-zero with a user-friendly message naming the problem.
         """
-        runner = CliRunner()
+        result = runner.invoke(convert_command, argv)
 
-        # Test with invalid arguments
-        result = runner.invoke(convert_command, [])
         assert result.exit_code != 0
-        assert "missing" in result.output.lower() or "required" in result.output.lower()
+        assert must_contain in result.output.lower()
 
-    @patch("src.cli.create_export_use_case")
-    def test_export_summary_formatting(self, mock_create_use_case):
+    def test_export_summary_formatting(
+        self, mock_create_use_case, runner, vault_dir, output_path
+    ):
         """
         Test export summary formatting.
 
-        Should display comprehensive export statistics.
+        Should display comprehensive export statistics, exactly as laid out in
+        the golden output.
         """
         # Mock the export use case
         mock_use_case = Mock()
@@ -310,7 +357,7 @@ class TestCLI:
         # Mock detailed export result
         mock_result = ExportResult(
             success=True,
-            output_path=Path("/tmp/detailed-export.zip"),
+            output_path=output_path,
             files_processed=10,
             assets_processed=5,
             warnings=["Warning 1", "Warning 2", "Warning 3"],
@@ -321,15 +368,10 @@ class TestCLI:
         )
         mock_use_case.export_vault.return_value = mock_result
 
-        runner = CliRunner()
-        with tempfile.TemporaryDirectory() as vault_dir:
-            result = runner.invoke(
-                convert_command, [vault_dir, "--output", "/tmp/detailed-export.zip"]
-            )
-
-            assert result.exit_code == 0
-            assert "Files processed: 10" in result.output
-            assert "Assets processed: 5" in result.output
-            assert "3 warnings" in result.output
-            assert "2.5" in result.output  # Processing time
-            assert "1 broken link" in result.output
+        result = runner.invoke(
+            convert_command,
+            [vault_dir, "--output", str(output_path)],
+        )
+
+        assert result.exit_code == 0
+        assert result.output == _SUMMARY_OUTPUT.format(output=output_path)
@@ -5,12 +5,45 @@ Tests the command-line interface integration with the nested documents feature.
 """
 
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
-from click.testing import CliRunner
 
-from src.cli import cli
+from src.application.outline_export_use_case import OutlineExportResult
+from src.cli import cli, convert_command, run_convert
+
+# Build and render the command tree during session setup, so whichever test
+# runs first does not pay Click's cold-start cost
+pytestmark = pytest.mark.usefixtures("cli_help", "convert_help")
+
+
+def _ok_result(**overrides):
+    """Build a successful Outline export result, overriding any field."""
+    fields = {
+        "success": True,
+        "output_path": Path("test.zip"),
+        "files_processed": 1,
+        "assets_processed": 0,
+        "processing_time": 1.0,
+    }
+    fields.update(overrides)
+    return OutlineExportResult(**fields)
+
+
+@pytest.fixture
+def mock_create_use_case(monkeypatch):
+    """Stand-in for the Outline use case factory the CLI calls."""
+    factory = Mock()
+    monkeypatch.setattr("src.cli.create_outline_export_use_case", factory)
+    return factory
+
+
+@pytest.fixture
+def mock_create_appflowy_use_case(monkeypatch):
+    """Stand-in for the AppFlowy use case factory the CLI calls."""
+    factory = Mock()
+    monkeypatch.setattr("src.cli.create_export_use_case", factory)
+    return factory
 
 
 class TestCLINestedDocuments:
@@ -24,176 +57,68 @@ class TestCLINestedDocuments:
         (vault_path / "test.md").write_text("# Test")
         return vault_path
 
-    def test_nested_documents_flag_available(self):
+    def test_nested_documents_flag_available(self, convert_help):
         """Test that --nested-documents flag is available in CLI."""
-        # Given: CLI runner
-        runner = CliRunner()
-
         # When: We check the help for convert command
-        result = runner.invoke(cli, ["convert", "--help"])
+        result = convert_help
 
         # Then: Should show nested-documents option
         assert result.exit_code == 0
         assert "--nested-documents" in result.output
         assert "For Outline export" in result.output
 
-    @patch("src.cli.create_outline_export_use_case")
+    @pytest.mark.parametrize(
+        "options,expected_nested",
+        [({"nested_documents": True}, True), ({}, False)],
+        ids=["flag", "default"],
+    )
     def test_nested_documents_passed_to_config(
-        self, mock_create_use_case, mock_vault_path
+        self,
+        mock_create_appflowy_use_case,
+        mock_create_use_case,
+        mock_vault_path,
+        options,
+        expected_nested,
     ):
-        """Test that --nested-documents flag is passed to OutlineExportConfig."""
-        # Given: Mock use case
+        """Test that nested_documents reaches OutlineExportConfig (default False)."""
+        # Given: Mock use case returning a successful export result
         mock_use_case = Mock()
+        mock_use_case.export.return_value = _ok_result()
         mock_create_use_case.return_value = mock_use_case
 
-        # Mock successful export result
-        mock_result = Mock()
-        mock_result.success = True
-        mock_result.output_path = Path("test.zip")
-        mock_result.files_processed = 1
-        mock_result.assets_processed = 0
-        mock_result.processing_time = 1.0
-        mock_result.warnings = []
-        mock_result.errors = []
-        mock_use_case.export.return_value = mock_result
-
-        runner = CliRunner()
-
-        # When: We run convert with nested-documents flag
-        result = runner.invoke(
-            cli,
-            [
-                "convert",
-                str(mock_vault_path),
-                "--format",
-                "outline",
-                "--nested-documents",
-            ],
-        )
-
-        # Then: Should call export with nested_documents=True
-        assert result.exit_code == 0
-        mock_use_case.export.assert_called_once()
-
-        # Extract the config argument
-        config = mock_use_case.export.call_args[0][0]
-        assert config.nested_documents is True
-
-    @patch("src.cli.create_outline_export_use_case")
-    def test_nested_documents_default_false(
-        self, mock_create_use_case, mock_vault_path
-    ):
-        """Test that nested_documents defaults to False when flag not provided."""
-        # Given: Mock use case
-        mock_use_case = Mock()
-        mock_create_use_case.return_value = mock_use_case
-
-        # Mock successful export result
-        mock_result = Mock()
-        mock_result.success = True
-        mock_result.output_path = Path("test.zip")
-        mock_result.files_processed = 1
-        mock_result.assets_processed = 0
-        mock_result.processing_time = 1.0
-        mock_result.warnings = []
-        mock_result.errors = []
-        mock_use_case.export.return_value = mock_result
-
-        runner = CliRunner()
+        # When: We run an Outline conversion with or without nested documents
+        exit_code = run_convert(mock_vault_path, format="outline", **options)
 
-        # When: We run convert without nested-documents flag
-        result = runner.invoke(
-            cli,
-            [
-                "convert",
-                str(mock_vault_path),
-                "--format",
-                "outline",
-            ],
-        )
-
-        # Then: Should call export with nested_documents=False
-        assert result.exit_code == 0
+        # Then: Export is called once with the matching nested_documents value
+        assert exit_code == 0
         mock_use_case.export.assert_called_once()
-
-        # Extract the config argument
         config = mock_use_case.export.call_args[0][0]
-        assert config.nested_documents is False
+        assert config.nested_documents is expected_nested
 
-    @patch("src.cli.create_outline_export_use_case")
-    @patch("src.cli.create_export_use_case")
-    def test_nested_documents_only_affects_outline_format(
-        self, mock_create_appflowy_use_case, mock_create_outline_use_case, mock_vault_path
-    ):
-        """Test that --nested-documents flag only affects outline format exports."""
-        # Given: Mock outline use case
-        mock_outline_use_case = Mock()
-        mock_create_outline_use_case.return_value = mock_outline_use_case
-
-        # Mock successful export result
-        mock_result = Mock()
-        mock_result.success = True
-        mock_result.output_path = Path("test.zip")
-        mock_result.files_processed = 1
-        mock_result.assets_processed = 0
-        mock_result.processing_time = 1.0
-        mock_result.warnings = []
-        mock_result.errors = []
-        mock_outline_use_case.export.return_value = mock_result
-
-        runner = CliRunner()
-
-        # When: We run convert with nested-documents for outline format
-        result = runner.invoke(
-            cli,
-            [
-                "convert",
-                str(mock_vault_path),
-                "--format",
-                "outline",
-                "--nested-documents",
-            ],
-        )
+        # And: The flag only concerns the Outline format
+        mock_create_appflowy_use_case.assert_not_called()
 
-        # Then: Should succeed (flag is handled by outline format)
-        if result.exit_code != 0:
-            print("CLI output:", result.output)
-        assert result.exit_code == 0
-
-    def test_nested_documents_in_help_examples(self):
+    def test_nested_documents_in_help_examples(self, convert_help):
         """Test that help includes example of nested-documents usage."""
-        # Given: CLI runner
-        runner = CliRunner()
-
         # When: We check the help for convert command
-        result = runner.invoke(cli, ["convert", "--help"])
+        result = convert_help
 
         # Then: Should show example with nested-documents
         assert result.exit_code == 0
         assert "--nested-documents" in result.output
 
-    @patch("src.cli.create_outline_export_use_case")
     def test_nested_documents_with_validation_only(
-        self, mock_create_use_case, mock_vault_path
+        self, mock_create_use_case, runner, mock_vault_path
     ):
         """Test that --nested-documents works with --validate-only."""
         # Given: Mock use case
         mock_use_case = Mock()
         mock_create_use_case.return_value = mock_use_case
 
-        # Mock successful validation result
-        mock_result = Mock()
-        mock_result.success = True
-        mock_result.output_path = None  # No output for validation-only
-        mock_result.files_processed = 1
-        mock_result.assets_processed = 0
-        mock_result.processing_time = 0.5
-        mock_result.warnings = []
-        mock_result.errors = []
+        # Successful validation result
+        mock_result = _ok_result(output_path=None, processing_time=0.5)
         mock_use_case.export.return_value = mock_result
 
-        runner = CliRunner()
-
         # When: We run convert with both flags
         result = runner.invoke(
             cli,
@@ -218,22 +143,12 @@ class TestCLINestedDocuments:
 
     def test_nested_documents_flag_is_boolean(self):
         """Test that nested-documents is a boolean flag (not requiring value)."""
-        # This test ensures the CLI accepts --nested-documents without a value
-        runner = CliRunner()
+        # Given: Arguments where --nested-documents is the last token
+        args = ["/nonexistent/path", "--format", "outline", "--nested-documents"]
 
-        # The flag should be recognized even if we can't run the full command
-        # (due to missing vault path). We just check it's parsed correctly.
-        result = runner.invoke(
-            cli,
-            [
-                "convert",
-                "/nonexistent/path",  # This will fail, but flag parsing happens first
-                "--format",
-                "outline",
-                "--nested-documents",
-            ],
-        )
+        # When: Click only parses them (resilient parsing skips validation)
+        ctx = convert_command.make_context("convert", args, resilient_parsing=True)
 
-        # Should fail due to path not existing, not due to flag parsing
-        # If flag parsing failed, we'd get a different error message
-        assert "does not exist" in result.output or result.exit_code != 0
+        # Then: The flag is set without consuming a value
+        assert ctx.params["nested_documents"] is True
+        assert ctx.params["format"] == "outline"